@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Compare how long `stograde record` takes to grade a class with each --engine
+
+Builds a class of fake students in a temporary directory, each with a small C++ homework,
+then records it with the process pool and with the thread pool.
+The caches that a run would keep (results, timings and the host probe) are kept in the temporary directory, too,
+so that the fake students never end up in the user's cache.
+
+    python3 bin/benchmark-engines.py --students 60 --workers 8 --repeat 3
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stograde.process_file import result_cache  # noqa: E402
+from stograde.specs import host_capabilities  # noqa: E402
+from stograde.specs.file_options import FileOptions  # noqa: E402
+from stograde.specs.spec import Spec  # noqa: E402
+from stograde.specs.spec_file import SpecFile  # noqa: E402
+from stograde.student.sync_strategy import SyncStrategy  # noqa: E402
+from stograde.toolkit import student_timings  # noqa: E402
+from stograde.toolkit.engine import Engine  # noqa: E402
+from stograde.toolkit.process_students import process_students  # noqa: E402
+
+PROGRAM = '''#include <iostream>
+using namespace std;
+
+int main() {{
+    for (int i = 0; i < {count}; i++) {{
+        cout << "line " << i << endl;
+    }}
+    return 0;
+}}
+'''
+
+SPEC = Spec('hw1', 'hw1', architecture=None,
+            files=[SpecFile('main.cpp', ['g++ --std=c++11 $@ -o $@.exec'], ['$@.exec'], FileOptions()),
+                   SpecFile('notes.txt', [], [], FileOptions())])
+
+
+def git(*args: str, cwd: str):
+    subprocess.run(['git', *args], cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+
+
+def use_temporary_caches(base_dir: str):
+    cache_dir = os.path.join(base_dir, 'cache')
+    result_cache.RESULTS_DIR = os.path.join(cache_dir, 'results')
+    student_timings.TIMINGS_PATH = os.path.join(cache_dir, 'timings.json')
+    host_capabilities.PROBE_PATH = os.path.join(cache_dir, 'host.json')
+
+
+def make_class(base_dir: str, students: int):
+    for index in range(students):
+        student_dir = os.path.join(base_dir, 'students', 'student{}'.format(index))
+        os.makedirs(os.path.join(student_dir, 'hw1'))
+        with open(os.path.join(student_dir, 'hw1', 'main.cpp'), 'w') as outfile:
+            # Each student's program is a little different, so nothing can be shared between them
+            outfile.write(PROGRAM.format(count=100 + index))
+        with open(os.path.join(student_dir, 'hw1', 'notes.txt'), 'w') as outfile:
+            outfile.write('notes from student {}\n'.format(index))
+
+        git('init', '--quiet', cwd=student_dir)
+        git('add', '.', cwd=student_dir)
+        git('-c', 'user.email=student@example.com', '-c', 'user.name=Student',
+            'commit', '--quiet', '-m', 'hw1', cwd=student_dir)
+
+
+def record_class(base_dir: str, students: int, workers: int, engine: Engine) -> float:
+    start = time.perf_counter()
+    process_students(specs=[SPEC],
+                     students=['student{}'.format(index) for index in range(students)],
+                     analyze=True,
+                     base_dir=base_dir,
+                     clean=False,
+                     date='',
+                     engine=engine,
+                     interact=False,
+                     no_progress_bar=True,
+                     record=True,
+                     skip_branch_check=False,
+                     skip_repo_update=True,
+                     skip_result_cache=True,
+                     skip_web_compile=False,
+                     stogit_url='',
+                     sync_strategy=SyncStrategy.PULL,
+                     sync_workers=1,
+                     workers=workers,
+                     work_dir=os.path.join(base_dir, 'students'))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='stograde-benchmark-') as base_dir:
+        use_temporary_caches(base_dir)
+        make_class(base_dir, args.students)
+
+        print('{} students, {} workers, best of {}'.format(args.students, args.workers, args.repeat))
+        for engine in Engine:
+            best = min(record_class(base_dir, args.students, args.workers, engine) for _ in range(args.repeat))
+            print('{:>8}: {:.2f}s ({:.1f} ms per student)'.format(engine.name.lower(), best,
+                                                                  best / args.students * 1000))
+
+
+if __name__ == '__main__':
+    main()
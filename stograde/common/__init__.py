@@ -1,9 +1,11 @@
+from .atomic_write import atomic_write
 from .cat import cat
 from .chdir import chdir
 from .get_modification_time import get_assignment_first_submit_time, get_modification_time
 from .dirsize import dirsize
 from .find_unmerged_branches_in_cwd import find_unmerged_branches_in_cwd
 from .flatten import flatten
+from .history_index import build_history_index, load_history_index
 from .parse_commit_msg_for_assignments import parse_commit_msg_for_assignments
 from .pipe import pipe
 from .run import run
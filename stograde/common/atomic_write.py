@@ -0,0 +1,23 @@
+import os
+import threading
+from typing import Union
+
+
+def atomic_write(path: str, data: Union[str, bytes], mode: str = 'w'):
+    """Write `data` to `path` in one step, so that a concurrent reader never sees half a file
+
+    The data is written to a temporary file that then replaces `path`. The temporary file is named
+    for this process and thread, so that concurrent writers never share one. Raises OSError on failure.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = '{}.{}.{}.tmp'.format(path, os.getpid(), threading.get_ident())
+    try:
+        with open(temp_path, mode, encoding=None if 'b' in mode else 'utf-8') as outfile:
+            outfile.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,81 @@
+"""Read and decode the output of commands"""
+
+import copy
+import io
+import os
+import threading
+from typing import List, Union
+
+# How much output beyond a capture limit to keep, so that cutting off a partial UTF-8 character
+# still leaves more than the limit, and callers can tell that the output was truncated
+CAPTURE_MARGIN = 4
+
+
+class BoundedCapture:
+    """Read a stream to the end, keeping only the start of it"""
+
+    def __init__(self, limit: int, stop_on_limit: bool):
+        self.limit = limit
+        self.stop_on_limit = stop_on_limit
+        self.chunks: List[bytes] = []
+        self.kept = 0
+        self.total = 0  # Including what wasn't kept
+        self.exceeded = False
+        self.done = threading.Event()  # Set at the end of the stream, or once the limit is exceeded if stopping
+
+    def read(self, stream: io.RawIOBase):
+        try:
+            while True:
+                chunk = stream.read(65536)
+                if not chunk:
+                    break
+
+                self.total += len(chunk)
+                room = self.limit + CAPTURE_MARGIN - self.kept
+                if room > 0:
+                    self.chunks.append(chunk[:room])
+                    self.kept += min(len(chunk), room)
+
+                if self.kept > self.limit:
+                    self.exceeded = True
+                    if self.stop_on_limit:
+                        break
+        finally:
+            self.done.set()
+
+    def output(self) -> bytes:
+        return b''.join(self.chunks)
+
+
+def write_input(stream: io.RawIOBase, input_data: bytes):
+    try:
+        stream.write(input_data)
+        stream.close()
+    except (BrokenPipeError, ValueError):
+        # The command exited (or was killed) without reading all of its input
+        pass
+
+
+def decode_output(output: Union[bytes, str], truncated: bool = False) -> str:
+    """Decode a command's output as UTF-8, falling back to CP437 if that fails
+
+    If the output was `truncated`, a character that was cut in half at the end is dropped.
+    """
+    try:
+        if not isinstance(output, str):
+            output = str(output, 'utf-8')
+    except UnicodeDecodeError as err:
+        if truncated and err.reason == 'unexpected end of data':
+            output = str(output[:err.start], 'utf-8', 'replace')
+        else:
+            output = str(output, 'cp437')
+
+    return output
+
+
+# This is to catch glibc errors, because it prints to /dev/tty
+# instead of stderr. See https://stackoverflow.com/a/27797579
+def copy_env():
+    env = copy.copy(os.environ)
+    env["LIBC_FATAL_STDERR_"] = "1"
+    return env
@@ -1,12 +1,58 @@
-from typing import List
+import os
+from typing import Dict, List
 
+from .repo_cache import load_repo_cache
 from .run import run
+from .run_status import RunStatus
 
+# The answers computed by this process, by repository and ref fingerprint
+_unmerged_branches: Dict[str, List[str]] = {}
 
-# TODO: This is a bit slow. Look for a faster way to check.
-def find_unmerged_branches_in_cwd() -> List[str]:
-    """Check for unmerged branches in the current repository"""
-    _, unmerged_branches, _ = run(['git', 'branch', '-a', '--no-merged', 'master'])
-    return [s.strip()
-            for s in unmerged_branches.split('\n')
-            if s.strip() and 'not a git repository' not in s]
+
+def find_unmerged_branches_in_cwd(cwd: str = '.') -> List[str]:
+    """Check for unmerged branches in the repository at `cwd`
+
+    The answer is remembered until the repository's refs change
+    """
+    cache = load_repo_cache(cwd)
+    memo_key = '{}\0{}'.format(os.path.abspath(cwd), cache.fingerprint) if cache is not None else ''
+
+    if memo_key in _unmerged_branches:
+        return list(_unmerged_branches[memo_key])
+
+    if cache is not None:
+        cached_branches = cache.get('unmerged_branches')
+        if cached_branches is not None:
+            _unmerged_branches[memo_key] = cached_branches
+            return list(cached_branches)
+
+    branches = list_unmerged_branches(cwd)
+
+    if cache is not None:
+        cache.set('unmerged_branches', branches)
+        _unmerged_branches[memo_key] = branches
+
+    return list(branches)
+
+
+def list_unmerged_branches(cwd: str = '.') -> List[str]:
+    """List every local and remote branch that master doesn't contain,
+    named the way that `git branch -a` names them"""
+    # A single ref walk answers whether every branch is merged, instead of one `merge-base` per branch
+    status, refs, _ = run(['git', 'for-each-ref', '--no-merged=master', '--format=%(refname)%00%(symref)',
+                           'refs/heads', 'refs/remotes'], cwd=cwd)
+    if status is not RunStatus.SUCCESS:
+        return []
+
+    branches = []
+    for line in refs.splitlines():
+        ref, _, symref = line.partition('\0')
+        if not ref or symref:
+            # Skip symbolic refs like origin/HEAD, which `git branch` shows as an alias
+            continue
+        if ref.startswith('refs/heads/'):
+            branches.append(ref[len('refs/heads/'):])
+        else:
+            branches.append(ref[len('refs/'):])
+
+    return branches
@@ -1,41 +1,44 @@
 import os
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
+from .history_index import build_history_index
 from .modification_time import ModificationTime
-from .run import run
 
 if TYPE_CHECKING:
+    from .history_index import HistoryIndex
     from ..specs.spec import Spec
 
 
 def get_modification_time(file_name: str,
                           cwd: str,
-                          modification: 'ModificationTime' = ModificationTime.LATEST) -> Tuple[str, str]:
-    """Get the modification time for a file, either first or latest, based on the modification argument"""
+                          modification: 'ModificationTime' = ModificationTime.LATEST,
+                          history: Optional['HistoryIndex'] = None) -> Tuple[str, str]:
+    """Get the modification time for a file, either first or latest, based on the modification argument
 
-    if not os.path.exists(os.path.join(cwd, file_name)):
+    Pass a `history` index to avoid walking the repository's history again
+    """
+    file_path = os.path.join(cwd, file_name)
+
+    if not os.path.exists(file_path):
         return '', ''
 
-    # We can't use -n 1 here because that runs before --reverse
-    # which would make this useless for finding the first date
-    command = ['git', 'log', '--pretty=format:%ad']
-    command_file = ['--', os.path.join(cwd, file_name)]
-    if modification is ModificationTime.FIRST:
-        command += ['--reverse']
+    if history is None:
+        history = build_history_index(cwd)
 
-    _, date, _ = run(command + command_file)
-    _, iso_date, _ = run(command + ['--date=iso8601'] + command_file)
-    return date.splitlines()[0], iso_date.splitlines()[0]
+    return history.lookup(file_path, modification)
 
 
-def get_assignment_first_submit_time(spec: 'Spec', cwd: str) -> str:
+def get_assignment_first_submit_time(spec: 'Spec', cwd: str, history: Optional['HistoryIndex'] = None) -> str:
     """Get the first submission time for an assignment"""
 
+    if history is None:
+        history = build_history_index(cwd)
+
     dates = {}
 
     for file in spec.files:
-        # Run a git log on each file with earliest commits listed first
-        date, iso_date = get_modification_time(file.file_name, cwd, ModificationTime.FIRST)
+        # Look up the earliest commit of each file
+        date, iso_date = get_modification_time(file.file_name, cwd, ModificationTime.FIRST, history)
 
         if date and iso_date:
             dates[date] = iso_date
@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+import os
+from typing import Dict, Tuple
+
+from .modification_time import ModificationTime
+from .repo_cache import load_repo_cache
+from .run import run
+from .run_status import RunStatus
+
+# Each commit starts with \x01, followed by "date\0iso_date" and then the
+# NUL-separated list of files it touched
+LOG_FORMAT = '--pretty=format:%x01%ad%x00%ai'
+
+
+@dataclass
+class FileHistory:
+    """The (date, iso_date) pairs of the first and latest commits to touch a file"""
+    first: Tuple[str, str]
+    latest: Tuple[str, str]
+
+
+@dataclass
+class HistoryIndex:
+    """Commit dates for every file in a repository, built from a single `git log`"""
+    root: str  # Directory that the file paths are relative to
+    files: Dict[str, FileHistory] = field(default_factory=dict)
+
+    def lookup(self, file_path: str, modification: ModificationTime = ModificationTime.LATEST) -> Tuple[str, str]:
+        """Get the (date, iso_date) pair for a file, or a pair of empty strings if it was never committed"""
+        key = os.path.relpath(os.path.abspath(file_path), self.root)
+        history = self.files.get(key)
+
+        if history is None:
+            return '', ''
+        elif modification is ModificationTime.FIRST:
+            return history.first
+        else:
+            return history.latest
+
+
+def build_history_index(cwd: str) -> HistoryIndex:
+    """Walk the history of the repository at `cwd` once, recording when each file below it was committed"""
+    index = HistoryIndex(root=os.path.abspath(cwd))
+
+    status, log, _ = run(['git', 'log', '--relative', '--name-only', '--no-renames', '-z', LOG_FORMAT], cwd=cwd)
+
+    if status is not RunStatus.SUCCESS:
+        return index
+
+    # git log lists the newest commits first, so the last commit we see for a file is its first
+    for commit in log.split('\x01'):
+        if not commit:
+            continue
+
+        date, _, rest = commit.partition('\0')
+        iso_date, _, names = rest.partition('\n')
+        dates = (date, iso_date.rstrip('\0'))
+
+        for name in names.split('\0'):
+            if not name:
+                continue
+            if name in index.files:
+                index.files[name].first = dates
+            else:
+                index.files[name] = FileHistory(first=dates, latest=dates)
+
+    return index
+
+
+def load_history_index(repo: str) -> HistoryIndex:
+    """Get the history index of the repository at `repo`,
+    reusing the one from a previous run if its refs haven't moved since"""
+    cache = load_repo_cache(repo)
+
+    if cache is not None:
+        cached_files = cache.get('history')
+        if cached_files is not None:
+            return HistoryIndex(root=os.path.abspath(repo),
+                                files={name: FileHistory(first=(first[0], first[1]), latest=(latest[0], latest[1]))
+                                       for name, (first, latest) in cached_files.items()})
+
+    index = build_history_index(repo)
+
+    if cache is not None:
+        cache.set('history', {name: (history.first, history.latest) for name, history in index.files.items()})
+
+    return index
@@ -1,18 +1,23 @@
-from glob import glob
+from glob import escape, glob
+import os
 import shlex
 
 from .flatten import flatten
 from .run import run
 
 
-def expand_chunk(command_chunk):
-    """Take a chunk of a command and expand it, like a shell"""
-    if '*' in command_chunk:
+def expand_chunk(command_chunk, cwd='.'):
+    """Take a chunk of a command and expand it, like a shell running in `cwd`"""
+    if '*' not in command_chunk:
+        return [command_chunk]
+    if os.path.isabs(command_chunk):
         return glob(command_chunk)
-    return [command_chunk]
 
+    prefix = os.path.join(cwd, '')
+    return [match[len(prefix):] for match in glob(escape(prefix) + command_chunk)]
 
-def process_chunk(command):
+
+def process_chunk(command, cwd='.'):
     """Takes one piece of a pipeline and formats it for run_command"""
     # decode('unicode_escape') de-escapes the backslash-escaped strings.
     # like, it turns the \n from "echo Hawken \n 26" into an actual newline,
@@ -24,16 +29,23 @@ def process_chunk(command):
     # but figured it wasn't a bad thing to use.
     cmds = shlex.split(cmd)
 
-    return list(flatten([expand_chunk(c) for c in cmds]))
+    return list(flatten([expand_chunk(c, cwd) for c in cmds]))
+
+
+def split_pipeline(cmd_string, cwd='.'):
+    """Split a pipeline into its commands, expanding each one like a shell running in `cwd`"""
+    return [process_chunk(cmd, cwd) for cmd in cmd_string.split(' | ')]
 
 
-def pipe(cmd_string):
+def pipe(cmd_string, cwd='.'):
+    """Run every command of a pipeline but the last in `cwd`,
+    and return the last one along with the input for it"""
     cmds = cmd_string.split(' | ')
 
     input_for_cmd = None
     for cmd in cmds[:-1]:
-        _, input_for_cmd, _ = run(process_chunk(cmd), input_data=input_for_cmd)
+        _, input_for_cmd, _ = run(process_chunk(cmd, cwd), cwd=cwd, input_data=input_for_cmd)
         input_for_cmd = input_for_cmd.encode('utf-8')
 
-    final_cmd = process_chunk(cmds[-1])
+    final_cmd = process_chunk(cmds[-1], cwd)
     return final_cmd, input_for_cmd
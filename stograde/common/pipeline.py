@@ -0,0 +1,159 @@
+"""Run the stages of a pipeline (`a | b | c`) at the same time, connected with OS pipes, like a shell does"""
+
+from dataclasses import dataclass, field
+import subprocess
+import threading
+import time
+from typing import List, Optional
+
+from .capture import BoundedCapture, copy_env, decode_output, write_input
+from .process_group import stop_group, track_group
+from .resource_limits import exceeded_limit, ResourceLimits
+from .resource_usage import ResourceUsage, usage_from_rusage, wait_for_usage
+from .run_status import RunStatus
+
+
+@dataclass
+class StageResult:
+    """How one command of a pipeline exited"""
+    command: List[str]
+    returncode: Optional[int] = None  # None if the command couldn't be started
+    status: RunStatus = RunStatus.SUCCESS
+    usage: Optional[ResourceUsage] = None  # None if the command couldn't be started
+
+
+@dataclass
+class PipelineResult:
+    """The output of a pipeline's last command, and how each of the commands exited"""
+    status: RunStatus  # The last command's status, unless the whole pipeline was stopped
+    output: str
+    stages: List[StageResult] = field(default_factory=list)
+    usage: Optional[ResourceUsage] = None  # None if the pipeline couldn't be started
+
+
+def run_pipeline(stages: List[List[str]],
+                 *,
+                 cwd: Optional[str] = None,
+                 input_data: Optional[bytes] = None,
+                 timeout: Optional[float] = None,
+                 capture_limit: int,
+                 kill_on_limit: bool = False,
+                 limits: Optional[ResourceLimits] = None) -> PipelineResult:
+    """Run every command of a pipeline at once, feeding `input_data` to the first one
+
+    The `timeout` and `capture_limit` apply to the pipeline as a whole, and the `limits` to each command in it.
+    Each command's output, including what it prints to stderr, goes to the next one.
+    Only about `capture_limit` bytes of the last command's output are kept,
+    and every command is stopped if it prints more and `kill_on_limit` is set.
+    Each command runs in its own process group, so that stopping it stops anything that it started, too.
+    """
+    results = [StageResult(command=command) for command in stages]
+    procs: List[subprocess.Popen] = []
+    start = time.monotonic()
+
+    try:
+        for index, command in enumerate(stages):
+            stdin = procs[-1].stdout if procs else (subprocess.PIPE if input_data is not None else None)
+            procs.append(subprocess.Popen(limits.wrap(command, cwd=cwd) if limits else command,
+                                          stdin=stdin,
+                                          stdout=subprocess.PIPE,
+                                          stderr=subprocess.STDOUT,
+                                          cwd=cwd,
+                                          env=copy_env(),
+                                          start_new_session=True,
+                                          bufsize=0))
+            track_group(procs[-1])
+            if index > 0:
+                # Only the next command should hold the read end, so that the writer gets SIGPIPE if it exits early
+                procs[-2].stdout.close()
+    except (FileNotFoundError, PermissionError, ProcessLookupError) as err:
+        status = {FileNotFoundError: RunStatus.FILE_NOT_FOUND,
+                  PermissionError: RunStatus.PERMISSION_DENIED,
+                  ProcessLookupError: RunStatus.PROCESS_LOOKUP_ERROR}[type(err)]
+        results[len(procs)].status = status
+        stop(procs)
+        wait_all(procs, results, start, threading.Event())
+        record_exits(procs, results, limits, '')
+        for proc in procs:
+            for stream in [proc.stdin, proc.stdout]:
+                if stream is not None:
+                    stream.close()
+        return PipelineResult(status=status, output=str(err), stages=results)
+
+    capture = BoundedCapture(capture_limit, stop_on_limit=kill_on_limit)
+    threads = [threading.Thread(target=capture.read, args=(procs[-1].stdout,), daemon=True)]
+    if input_data is not None:
+        threads.append(threading.Thread(target=write_input, args=(procs[0].stdin, input_data), daemon=True))
+    # Something that a command started in the background can keep the output open after the commands exit,
+    # so stop waiting for the output once they do
+    exited = threading.Event()
+    threads.append(threading.Thread(target=wait_all, args=(procs, results, start, exited, capture.done), daemon=True))
+    for thread in threads:
+        thread.start()
+
+    status = RunStatus.SUCCESS
+    if not capture.done.wait(timeout):
+        status = RunStatus.TIMEOUT_EXPIRED
+        stop(procs)
+    elif capture.exceeded and kill_on_limit:
+        status = RunStatus.OUTPUT_LIMIT_EXCEEDED
+        stop(procs)
+
+    exited.wait()
+    threads[0].join(timeout=1)
+    if threads[0].is_alive():
+        # The commands are done, so whatever is still holding on to the output is a straggler
+        stop(procs)
+    for thread in threads:
+        thread.join(timeout=1)
+    if not threads[0].is_alive():
+        procs[-1].stdout.close()
+
+    output = decode_output(capture.output(), truncated=capture.exceeded)
+    record_exits(procs, results, limits, output)
+
+    if status is RunStatus.TIMEOUT_EXPIRED and not output:
+        output = str(subprocess.TimeoutExpired(stages[-1], timeout))
+    elif status is RunStatus.SUCCESS:
+        status = results[-1].status
+        if status is not RunStatus.SUCCESS and not output:
+            output = str(subprocess.CalledProcessError(procs[-1].returncode, stages[-1]))
+
+    usage = ResourceUsage(wall_time=max(result.usage.wall_time for result in results),
+                          cpu_time=sum(result.usage.cpu_time for result in results),
+                          max_rss=max(result.usage.max_rss for result in results),
+                          output_bytes=capture.total)
+
+    return PipelineResult(status=status, output=output, stages=results, usage=usage)
+
+
+def wait_all(procs: List[subprocess.Popen], results: List[StageResult], start: float, *events: threading.Event):
+    """Wait for every command to exit, recording what it used, then set the `events`
+
+    This is the only place that waits for the commands, because the kernel only reports their usage once.
+    """
+    for proc, result in zip(procs, results):
+        proc.returncode, rusage = wait_for_usage(proc.pid)
+        result.usage = usage_from_rusage(rusage, wall_time=time.monotonic() - start)
+    for event in events:
+        event.set()
+
+
+def stop(procs: List[subprocess.Popen]):
+    """Kill every command in the pipeline, along with anything that they started"""
+    for proc in procs:
+        stop_group(proc)
+
+
+def record_exits(procs: List[subprocess.Popen],
+                 results: List[StageResult],
+                 limits: Optional[ResourceLimits],
+                 output: str):
+    for proc, result in zip(procs, results):
+        result.returncode = proc.returncode
+        if result.returncode == 0:
+            result.status = RunStatus.SUCCESS
+        elif exceeded_limit(limits, result.returncode, output, result.usage.cpu_time if result.usage else None):
+            result.status = RunStatus.RESOURCE_LIMIT_EXCEEDED
+        else:
+            result.status = RunStatus.CALLED_PROCESS_ERROR
@@ -0,0 +1,57 @@
+"""Stop everything that a command started, not just the command itself
+
+Each command is started in a new session, which makes it the leader of its own process group.
+Anything that it forks stays in that group (unless it starts a session of its own),
+so killing the group stops the whole tree, even after the command itself has exited.
+"""
+
+import logging
+import os
+import signal
+import subprocess
+import threading
+from typing import Set
+
+# The process groups started by each thread, so that a worker only reaps the groups of the student it is grading
+_started = threading.local()
+
+
+def started_groups() -> Set[int]:
+    if not hasattr(_started, 'groups'):
+        _started.groups = set()
+    return _started.groups
+
+
+def track_group(proc: subprocess.Popen):
+    """Remember the group of a command that was started with `start_new_session=True`"""
+    started_groups().add(proc.pid)
+
+
+def kill_group(pgid: int) -> bool:
+    """Kill every process in a group, returning whether there was anything left to kill"""
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def stop_group(proc: subprocess.Popen):
+    """Kill a command and everything that it started
+
+    The command leads its group until it has been waited for, so there is nothing to kill if the group is gone.
+    """
+    kill_group(proc.pid)
+
+
+def reap_groups():
+    """Kill anything left over from the commands that this thread has started
+
+    A group's id isn't reused until the group is empty and the kernel's process ids have wrapped around,
+    which takes far longer than grading one student.
+    """
+    groups = started_groups()
+    for pgid in sorted(groups):
+        if kill_group(pgid):
+            logging.debug('Killed processes left over in group {}'.format(pgid))
+    groups.clear()
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from .atomic_write import atomic_write
+
+CACHE_FILE = 'stograde-cache.json'
+CACHE_VERSION = 1
+
+
+@dataclass
+class RepoCache:
+    """Git metadata about a repository, valid for as long as its HEAD and refs don't move"""
+    path: str  # Where the cache is stored
+    fingerprint: str  # Hash of HEAD and every ref when the entries were computed
+    entries: Dict[str, Any] = field(default_factory=dict)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: Any):
+        self.entries[key] = value
+        self.save()
+
+    def save(self):
+        contents = {'version': CACHE_VERSION, 'fingerprint': self.fingerprint, 'entries': self.entries}
+        try:
+            atomic_write(self.path, json.dumps(contents))
+        except OSError:
+            pass
+
+
+def ref_fingerprint(git_dir: str, common_dir: Optional[str] = None) -> str:
+    """Hash HEAD and every loose and packed ref of a repository without running git
+
+    A worktree has its own HEAD in `git_dir`, but shares its refs with the main repository in `common_dir`.
+    """
+    common_dir = common_dir or git_dir
+    digest = hashlib.sha1()
+
+    for directory, name in [(git_dir, 'HEAD'), (common_dir, 'packed-refs')]:
+        digest.update(name.encode('utf-8') + b'\0' + read_bytes(os.path.join(directory, name)) + b'\0')
+
+    for dirpath, dirnames, filenames in os.walk(os.path.join(common_dir, 'refs')):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            ref_path = os.path.join(dirpath, filename)
+            ref_name = os.path.relpath(ref_path, common_dir)
+            digest.update(ref_name.encode('utf-8') + b'\0' + read_bytes(ref_path) + b'\0')
+
+    return digest.hexdigest()
+
+
+def find_git_dirs(repo: str) -> Optional[Tuple[str, str]]:
+    """Find the git directory and common directory of the repository at `repo` without running git
+
+    They are the same `.git` folder, except in a worktree, where `.git` is a file pointing at
+    the worktree's own git directory, which in turn points at the main repository's.
+    Returns None if `repo` is not the top of a git repository.
+    """
+    git_dir = os.path.join(repo, '.git')
+    if os.path.isfile(git_dir):
+        contents = read_bytes(git_dir).decode('utf-8', errors='replace').strip()
+        if not contents.startswith('gitdir: '):
+            return None
+        git_dir = os.path.join(repo, contents[len('gitdir: '):])
+
+    if not os.path.isdir(git_dir):
+        return None
+
+    common_dir = read_bytes(os.path.join(git_dir, 'commondir')).decode('utf-8', errors='replace').strip()
+    return git_dir, os.path.normpath(os.path.join(git_dir, common_dir)) if common_dir else git_dir
+
+
+def read_bytes(path: str) -> bytes:
+    try:
+        with open(path, 'rb') as infile:
+            return infile.read()
+    except OSError:
+        return b''
+
+
+def load_repo_cache(repo: str) -> Optional[RepoCache]:
+    """Load the metadata cache of the repository at `repo`
+
+    Entries computed for a different set of refs are dropped.
+    Returns None if `repo` is not the top of a git repository.
+    """
+    git_dirs = find_git_dirs(repo)
+    if git_dirs is None:
+        return None
+
+    git_dir, common_dir = git_dirs
+    cache = RepoCache(path=os.path.join(git_dir, CACHE_FILE), fingerprint=ref_fingerprint(git_dir, common_dir))
+
+    try:
+        with open(cache.path, 'r', encoding='utf-8') as infile:
+            contents = json.load(infile)
+    except (OSError, ValueError):
+        return cache
+
+    if contents.get('version') == CACHE_VERSION and contents.get('fingerprint') == cache.fingerprint:
+        cache.entries = contents.get('entries', {})
+
+    return cache
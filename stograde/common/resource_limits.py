@@ -0,0 +1,135 @@
+"""Limit the resources that a command can use, by starting it through a small wrapper that sets the limits
+
+The wrapper is `prlimit` where it is installed, and otherwise a few lines of Python.
+Setting the limits in a `preexec_fn` instead isn't safe while this process has other threads,
+since the child could deadlock on a lock that one of them held when it forked.
+"""
+
+from dataclasses import dataclass
+import errno
+import os
+import shutil
+import signal
+import sys
+from typing import List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows has no resource limits
+    resource = None  # type: ignore
+
+# What a program says when it couldn't get more memory
+OUT_OF_MEMORY_MESSAGES = ['std::bad_alloc', 'MemoryError', 'Cannot allocate memory', 'out of memory']
+
+# What a program says when it couldn't start another process (fork fails with EAGAIN)
+FORK_FAILED_MESSAGES = [os.strerror(errno.EAGAIN)]
+
+# util-linux's prlimit, which sets the limits and then runs the command, without adding to its memory or time
+PRLIMIT = shutil.which('prlimit')
+
+# Does the same as prlimit, given `resource soft hard` triples, then `--` and the command.
+# Python ignores SIGPIPE and SIGXFSZ, and the command would inherit that, so they are restored first (like Popen does)
+LIMIT_WRAPPER = """import os, resource, signal, sys
+signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+signal.signal(signal.SIGXFSZ, signal.SIG_DFL)
+args = sys.argv[1:]
+while args[0] != '--':
+    resource.setrlimit(int(args[0]), (int(args[1]), int(args[2])))
+    args = args[3:]
+os.execvp(args[1], args[1:])
+"""
+
+
+@dataclass
+class ResourceLimits:
+    address_space: Optional[int] = None  # Bytes of (virtual) memory (RLIMIT_AS)
+    cpu_time: Optional[int] = None  # Seconds of CPU time (RLIMIT_CPU)
+    processes: Optional[int] = None  # Processes that the user may have at once (RLIMIT_NPROC)
+    file_size: Optional[int] = None  # Bytes that any one file can grow to (RLIMIT_FSIZE)
+
+    def __bool__(self) -> bool:
+        return any(limit is not None for limit in [self.address_space, self.cpu_time, self.processes, self.file_size])
+
+    def values(self) -> List[Tuple[str, int, int, int]]:
+        """Get prlimit's name, the resource, and the soft and hard limits to set for each of these limits"""
+        values = []
+        if self.address_space is not None:
+            values.append(('as', resource.RLIMIT_AS, *limit_values(resource.RLIMIT_AS, self.address_space)))
+        if self.cpu_time is not None:
+            # The soft limit sends SIGXCPU, so that we can tell why the program stopped, and the hard limit kills it
+            values.append(('cpu', resource.RLIMIT_CPU,
+                           *limit_values(resource.RLIMIT_CPU, self.cpu_time, self.cpu_time + 1)))
+        if self.processes is not None:
+            values.append(('nproc', resource.RLIMIT_NPROC, *limit_values(resource.RLIMIT_NPROC, self.processes)))
+        if self.file_size is not None:
+            values.append(('fsize', resource.RLIMIT_FSIZE, *limit_values(resource.RLIMIT_FSIZE, self.file_size)))
+        return values
+
+    def wrap(self, command: List[str], *, cwd: Optional[str] = None) -> List[str]:
+        """Get a command that runs `command` with these limits
+
+        Raises the same errors that Popen would if the command can't be run,
+        since the wrapper would otherwise start fine and only fail once it tries to run it.
+        """
+        if not self or resource is None:
+            return command
+
+        find_program(command[0], cwd=cwd)
+        values = self.values()
+        if PRLIMIT:
+            return [PRLIMIT, *['--{}={}:{}'.format(name, soft, hard) for name, _, soft, hard in values], '--', *command]
+        return [sys.executable, '-I', '-S', '-c', LIMIT_WRAPPER,
+                *[str(value) for _, limit, soft, hard in values for value in (limit, soft, hard)], '--', *command]
+
+
+def find_program(program: str, *, cwd: Optional[str] = None):
+    """Raise the error that Popen would if `program` (relative to `cwd`, or on the PATH) can't be run"""
+    if os.sep in program:
+        path = os.path.join(cwd or '.', program)
+        if not os.path.exists(path):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), program)
+        if os.path.isdir(path) or not os.access(path, os.X_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), program)
+    elif shutil.which(program) is None:
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), program)
+
+
+def limit_values(limit: int, soft: int, hard: Optional[int] = None) -> Tuple[int, int]:
+    """Get the soft and hard values that lower a limit, without raising one that is already lower
+    (which would fail without privileges)
+
+    Commands inherit this process's limits, so they are the ones that will be lowered.
+    """
+    current_soft, current_hard = resource.getrlimit(limit)
+    hard = soft if hard is None else hard
+    if current_hard != resource.RLIM_INFINITY:
+        hard = min(hard, current_hard)
+    if current_soft != resource.RLIM_INFINITY:
+        soft = min(soft, current_soft)
+    return min(soft, hard), hard
+
+
+def exceeded_limit(limits: Optional[ResourceLimits],
+                   returncode: int,
+                   output: str,
+                   cpu_time: Optional[float] = None) -> bool:
+    """Guess whether a command stopped because it ran into one of its `limits`
+
+    A command that ignores SIGXCPU is killed once it reaches the hard CPU limit, but so is one that timed out,
+    so a SIGKILL only counts if the command's measured `cpu_time` (in seconds) reached the limit.
+    """
+    if not limits:
+        return False
+    if limits.cpu_time is not None:
+        if returncode == -signal.SIGXCPU:
+            return True
+        if returncode == -signal.SIGKILL and cpu_time is not None and cpu_time >= limits.cpu_time:
+            return True
+    if limits.file_size is not None and returncode == -signal.SIGXFSZ:
+        return True
+    if limits.address_space is not None and returncode != 0:
+        if any(message in output for message in OUT_OF_MEMORY_MESSAGES):
+            return True
+    if limits.processes is not None and returncode != 0:
+        return any(message in output for message in FORK_FAILED_MESSAGES)
+    return False
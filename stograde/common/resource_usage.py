@@ -0,0 +1,44 @@
+"""Measure the resources that a command used, from what the kernel reports when it exits"""
+
+from dataclasses import dataclass
+import os
+import sys
+from typing import Iterable, Tuple
+
+
+@dataclass
+class ResourceUsage:
+    wall_time: float = 0.0  # Seconds from starting the command until it exited
+    cpu_time: float = 0.0  # Seconds of user and system CPU time
+    max_rss: int = 0  # Peak resident memory, in kilobytes
+    output_bytes: int = 0  # Bytes that the command printed, including any that were cut off
+
+
+def usage_from_rusage(rusage, *, wall_time: float) -> ResourceUsage:
+    """Convert the rusage of a process that `os.wait4` reaped"""
+    max_rss = rusage.ru_maxrss
+    if sys.platform == 'darwin':
+        # macOS reports bytes instead of kilobytes
+        max_rss //= 1024
+    return ResourceUsage(wall_time=wall_time,
+                         cpu_time=rusage.ru_utime + rusage.ru_stime,
+                         max_rss=max_rss)
+
+
+def wait_for_usage(pid: int) -> Tuple[int, object]:
+    """Wait for a process to exit, returning its exit code (like Popen.returncode) and rusage"""
+    _, status, rusage = os.wait4(pid, 0)
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status), rusage
+    return os.WEXITSTATUS(status), rusage
+
+
+def total_usage(usages: Iterable[ResourceUsage]) -> ResourceUsage:
+    """Add up the usage of several commands, keeping the largest peak memory of any of them"""
+    total = ResourceUsage()
+    for usage in usages:
+        total.wall_time += usage.wall_time
+        total.cpu_time += usage.cpu_time
+        total.max_rss = max(total.max_rss, usage.max_rss)
+        total.output_bytes += usage.output_bytes
+    return total
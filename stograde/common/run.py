@@ -1,29 +1,49 @@
-import copy
+import asyncio
 import io
 import os
 import pty
 import subprocess
-from typing import List, Optional, Tuple
+from typing import Any, Awaitable, List, Optional, Tuple, Union
 
+from ..common.capture import copy_env, decode_output
+from ..common.pipeline import run_pipeline
+from ..common.resource_limits import exceeded_limit, ResourceLimits
 from ..common.run_status import RunStatus
 
 
 def run(cmd: List[str],
         *,
+        cwd: Optional[str] = None,
         interact: bool = False,
         input_data: Optional[bytes] = None,
-        timeout: Optional[float] = None) -> Tuple[RunStatus, str, bool]:
+        timeout: Optional[float] = None,
+        capture_limit: Optional[int] = None,
+        kill_on_limit: bool = False,
+        limits: Optional[ResourceLimits] = None) -> Tuple[RunStatus, str, bool]:
+    """Run a command in `cwd` (or the current directory), without changing the directory of this process
+
+    With a `capture_limit`, only about that many bytes of output are kept,
+    and the command is stopped once it prints more if `kill_on_limit` is set.
+    Resource `limits` are applied to the command, but not to interactive commands.
+    """
     if interact:
-        return run_interactive(cmd)
+        return run_interactive(cmd, cwd=cwd)
+    elif capture_limit is not None:
+        return run_bounded(cmd, input_data, timeout, cwd=cwd, capture_limit=capture_limit,
+                           kill_on_limit=kill_on_limit, limits=limits)
     else:
-        return run_static(cmd, input_data, timeout)
+        return run_static(cmd, input_data, timeout, cwd=cwd, limits=limits)
 
 
-def run_interactive(cmd: List[str]) -> Tuple[RunStatus, str, bool]:
+def run_interactive(cmd: List[str], *, cwd: Optional[str] = None) -> Tuple[RunStatus, str, bool]:
     status = RunStatus.SUCCESS
 
     print('Recording {}. Send EOF (^D) to end.'.format(cmd), end='\n\n')
 
+    if cwd is not None:
+        # pty.spawn can't change directories, so let a shell do it in the child process
+        cmd = ['sh', '-c', 'cd -- "$0" && exec "$@"', cwd, *cmd]
+
     # This is mostly taken from the stdlib's `pty` docs
     with io.BytesIO() as script:
         def read(fd):
@@ -48,17 +68,21 @@ def run_interactive(cmd: List[str]) -> Tuple[RunStatus, str, bool]:
 
 def run_static(cmd: List[str],
                input_data: Optional[bytes] = None,
-               timeout: Optional[int] = None) -> Tuple[RunStatus, str, bool]:
+               timeout: Optional[int] = None,
+               *,
+               cwd: Optional[str] = None,
+               limits: Optional[ResourceLimits] = None) -> Tuple[RunStatus, str, bool]:
     status = RunStatus.SUCCESS
     result = ''
 
     try:
         proc_result = subprocess.run(
-            cmd,
+            limits.wrap(cmd, cwd=cwd) if limits else cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             timeout=timeout,
             input=input_data,
+            cwd=cwd,
             env=copy_env(),
             check=True)
 
@@ -67,10 +91,14 @@ def run_static(cmd: List[str],
 
     except subprocess.CalledProcessError as err:
         status = RunStatus.CALLED_PROCESS_ERROR
+        err.cmd = cmd  # Rather than the wrapper that applied the limits
         result = err.output if err.output else str(err)
+        if exceeded_limit(limits, err.returncode, decode_output(result)):
+            status = RunStatus.RESOURCE_LIMIT_EXCEEDED
 
     except subprocess.TimeoutExpired as err:
         status = RunStatus.TIMEOUT_EXPIRED
+        err.cmd = cmd
         result = err.output if err.output else str(err)
 
     except FileNotFoundError as err:
@@ -85,18 +113,70 @@ def run_static(cmd: List[str],
         status = RunStatus.PROCESS_LOOKUP_ERROR
         result = str(err)
 
+    return status, decode_output(result), False
+
+
+def run_bounded(cmd: List[str],
+                input_data: Optional[bytes] = None,
+                timeout: Optional[float] = None,
+                *,
+                cwd: Optional[str] = None,
+                capture_limit: int,
+                kill_on_limit: bool = False,
+                limits: Optional[ResourceLimits] = None) -> Tuple[RunStatus, str, bool]:
+    """Like run_static, but reads the output as it is printed, so that a command that prints forever
+    uses no more than `capture_limit` bytes of memory (and is killed, if `kill_on_limit`)"""
+    result = run_pipeline([cmd],
+                          cwd=cwd,
+                          input_data=input_data,
+                          timeout=timeout,
+                          capture_limit=capture_limit,
+                          kill_on_limit=kill_on_limit,
+                          limits=limits)
+    return result.status, result.output, False
+
+
+async def run_async(cmd: List[str],
+                    *,
+                    cwd: Optional[str] = None,
+                    timeout: Optional[float] = None) -> Tuple[RunStatus, str, bool]:
+    """Like run_static, but lets the event loop do other work while the command runs"""
+    status = RunStatus.SUCCESS
+    result: Union[bytes, str] = ''
+
+    try:
+        proc = await asyncio.create_subprocess_exec(*cmd,
+                                                    stdout=subprocess.PIPE,
+                                                    stderr=subprocess.STDOUT,
+                                                    cwd=cwd,
+                                                    env=copy_env())
+    except FileNotFoundError as err:
+        return RunStatus.FILE_NOT_FOUND, str(err), False
+    except PermissionError as err:
+        return RunStatus.PERMISSION_DENIED, str(err), False
+
     try:
-        if not isinstance(result, str):
-            result = str(result, 'utf-8')
-    except UnicodeDecodeError:
-        result = str(result, 'cp437')
+        result, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return RunStatus.TIMEOUT_EXPIRED, str(subprocess.TimeoutExpired(cmd, timeout)), False
 
-    return status, result, False
+    if proc.returncode != 0:
+        status = RunStatus.CALLED_PROCESS_ERROR
+        if not result:
+            result = str(subprocess.CalledProcessError(proc.returncode, cmd))
 
+    return status, decode_output(result), False
 
-# This is to catch glibc errors, because it prints to /dev/tty
-# instead of stderr. See https://stackoverflow.com/a/27797579
-def copy_env():
-    env = copy.copy(os.environ)
-    env["LIBC_FATAL_STDERR_"] = "1"
-    return env
+
+def run_until_complete(awaitable: Awaitable[Any]) -> Any:
+    """Run a coroutine to completion on a fresh event loop"""
+    loop = asyncio.new_event_loop()
+    # Python < 3.8 only watches for child processes on the current event loop
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
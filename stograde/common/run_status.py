@@ -8,3 +8,5 @@ class RunStatus(Enum):
     PERMISSION_DENIED = auto()
     PROCESS_LOOKUP_ERROR = auto()
     TIMEOUT_EXPIRED = auto()
+    OUTPUT_LIMIT_EXCEEDED = auto()
+    RESOURCE_LIMIT_EXCEEDED = auto()
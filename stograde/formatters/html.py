@@ -4,6 +4,7 @@ from typing import List, TYPE_CHECKING
 
 from .format_type import FormatType
 from .formatted_result import FormattedResult
+from .usage import format_usage
 
 from ..toolkit import global_vars
 
@@ -15,14 +16,15 @@ if TYPE_CHECKING:
     from ..process_file.test_result import TestResult
 
 
-def format_assignment_html(result: 'RecordResult') -> 'FormattedResult':
+def format_assignment_html(result: 'RecordResult', show_usage: bool = False) -> 'FormattedResult':
     """Given a single recording, format it into an HTML file.
 
     Each recording will only have one student.
+    With `show_usage`, the time and memory that each command used are included.
     """
 
     try:
-        files = format_files_list(result.file_results)
+        files = format_files_list(result.file_results, show_usage)
         warnings = format_warnings(result.warnings)
         header = format_header(result, warnings)
         output = (header + files) + '\n<hr>\n'
@@ -38,8 +40,8 @@ def format_assignment_html(result: 'RecordResult') -> 'FormattedResult':
                            type=FormatType.HTML)
 
 
-def format_files_list(files: List['FileResult']) -> str:
-    return '\n\n'.join([format_file(info) for info in files])
+def format_files_list(files: List['FileResult'], show_usage: bool = False) -> str:
+    return '\n\n'.join([format_file(info, show_usage) for info in files])
 
 
 def format_header(result: 'RecordResult', warnings: str) -> str:
@@ -72,7 +74,7 @@ def format_warnings(warnings: 'SubmissionWarnings') -> str:
         return ''
 
 
-def format_file(file_info: 'FileResult') -> str:
+def format_file(file_info: 'FileResult', show_usage: bool = False) -> str:
     """Format a file for the log.
     Formats and concatenates a header, the file contents, compile output and test output.
 
@@ -82,8 +84,8 @@ def format_file(file_info: 'FileResult') -> str:
     """
 
     contents = format_file_contents(file_info) + '\n'
-    compilation = format_file_compilation(file_info.compile_results) + '\n'
-    test_results = format_file_tests(file_info.test_results) + '\n'
+    compilation = format_file_compilation(file_info.compile_results, show_usage) + '\n'
+    test_results = format_file_tests(file_info.test_results, show_usage) + '\n'
 
     if file_info.last_modified:
         last_modified = ' ({})'.format(file_info.last_modified)
@@ -119,18 +121,20 @@ def format_file_contents(file_info: 'FileResult'):
         return format_as_code(file_info.contents)
 
 
-def format_file_compilation(compilations: List['CompileResult']) -> str:
+def format_file_compilation(compilations: List['CompileResult'], show_usage: bool = False) -> str:
     """Add header and code block to compile command outputs"""
 
     result = []
     for compile_result in compilations:
         output = compile_result.output
         command = '<code>{command}</code>'.format(command=html.escape(compile_result.command))
+        usage = format_usage(compile_result.usage) if show_usage else ''
+        usage = ' ({})'.format(usage) if usage else ''
 
         if not output:
-            result.append('<p><b>no warnings: {}</b></p>\n'.format(command))
+            result.append('<p><b>no warnings: {}</b>{}</p>\n'.format(command, usage))
         else:
-            result.append('<p><b>warnings: {}</b></p>'.format(command))
+            result.append('<p><b>warnings: {}</b>{}</p>'.format(command, usage))
             result.append(format_as_code(output) + '\n')
             if compile_result.truncated_after:
                 result.append('<p><i>(truncated after {} chars)</i></p>\n'.format(compile_result.truncated_after))
@@ -138,13 +142,15 @@ def format_file_compilation(compilations: List['CompileResult']) -> str:
     return '\n'.join(result)
 
 
-def format_file_tests(test_results: List['TestResult']) -> str:
+def format_file_tests(test_results: List['TestResult'], show_usage: bool = False) -> str:
     """Add header and markdown code block to test outputs"""
 
     result = []
     for test in test_results:
-        header = '<p><b>results of <code>{}</code></b> (status: {})</p>\n'.format(test.command,
-                                                                                  test.status.name)
+        usage = format_usage(test.usage) if show_usage else ''
+        header = '<p><b>results of <code>{}</code></b> (status: {}{})</p>\n'.format(test.command,
+                                                                                    test.status.name,
+                                                                                    '; ' + usage if usage else '')
         if test.output:
             header_and_contents = header + format_as_code(test.output) + '\n'
             if test.truncated_after:
@@ -3,6 +3,7 @@ from typing import List, TYPE_CHECKING
 
 from .format_type import FormatType
 from .formatted_result import FormattedResult
+from .usage import format_usage
 from ..toolkit import global_vars
 
 if TYPE_CHECKING:
@@ -13,14 +14,15 @@ if TYPE_CHECKING:
     from ..process_file.test_result import TestResult
 
 
-def format_assignment_markdown(result: 'RecordResult') -> 'FormattedResult':
+def format_assignment_markdown(result: 'RecordResult', show_usage: bool = False) -> 'FormattedResult':
     """Given a single recording, format it into a Markdown file.
 
     Each recording will only have one student.
+    With `show_usage`, the time and memory that each command used are included.
     """
 
     try:
-        files = format_files_list(result.file_results)
+        files = format_files_list(result.file_results, show_usage)
         warnings = format_warnings(result.warnings)
         header = format_header(result, warnings)
         output = (header + files) + '\n\n'
@@ -36,8 +38,8 @@ def format_assignment_markdown(result: 'RecordResult') -> 'FormattedResult':
                            type=FormatType.MD)
 
 
-def format_files_list(files: List['FileResult']) -> str:
-    return '\n\n' + '\n\n'.join([format_file(info) for info in files])
+def format_files_list(files: List['FileResult'], show_usage: bool = False) -> str:
+    return '\n\n' + '\n\n'.join([format_file(info, show_usage) for info in files])
 
 
 def format_header(result: 'RecordResult', warnings: str) -> str:
@@ -71,7 +73,7 @@ def format_warnings(warnings: 'SubmissionWarnings') -> str:
         return ''
 
 
-def format_file(file_info: 'FileResult') -> str:
+def format_file(file_info: 'FileResult', show_usage: bool = False) -> str:
     """Format a file for the log.
     Formats and concatenates a header, the file contents, compile output and test output.
 
@@ -81,8 +83,8 @@ def format_file(file_info: 'FileResult') -> str:
     """
 
     contents = format_file_contents(file_info)
-    compilation = format_file_compilation(file_info.compile_results)
-    test_results = format_file_tests(file_info.test_results)
+    compilation = format_file_compilation(file_info.compile_results, show_usage)
+    test_results = format_file_tests(file_info.test_results, show_usage)
 
     if file_info.last_modified:
         last_modified = ' ({})'.format(file_info.last_modified)
@@ -129,18 +131,20 @@ def format_file_contents(file_info: 'FileResult') -> str:
     return contents
 
 
-def format_file_compilation(compilations: List['CompileResult']) -> str:
+def format_file_compilation(compilations: List['CompileResult'], show_usage: bool = False) -> str:
     """Add header and markdown code block to compile command outputs"""
 
     result = []
     for compile_result in compilations:
         output = compile_result.output
         command = '`{command}`'.format(command=compile_result.command)
+        usage = format_usage(compile_result.usage) if show_usage else ''
+        usage = ' ({})'.format(usage) if usage else ''
 
         if not output:
-            result.append('**no warnings: {}**\n'.format(command))
+            result.append('**no warnings: {}**{}\n'.format(command, usage))
         else:
-            result.append('**warnings: {}**\n'.format(command))
+            result.append('**warnings: {}**{}\n'.format(command, usage))
             result.append('```\n' + output + '\n```\n')
             if compile_result.truncated_after:
                 result.append('*(truncated after {} chars)*\n'.format(compile_result.truncated_after))
@@ -148,13 +152,15 @@ def format_file_compilation(compilations: List['CompileResult']) -> str:
     return '\n'.join(result)
 
 
-def format_file_tests(test_results: List['TestResult']) -> str:
+def format_file_tests(test_results: List['TestResult'], show_usage: bool = False) -> str:
     """Add header and markdown code block to test outputs"""
 
     result = []
     for test in test_results:
-        header = '**results of `{command}`** (status: {status})\n'.format(command=test.command,
-                                                                          status=test.status.name)
+        usage = format_usage(test.usage) if show_usage else ''
+        header = '**results of `{command}`** (status: {status}{usage})\n'.format(command=test.command,
+                                                                                 status=test.status.name,
+                                                                                 usage='; ' + usage if usage else '')
         if test.output:
             header_and_contents = header + '\n```\n' + test.output + '\n```\n'
             if test.truncated_after:
@@ -3,6 +3,8 @@ import re
 from typing import Dict, List, Tuple, TYPE_CHECKING
 from termcolor import colored
 
+from .usage import format_size
+from ..common.resource_usage import total_usage
 from ..process_assignment.assignment_status import AssignmentStatus
 from ..process_assignment.assignment_type import get_assignment_number
 
@@ -114,10 +116,27 @@ def get_nums(students: List['StudentResult']) -> Tuple[int, int, int]:
     return max_hwk_num, max_lab_num, max_worksheet_num
 
 
+def summarize_usage(student: 'StudentResult') -> str:
+    """Describe the CPU time that all of a student's commands used, and the most memory that any one did"""
+    usages = [result.usage
+              for record in student.results
+              for file_result in record.file_results
+              for result in [*file_result.compile_results, *file_result.test_results]
+              if result.usage is not None]
+    if not usages:
+        return MISSING
+    usage = total_usage(usages)
+    return '{:.2f}s CPU, {} memory'.format(usage.cpu_time, format_size(usage.max_rss * 1024))
+
+
 def tabulate(student_results: List['StudentResult'],
              sort_by: str = 'name',
-             highlight_partials: bool = True) -> str:
-    """Actually build the table"""
+             highlight_partials: bool = True,
+             show_usage: bool = False) -> str:
+    """Actually build the table
+
+    With `show_usage`, a last column shows what the commands that were run for each student used.
+    """
 
     # be sure that the longest username will be at least 4 chars
     usernames = [user.name for user in student_results] + ['USER']
@@ -160,9 +179,18 @@ def tabulate(student_results: List['StudentResult'],
         sorter2 = sort_by_hw_count
         should_reverse = False
 
+    students = sorted(sorted(student_results, key=sorter2), reverse=should_reverse, key=sorter1)
     lines = [columnize(student, longest_user, max_hwk_num, max_lab_num, max_wst_num,
                        highlight_partials=highlight_partials)
-             for student in sorted(sorted(student_results, key=sorter2), reverse=should_reverse, key=sorter1)]
+             for student in students]
+
+    if show_usage:
+        header += ' {sep} USAGE'.format(sep=COL)
+        border += ROW + JOIN + ''.ljust(len('USAGE') + 1, ROW)
+        lines = [line if student.error else '{line} {sep} {usage}'.format(line=line,
+                                                                          sep=COL,
+                                                                          usage=summarize_usage(student))
+                 for line, student in zip(lines, students)]
 
     # and make the table to return
     table = [header, border] + lines
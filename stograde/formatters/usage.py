@@ -0,0 +1,23 @@
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..common.resource_usage import ResourceUsage
+
+
+def format_size(size: int) -> str:
+    """Format a number of bytes with the largest unit that keeps it above 1"""
+    for unit in ['B', 'KB', 'MB']:
+        if size < 1024:
+            return '{:.0f} {}'.format(size, unit) if unit == 'B' else '{:.1f} {}'.format(size, unit)
+        size /= 1024
+    return '{:.1f} GB'.format(size)
+
+
+def format_usage(usage: Optional['ResourceUsage']) -> str:
+    """Describe what a command used, or nothing if that wasn't measured"""
+    if usage is None:
+        return ''
+    return '{:.2f}s, {:.2f}s CPU, {} memory, {} output'.format(usage.wall_time,
+                                                               usage.cpu_time,
+                                                               format_size(usage.max_rss * 1024),
+                                                               format_size(usage.output_bytes))
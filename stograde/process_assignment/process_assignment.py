@@ -1,16 +1,18 @@
-"""Given a spec, assuming we're in the homework folder, run the spec against the folder"""
+"""Given a spec and the homework folder, run the spec against the folder"""
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from .record_result import RecordResult
 from .submission_warnings import SubmissionWarnings
 from .supporting import import_supporting, remove_supporting
 from ..common import get_assignment_first_submit_time
 from ..process_file import process_file
+from ..process_file.result_cache import CachedResults, assignment_result_keys, load_results, save_results
 from ..toolkit import global_vars
 
 if TYPE_CHECKING:
+    from ..common.history_index import HistoryIndex
     from ..specs.spec import Spec
     from ..student.student_result import StudentResult
 
@@ -20,36 +22,56 @@ def process_assignment(*,
                        spec: 'Spec',
                        basedir: str,
                        interact: bool,
-                       skip_web_compile: bool) -> RecordResult:
-    """Run a spec against the current folder"""
-    cwd = os.getcwd()
+                       skip_web_compile: bool,
+                       skip_result_cache: bool = False,
+                       history: Optional['HistoryIndex'] = None,
+                       cwd: str = '.') -> RecordResult:
+    """Run a spec against the `cwd` folder"""
     try:
         first_submit = ''
 
         if not global_vars.CI:
-            first_submit = get_assignment_first_submit_time(spec, cwd)
+            first_submit = get_assignment_first_submit_time(spec, cwd, history)
 
         result = RecordResult(spec_id=spec.id,
                               first_submission=first_submit,
                               student=student.name)
 
-        # prepare the current folder
+        # prepare the folder
         supporting_dir, written_files = import_supporting(spec=spec,
-                                                          basedir=basedir)
+                                                          basedir=basedir,
+                                                          cwd=cwd)
+
+        # look up earlier results for identical files, which are only used if every file has them,
+        # since a file's tests may depend on other files having been compiled
+        use_cache = not skip_result_cache and not interact and not global_vars.CI
+        keys = assignment_result_keys(spec=spec,
+                                      supporting_dir=supporting_dir,
+                                      skip_web_compile=skip_web_compile,
+                                      cwd=cwd) if use_cache else []
+        cached = [load_results(key) for key in keys]
+        all_cached = use_cache and all(entry is not None for entry in cached)
 
         # process the assignment
-        for file_spec in spec.files:
+        for index, file_spec in enumerate(spec.files):
             file_result = process_file(file_spec=file_spec,
                                        supporting_dir=supporting_dir,
                                        interact=interact,
-                                       skip_web_compile=skip_web_compile)
+                                       skip_web_compile=skip_web_compile,
+                                       history=history,
+                                       cached=cached[index] if all_cached else None,
+                                       cwd=cwd)
             result.file_results.append(file_result)
 
+            if use_cache and not all_cached:
+                save_results(keys[index], CachedResults(compile_results=file_result.compile_results,
+                                                        test_results=file_result.test_results))
+
         # now we remove any compiled binaries
-        remove_execs(spec)
+        remove_execs(spec, cwd=cwd)
 
         # and we remove any supporting files
-        remove_supporting(written_files)
+        remove_supporting(written_files, cwd=cwd)
 
         return result
 
@@ -62,10 +84,10 @@ def process_assignment(*,
                                 warnings=SubmissionWarnings(recording_err=str(err)))
 
 
-def remove_execs(spec: 'Spec'):
-    """Remove executable files (identified by a .exec extension)"""
+def remove_execs(spec: 'Spec', *, cwd: str = '.'):
+    """Remove executable files (identified by a .exec extension) from `cwd`"""
     for file in spec.files:
         try:
-            os.remove('{}.exec'.format(file.file_name))
+            os.remove(os.path.join(cwd, '{}.exec'.format(file.file_name)))
         except FileNotFoundError:
             pass
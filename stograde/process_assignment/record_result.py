@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from .submission_warnings import SubmissionWarnings
 
@@ -15,3 +15,5 @@ class RecordResult:
     first_submission: str = 'ERROR'  # The first commit of this assignment's files
     warnings: SubmissionWarnings = field(default_factory=SubmissionWarnings)  # Any warnings about the assignment
     file_results: List['FileResult'] = field(default_factory=list)  # The results from each individual file
+    # Seconds that recording it took (None if it wasn't recorded), which differs from run to run
+    duration: Optional[float] = field(default=None, compare=False)
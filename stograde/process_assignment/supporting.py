@@ -6,9 +6,8 @@ if TYPE_CHECKING:
     from ..specs.spec import Spec
 
 
-def import_supporting(*, spec: 'Spec', basedir: str) -> Tuple[str, List[str]]:
-    """Copy supporting and input files into student's homework directory"""
-    cwd = os.getcwd()
+def import_supporting(*, spec: 'Spec', basedir: str, cwd: str = '.') -> Tuple[str, List[str]]:
+    """Copy supporting and input files into student's homework directory, `cwd`"""
     supporting_dir = os.path.join(basedir, 'data', 'supporting')
     written_files = []
 
@@ -21,10 +20,10 @@ def import_supporting(*, spec: 'Spec', basedir: str) -> Tuple[str, List[str]]:
     return supporting_dir, written_files
 
 
-def remove_supporting(written_files: List[str]):
-    """Remove supporting and input files after testing is complete"""
+def remove_supporting(written_files: List[str], *, cwd: str = '.'):
+    """Remove supporting and input files from `cwd` after testing is complete"""
     for supporting_file in written_files:
         try:
-            os.remove(supporting_file)
+            os.remove(os.path.join(cwd, supporting_file))
         except FileNotFoundError:
             pass
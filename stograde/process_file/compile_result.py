@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
+from ..common.resource_usage import ResourceUsage
 from ..common.run_status import RunStatus
 
 
@@ -11,3 +12,5 @@ class CompileResult:
     output: str  # Output from running the command
     status: RunStatus  # Status from running the command
     truncated_after: Optional[int] = None  # How much was it truncated
+    # What the command used (None if it was run interactively), which differs from run to run
+    usage: Optional[ResourceUsage] = field(default=None, compare=False)
@@ -1,35 +1,48 @@
+import logging
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from .compile_result import CompileResult
 from .file_result import FileResult
 from .test_result import TestResult
 from ..common import cat, get_modification_time, run, pipe
 from ..common.modification_time import ModificationTime
+from ..common.pipe import split_pipeline
+from ..common.pipeline import PipelineResult, run_pipeline
+from ..common.resource_limits import ResourceLimits
 from ..common.run_status import RunStatus
 from ..formatters.truncate import truncate
 
 if TYPE_CHECKING:
+    from ..common.history_index import HistoryIndex
+    from .result_cache import CachedResults
     from ..specs.spec import SpecFile
 
 
-def get_file(file_spec: 'SpecFile', file_result: FileResult) -> bool:
-    """Get the contents of the file and check when it was last modified.
+def get_file(file_spec: 'SpecFile',
+             file_result: FileResult,
+             history: Optional['HistoryIndex'] = None,
+             *,
+             cwd: str = '.') -> bool:
+    """Get the contents of the file in `cwd` and check when it was last modified.
     If the file doesn't exist, find what other files are present.
     """
-    file_status, file_contents = cat(file_spec.file_name, hide_contents=file_spec.options.hide_contents)
+    file_status, file_contents = cat(file_spec.file_name, cwd=cwd, hide_contents=file_spec.options.hide_contents)
 
     if file_status is not RunStatus.SUCCESS:
         file_result.file_missing = True
         file_result.optional = file_spec.options.optional
-        file_result.other_files = os.listdir('.')
+        file_result.other_files = os.listdir(cwd)
         return False
     else:
         file_result.compile_optional = file_spec.options.compile_optional
         file_result.contents = truncate(file_contents, file_spec.options.truncate_contents)
         if file_result.contents != file_contents:
             file_result.contents_truncated_after = file_spec.options.truncate_contents
-        file_result.last_modified, _ = get_modification_time(file_spec.file_name, os.getcwd(), ModificationTime.LATEST)
+        file_result.last_modified, _ = get_modification_time(file_spec.file_name,
+                                                             cwd,
+                                                             ModificationTime.LATEST,
+                                                             history)
         return True
 
 
@@ -39,25 +52,29 @@ def parse_command(command: str, *, file_name: str, supporting_dir: str) -> str:
         .replace('$SUPPORT', supporting_dir)
 
 
-def compile_file(*, file_spec: 'SpecFile', results: FileResult, supporting_dir: str) -> bool:
+def compile_file(*, file_spec: 'SpecFile', results: FileResult, supporting_dir: str, cwd: str = '.') -> bool:
     for command in file_spec.compile_commands:
         command = parse_command(command,
                                 file_name=file_spec.file_name,
                                 supporting_dir=supporting_dir)
 
-        cmd, input_for_cmd = pipe(command)
-        status, full_output, _ = run(cmd, timeout=30, input_data=input_for_cmd)
+        result, _ = run_command(command,
+                                file_spec=file_spec,
+                                cwd=cwd,
+                                timeout=30,
+                                limits=None)
 
-        output = truncate(full_output, file_spec.options.truncate_output)
+        output = truncate(result.output, file_spec.options.truncate_output)
 
         results.compile_results.append(CompileResult(
             command=command,
             output=output,
-            status=status,
-            truncated_after=file_spec.options.truncate_output if output != full_output else None,
+            status=result.status,
+            truncated_after=file_spec.options.truncate_output if output != result.output else None,
+            usage=result.usage,
         ))
 
-        if status is not RunStatus.SUCCESS:
+        if result.status is not RunStatus.SUCCESS:
             return False
 
     return True
@@ -67,7 +84,8 @@ def test_file(*,
               file_spec: 'SpecFile',
               file_results: FileResult,
               supporting_dir: str,
-              interact: bool):
+              interact: bool,
+              cwd: str = '.'):
     for command in file_spec.test_commands:
         if not command:
             continue
@@ -76,46 +94,98 @@ def test_file(*,
                                 file_name=file_spec.file_name,
                                 supporting_dir=supporting_dir)
 
-        test_cmd, input_for_test = pipe(command)
-
         again = True
         while again:
-            status, full_result, again = run(test_cmd,
-                                             input_data=input_for_test,
-                                             timeout=file_spec.options.timeout,
-                                             interact=interact)
+            result, again = run_command(command,
+                                        file_spec=file_spec,
+                                        cwd=cwd,
+                                        timeout=file_spec.options.timeout,
+                                        limits=resource_limits(file_spec),
+                                        interact=interact)
 
-            result = truncate(full_result, file_spec.options.truncate_output)
+            output = truncate(result.output, file_spec.options.truncate_output)
 
             file_results.test_results.append(TestResult(
                 command=command,
-                output=result,
-                status=status,
-                error=status != RunStatus.SUCCESS,
-                truncated_after=file_spec.options.truncate_output if result != full_result else None,
+                output=output,
+                status=result.status,
+                error=result.status != RunStatus.SUCCESS,
+                truncated_after=file_spec.options.truncate_output if output != result.output else None,
+                usage=result.usage,
             ))
 
 
+def run_command(command: str,
+                *,
+                file_spec: 'SpecFile',
+                cwd: str,
+                timeout: float,
+                limits: Optional[ResourceLimits],
+                interact: bool = False) -> Tuple[PipelineResult, bool]:
+    """Run a command, which may be a pipeline, keeping no more of its output than the file's spec shows.
+    Also returns whether an interactive command should be run again."""
+    if interact:
+        # Only the last command of the pipeline is run in the terminal
+        cmd, input_for_cmd = pipe(command, cwd)
+        status, output, again = run(cmd, cwd=cwd, input_data=input_for_cmd, timeout=timeout, interact=True)
+        return PipelineResult(status=status, output=output), again
+
+    result = run_pipeline(split_pipeline(command, cwd),
+                          cwd=cwd,
+                          timeout=timeout,
+                          capture_limit=file_spec.options.truncate_output,
+                          kill_on_limit=file_spec.options.kill_on_truncate,
+                          limits=limits)
+
+    for stage in result.stages[:-1]:
+        if stage.status is not RunStatus.SUCCESS:
+            logging.debug('{} in `{}` exited with {}'.format(stage.command, command, stage.returncode))
+
+    return result, False
+
+
+def resource_limits(file_spec: 'SpecFile') -> ResourceLimits:
+    """Get the limits on the resources that a file's tests may use"""
+    options = file_spec.options
+    return ResourceLimits(
+        address_space=options.memory_limit * 1024 * 1024 if options.memory_limit is not None else None,
+        cpu_time=options.cpu_limit,
+        processes=options.process_limit,
+        file_size=options.file_size_limit * 1024 * 1024 if options.file_size_limit is not None else None,
+    )
+
+
 def process_file(*,
                  file_spec: 'SpecFile',
                  supporting_dir: str,
                  interact: bool,
-                 skip_web_compile: bool) -> FileResult:
-    """Process a single file.
-    Get the contents of the file, then compile it (if applicable), and test it (if applicable)"""
+                 skip_web_compile: bool,
+                 history: Optional['HistoryIndex'] = None,
+                 cached: Optional['CachedResults'] = None,
+                 cwd: str = '.') -> FileResult:
+    """Process a single file in the `cwd` folder.
+    Get the contents of the file, then compile it (if applicable), and test it (if applicable),
+    unless the results of doing so are `cached`"""
     file_result = FileResult(file_name=file_spec.file_name)
 
-    should_continue = get_file(file_spec, file_result)
+    should_continue = get_file(file_spec, file_result, history, cwd=cwd)
+
+    if should_continue and cached is not None:
+        file_result.compile_results = cached.compile_results
+        file_result.test_results = cached.test_results
+        return file_result
 
     if should_continue and not (skip_web_compile and file_spec.options.web_file):
         should_continue = compile_file(file_spec=file_spec,
                                        results=file_result,
-                                       supporting_dir=supporting_dir)
+                                       supporting_dir=supporting_dir,
+                                       cwd=cwd)
 
     if should_continue and not file_spec.options.web_file:
         test_file(file_spec=file_spec,
                   file_results=file_result,
                   supporting_dir=supporting_dir,
-                  interact=interact)
+                  interact=interact,
+                  cwd=cwd)
 
     return file_result
@@ -0,0 +1,164 @@
+"""Remember the compile and test results of files, keyed by everything that could change them
+
+A key hashes the assignment folder (as it was before anything was compiled), the spec's supporting files,
+the file's expanded commands and options, and the identity of each program that the commands run.
+Identical submissions, whether from one student across runs or from many students turning in the
+starter code, then share a single entry.
+"""
+
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+import os
+import shlex
+import shutil
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from .compile_result import CompileResult
+from .process_file import parse_command
+from .test_result import TestResult
+from ..common.atomic_write import atomic_write
+from ..common.resource_usage import ResourceUsage
+from ..common.run_status import RunStatus
+from ..toolkit.config import CACHE_DIR
+
+if TYPE_CHECKING:
+    from ..specs.spec import Spec
+    from ..specs.spec_file import SpecFile
+
+CACHE_VERSION = 1
+RESULTS_DIR = os.path.join(CACHE_DIR, 'results')
+
+# The identity of each program a command has run, by name (see program_identity)
+_programs: Dict[str, str] = {}
+
+
+@dataclass
+class CachedResults:
+    """The stored results of compiling and testing one file"""
+    compile_results: List[CompileResult] = field(default_factory=list)
+    test_results: List[TestResult] = field(default_factory=list)
+
+
+def snapshot_digest(*directories: str) -> str:
+    """Hash the names and contents of every file in `directories`, except for compiled .exec files
+
+    Only paths relative to each directory are hashed, so that identical folders of different students match.
+    """
+    digest = hashlib.sha256()
+
+    for index, directory in enumerate(directories):
+        digest.update(str(index).encode('utf-8') + b'\0')
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.endswith('.exec'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                digest.update(os.path.relpath(path, directory).encode('utf-8') + b'\0')
+                try:
+                    with open(path, 'rb') as infile:
+                        digest.update(hashlib.sha256(infile.read()).digest())
+                except OSError:
+                    digest.update(b'unreadable')
+
+    return digest.hexdigest()
+
+
+def program_identity(command: str) -> str:
+    """Describe the version of each program in a command (or pipeline) by its path, size and modification time"""
+    identities = []
+
+    for stage in command.split(' | '):
+        try:
+            program = shlex.split(stage)[0]
+        except (IndexError, ValueError):
+            continue
+
+        if program not in _programs:
+            path = shutil.which(program)
+            try:
+                stat = os.stat(path) if path and os.path.isabs(path) else None
+            except OSError:
+                stat = None
+            _programs[program] = '{}:{}:{}'.format(path, stat.st_size, stat.st_mtime_ns) if stat else program
+
+        identities.append(_programs[program])
+
+    return '\n'.join(identities)
+
+
+def assignment_result_keys(*, spec: 'Spec', supporting_dir: str, skip_web_compile: bool, cwd: str = '.') -> List[str]:
+    """Get the key of each of a spec's files from the (not yet compiled) assignment folder, `cwd`"""
+    snapshot = snapshot_digest(cwd, os.path.join(supporting_dir, spec.id))
+    return [result_key(snapshot=snapshot,
+                       file_spec=file_spec,
+                       supporting_dir=supporting_dir,
+                       skip_compile=skip_web_compile and file_spec.options.web_file)
+            for file_spec in spec.files]
+
+
+def result_key(*, snapshot: str, file_spec: 'SpecFile', supporting_dir: str, skip_compile: bool) -> str:
+    """Hash everything that could change the results of compiling and testing a file"""
+    compile_commands = [parse_command(command, file_name=file_spec.file_name, supporting_dir=supporting_dir)
+                        for command in file_spec.compile_commands]
+    test_commands = [parse_command(command, file_name=file_spec.file_name, supporting_dir=supporting_dir)
+                     for command in file_spec.test_commands if command]
+
+    contents = {
+        'version': CACHE_VERSION,
+        'snapshot': snapshot,
+        'file': file_spec.file_name,
+        'options': asdict(file_spec.options),
+        'skip_compile': skip_compile,
+        'compile_commands': compile_commands,
+        'test_commands': test_commands,
+        'programs': [program_identity(command) for command in compile_commands + test_commands],
+    }
+    return hashlib.sha256(json.dumps(contents, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def cache_path(key: str) -> str:
+    return os.path.join(RESULTS_DIR, key[:2], '{}.json'.format(key))
+
+
+def load_results(key: str) -> Optional[CachedResults]:
+    try:
+        with open(cache_path(key), 'r', encoding='utf-8') as infile:
+            contents = json.load(infile)
+        return CachedResults(compile_results=[CompileResult(**decode_result(result))
+                                              for result in contents['compile_results']],
+                             test_results=[TestResult(**decode_result(result))
+                                           for result in contents['test_results']])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_results(key: str, results: CachedResults):
+    """Store the results of a file, unless a timeout or resource limit makes them unreliable
+
+    Whether either one trips can depend on what else is running (process_limit counts every process the user has),
+    so caching them would make a passing failure permanent for an unchanged folder.
+    """
+    if any(result.status in [RunStatus.TIMEOUT_EXPIRED, RunStatus.RESOURCE_LIMIT_EXCEEDED]
+           for result in [*results.compile_results, *results.test_results]):
+        return
+
+    contents = {'compile_results': [encode_result(asdict(result)) for result in results.compile_results],
+                'test_results': [encode_result(asdict(result)) for result in results.test_results]}
+
+    try:
+        atomic_write(cache_path(key), json.dumps(contents))
+    except OSError:
+        pass
+
+
+def encode_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {**result, 'status': result['status'].name}
+
+
+def decode_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    usage = result.get('usage')
+    return {**result,
+            'status': RunStatus[result['status']],
+            'usage': ResourceUsage(**usage) if usage is not None else None}
@@ -1,4 +1,4 @@
 from .download_specs import create_data_dir
 from .filter_specs import filter_assignments, find_all_specs
 from .load import load_specs
-from .util import check_architecture, check_spec_dependencies, get_filenames
+from .util import check_architecture, check_programs, check_spec_dependencies, get_filenames
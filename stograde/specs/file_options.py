@@ -1,11 +1,17 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
 class FileOptions:
     compile_optional: bool = False
+    cpu_limit: Optional[int] = None  # Seconds
+    file_size_limit: Optional[int] = None  # Megabytes
     hide_contents: bool = False
+    kill_on_truncate: bool = False
+    memory_limit: Optional[int] = None  # Megabytes
     optional: bool = False
+    process_limit: Optional[int] = None
     timeout: int = 4
     truncate_contents: int = 10000
     truncate_output: int = 10000
@@ -13,8 +19,13 @@ class FileOptions:
 
     def update(self, options: dict):
         self.compile_optional = options.get('optional_compile', self.compile_optional)
+        self.cpu_limit = options.get('cpu_limit', self.cpu_limit)
+        self.file_size_limit = options.get('file_size_limit', self.file_size_limit)
         self.hide_contents = options.get('hide_contents', self.hide_contents)
+        self.kill_on_truncate = options.get('kill_on_truncate', self.kill_on_truncate)
+        self.memory_limit = options.get('memory_limit', self.memory_limit)
         self.optional = options.get('optional', self.optional)
+        self.process_limit = options.get('process_limit', self.process_limit)
         self.timeout = options.get('timeout', self.timeout)
         self.truncate_contents = options.get('truncate_contents', self.truncate_contents)
         self.truncate_output = options.get('truncate_output', self.truncate_output)
@@ -3,8 +3,9 @@ import os
 from glob import iglob
 from typing import List, TYPE_CHECKING
 
+from .host_capabilities import host_capabilities
 from .stogradeignore import load_stogradeignore
-from ..specs.util import check_architecture, check_spec_dependencies
+from ..specs.util import check_architecture, check_programs, check_spec_dependencies
 from ..toolkit import global_vars
 
 if TYPE_CHECKING:
@@ -53,11 +54,14 @@ def find_all_specs(spec_dir: str) -> List[str]:
 
 def filter_loaded_specs(specs: List['Spec']) -> List['Spec']:
     """Filters the loaded specs based on properties such as required architecture"""
+    host = host_capabilities()
     remaining_specs: List['Spec'] = []
 
     for spec_to_use in specs:
-        if not check_spec_dependencies(spec_to_use) or not check_architecture(spec_to_use):
+        if not check_spec_dependencies(spec_to_use, host) or not check_architecture(spec_to_use, host):
             continue
+        check_programs(spec_to_use, host)
         remaining_specs.append(spec_to_use)
 
+    host.save()
     return remaining_specs
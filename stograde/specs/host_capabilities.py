@@ -0,0 +1,113 @@
+"""Probe what this machine can grade once, instead of for every spec
+
+Which of the compilers and interpreters that the specs run are installed is remembered in the user's cache
+for a few minutes, so that running the toolkit several times in a row doesn't probe them each time.
+The stored probe is only used on the machine (and architecture) that made it,
+since the cache may be in a home directory that several machines share.
+The architecture itself is read each run, which costs nothing.
+Whether a spec's dependencies exist is only remembered for the rest of the run,
+since those are files that the user may be about to create.
+"""
+
+from dataclasses import dataclass, field
+import json
+import os
+import platform
+import shlex
+import shutil
+import time
+from typing import Dict, Iterable, Optional, Set, TYPE_CHECKING
+
+from ..common.atomic_write import atomic_write
+from ..toolkit.config import CACHE_DIR
+
+if TYPE_CHECKING:
+    from .spec import Spec
+
+PROBE_VERSION = 1
+PROBE_PATH = os.path.join(CACHE_DIR, 'host.json')
+PROBE_TTL = 10 * 60  # Seconds until the stored programs are probed again
+
+# The capabilities of this machine, once they have been probed during this run
+_host: Optional['HostCapabilities'] = None
+
+
+@dataclass
+class HostCapabilities:
+    architecture: str  # Like `uname -m`
+    programs: Dict[str, bool] = field(default_factory=dict)  # Whether each program is installed, by name
+    dependencies: Dict[str, bool] = field(default_factory=dict)  # Whether each dependency exists, by absolute path
+    probed_at: float = 0.0  # When the programs were probed (time.time)
+    changed: bool = False  # Whether any programs were probed since the capabilities were loaded
+
+    def has_program(self, program: str) -> bool:
+        if program not in self.programs:
+            self.programs[program] = shutil.which(program) is not None
+            self.changed = True
+        return self.programs[program]
+
+    def has_dependency(self, path: str) -> bool:
+        path = os.path.abspath(path)
+        if path not in self.dependencies:
+            self.dependencies[path] = os.path.exists(path)
+        return self.dependencies[path]
+
+    def save(self):
+        if not self.changed:
+            return
+
+        contents = {'version': PROBE_VERSION,
+                    'host': platform.node(),
+                    'probed_at': self.probed_at,
+                    'architecture': self.architecture,
+                    'programs': self.programs}
+        try:
+            atomic_write(PROBE_PATH, json.dumps(contents))
+            self.changed = False
+        except OSError:
+            pass
+
+
+def load_host_capabilities(architecture: str) -> Optional[HostCapabilities]:
+    """Load the capabilities that an earlier run on this machine probed, unless they are too old"""
+    try:
+        with open(PROBE_PATH, 'r', encoding='utf-8') as infile:
+            contents = json.load(infile)
+        if contents.get('version') != PROBE_VERSION \
+                or contents.get('host') != platform.node() \
+                or contents.get('architecture') != architecture \
+                or not 0 <= time.time() - contents['probed_at'] < PROBE_TTL:
+            return None
+        return HostCapabilities(architecture=architecture,
+                                programs=dict(contents['programs']),
+                                probed_at=contents['probed_at'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def host_capabilities() -> HostCapabilities:
+    """Get the capabilities of this machine, probing them at most once per run"""
+    global _host
+    if _host is None:
+        architecture = platform.machine()
+        _host = load_host_capabilities(architecture) or HostCapabilities(architecture=architecture,
+                                                                         probed_at=time.time(),
+                                                                         changed=True)
+    return _host
+
+
+def spec_programs(specs: Iterable['Spec']) -> Set[str]:
+    """Find the programs that the specs' commands run, leaving out the files being graded and compiled"""
+    programs = set()
+    for spec in specs:
+        for file_spec in spec.files:
+            for command in [*file_spec.compile_commands, *file_spec.test_commands]:
+                for stage in (command or '').split(' | '):
+                    try:
+                        program = shlex.split(stage)[0]
+                    except (IndexError, ValueError):
+                        continue
+                    if '$' in program or (os.sep in program and not os.path.isabs(program)):
+                        continue
+                    programs.add(program)
+    return programs
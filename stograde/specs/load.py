@@ -1,10 +1,13 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+import logging
 import os
 import sys
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from .filter_specs import filter_loaded_specs, get_spec_paths
-from .spec import create_spec
-from ..common import chdir
+from .spec_cache import load_spec_cache
+from ..common.repo_cache import find_git_dirs
 from ..common.run import run
 from ..common.run_status import RunStatus
 
@@ -12,12 +15,20 @@ if TYPE_CHECKING:
     from .spec import Spec
 
 
-def load_specs(wanted_specs: List[str], data_dir: str, skip_spec_update: bool = False) -> List['Spec']:
+def load_specs(wanted_specs: List[str],
+               data_dir: str,
+               skip_spec_update: bool = False,
+               spec_fetch: Optional['Future[RunStatus]'] = None) -> List['Spec']:
     """Load the desired specs from the specs/ directory, filtering out any that are missing
 
+    If a `spec_fetch` was started in the background, any updates that it found are pulled first.
+    Otherwise, the specs are checked for updates unless `skip_spec_update` is set.
+
     data/ directory should exist by this point with a repository
     """
-    if not skip_spec_update:
+    if spec_fetch is not None:
+        apply_spec_updates(data_dir, spec_fetch.result())
+    elif not skip_spec_update:
         check_for_spec_updates(data_dir)
 
     # the repo has a /specs directory
@@ -25,27 +36,66 @@ def load_specs(wanted_specs: List[str], data_dir: str, skip_spec_update: bool =
 
     specs_to_load = get_spec_paths(wanted_specs, spec_dir)
 
-    loaded_specs = [create_spec(filename, spec_dir) for filename in specs_to_load]  # Create list of Specs
+    # Create list of Specs, only parsing the spec files that changed since the last run
+    spec_cache = load_spec_cache(data_dir)
+    loaded_specs = [spec_cache.load_spec(filename, spec_dir) for filename in specs_to_load]
+    spec_cache.save()
     loaded_specs = filter_loaded_specs(loaded_specs)
 
     return loaded_specs
 
 
-def check_for_spec_updates(data_dir: str):
-    """Check if the specs have any updates using git fetch"""
-    with chdir(data_dir):
-        res, _, _ = run(['git', 'fetch', 'origin'])
+def spec_update_due(data_dir: str, interval: timedelta) -> bool:
+    """Whether the spec repository was last fetched more than `interval` ago (or never)"""
+    git_dirs = find_git_dirs(data_dir)
+    if git_dirs is None:
+        return False
+
+    try:
+        # git rewrites FETCH_HEAD after every successful fetch, even if nothing changed
+        fetched = datetime.fromtimestamp(os.path.getmtime(os.path.join(git_dirs[0], 'FETCH_HEAD')))
+    except OSError:
+        return True
+
+    return fetched < datetime.now() - interval
+
+
+def start_spec_fetch(data_dir: str, interval: timedelta) -> Optional['Future[RunStatus]']:
+    """Fetch the spec repository in the background, if it wasn't fetched within `interval`
+
+    Pass the result to load_specs, which pulls any updates that the fetch found before loading the specs.
+    """
+    if not spec_update_due(data_dir, interval):
+        logging.debug('Specs were fetched less than {} ago'.format(interval))
+        return None
 
-        if res is not RunStatus.SUCCESS:
-            print("Error fetching specs", file=sys.stderr)
+    executor = ThreadPoolExecutor(max_workers=1)
+    spec_fetch = executor.submit(fetch_specs, data_dir)
+    executor.shutdown(wait=False)
+    return spec_fetch
 
-        _, out, _ = run(['git', 'log', 'HEAD..origin/master'])
+
+def fetch_specs(data_dir: str) -> RunStatus:
+    res, _, _ = run(['git', 'fetch', 'origin'], cwd=data_dir)
+    return res
+
+
+def apply_spec_updates(data_dir: str, fetch_status: RunStatus):
+    """Pull the specs if the last fetch found any updates"""
+    if fetch_status is not RunStatus.SUCCESS:
+        print("Error fetching specs", file=sys.stderr)
+
+    _, out, _ = run(['git', 'log', 'HEAD..origin/master'], cwd=data_dir)
 
     if not out:
         return
     elif 'commit' in out:
         print("Spec updates found - Updating", file=sys.stderr)
-        with chdir(data_dir):
-            run(['git', 'pull', 'origin', 'master'])
+        run(['git', 'pull', 'origin', 'master'], cwd=data_dir)
     else:
         print("git log failed", file=sys.stderr)
+
+
+def check_for_spec_updates(data_dir: str):
+    """Check if the specs have any updates using git fetch"""
+    apply_spec_updates(data_dir, fetch_specs(data_dir))
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 import os
-from typing import List, TYPE_CHECKING, Optional
+from typing import List, TYPE_CHECKING, Optional, Union
 import yaml
 
 from .spec_file import create_spec_file
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
     from .spec_file import SpecFile
     from .supporting_file import SupportingFile
 
+# The LibYAML loader is much faster than the pure-Python one, when PyYAML was built with it
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 @dataclass
 class Spec:
@@ -22,8 +25,13 @@ class Spec:
 
 
 def create_spec(yaml_path: str, basedir: str) -> Spec:
-    with open(os.path.join(basedir, yaml_path), 'r', encoding='utf-8') as yaml_file:
-        loaded_file = yaml.safe_load(yaml_file)
+    with open(os.path.join(basedir, yaml_path), 'rb') as yaml_file:
+        return parse_spec(yaml_file.read())
+
+
+def parse_spec(contents: Union[bytes, str]) -> Spec:
+    """Create a Spec from the contents of a spec file"""
+    loaded_file = yaml.load(contents, Loader=SafeLoader)
 
     assert 'assignment' in loaded_file
 
@@ -32,10 +40,12 @@ def create_spec(yaml_path: str, basedir: str) -> Spec:
                     folder=loaded_file.get('folder', loaded_file['assignment']),
                     architecture=loaded_file.get('architecture', None))
 
-    # assignment files
+    # assignment files, with any options that apply to all of them
+    spec_options = loaded_file.get('options', {})
+    assert isinstance(spec_options, dict)
     if loaded_file.get('files', None) is not None:
         for file in loaded_file['files']:
-            file_spec = create_spec_file(file)
+            file_spec = create_spec_file(file, spec_options)
 
             if loaded_file.get('tests', None) is not None:
                 file_spec.add_from_tests(loaded_file['tests'])
@@ -0,0 +1,103 @@
+"""Keep the specs that were parsed from YAML, so that each run only parses the spec files that changed
+
+Entries are keyed by each spec file's path, modification time and contents,
+and are all dropped when the data repository's HEAD or refs move.
+The cache is stored in the data repository's git directory, next to its git metadata cache.
+"""
+
+from dataclasses import dataclass, field
+import hashlib
+import logging
+import os
+import pickle
+from typing import Dict, Optional, TYPE_CHECKING
+
+from .spec import parse_spec
+from ..common.atomic_write import atomic_write
+from ..common.repo_cache import find_git_dirs, ref_fingerprint
+from ..common.version import version
+
+if TYPE_CHECKING:
+    from .spec import Spec
+
+CACHE_FILE = 'stograde-specs.pickle'
+CACHE_VERSION = 1
+# Every supported Python can read protocol 4, so a data directory can be shared between interpreters
+PICKLE_PROTOCOL = 4
+
+
+@dataclass
+class CachedSpec:
+    mtime_ns: int  # When the spec file was last modified
+    digest: str  # Hash of the spec file's contents
+    spec: 'Spec'
+
+
+@dataclass
+class SpecCache:
+    """Parsed specs, valid for as long as the data repository's HEAD and refs don't move"""
+    path: Optional[str]  # Where the cache is stored, or None if the specs aren't in a git repository
+    fingerprint: str  # Hash of HEAD and every ref when the entries were parsed
+    entries: Dict[str, CachedSpec] = field(default_factory=dict)
+    changed: bool = False  # Whether any entries were added since the cache was loaded
+
+    def load_spec(self, yaml_path: str, basedir: str) -> 'Spec':
+        """Like create_spec, but only parse the file if it has changed since it was cached"""
+        path = os.path.join(basedir, yaml_path)
+        with open(path, 'rb') as yaml_file:
+            contents = yaml_file.read()
+            mtime_ns = os.fstat(yaml_file.fileno()).st_mtime_ns
+        digest = hashlib.sha256(contents).hexdigest()
+
+        key = os.path.relpath(path, basedir)
+        cached = self.entries.get(key)
+        if cached is not None and cached.mtime_ns == mtime_ns and cached.digest == digest:
+            return cached.spec
+
+        logging.debug('Parsing spec {}'.format(key))
+        spec = parse_spec(contents)
+        self.entries[key] = CachedSpec(mtime_ns=mtime_ns, digest=digest, spec=spec)
+        self.changed = True
+        return spec
+
+    def save(self):
+        if self.path is None or not self.changed:
+            return
+
+        contents = {'version': CACHE_VERSION, 'stograde': version, 'fingerprint': self.fingerprint,
+                    'entries': self.entries}
+        try:
+            atomic_write(self.path, pickle.dumps(contents, protocol=PICKLE_PROTOCOL), 'wb')
+            self.changed = False
+        except OSError:
+            pass
+
+
+def load_spec_cache(data_dir: str) -> SpecCache:
+    """Load the cache of parsed specs of the data repository at `data_dir`
+
+    Specs parsed at different refs, or by another version of stograde, are dropped.
+    Without a git repository, nothing is stored, and every spec is parsed each time.
+    """
+    git_dirs = find_git_dirs(data_dir)
+    if git_dirs is None:
+        return SpecCache(path=None, fingerprint='')
+
+    git_dir, common_dir = git_dirs
+    cache = SpecCache(path=os.path.join(git_dir, CACHE_FILE), fingerprint=ref_fingerprint(git_dir, common_dir))
+
+    try:
+        with open(cache.path, 'rb') as infile:
+            contents = pickle.load(infile)
+    except Exception:
+        # Unpickling can fail in many ways (like a protocol or class that this Python doesn't have),
+        # and any of them only means that the specs have to be parsed again
+        return cache
+
+    if isinstance(contents, dict) \
+            and contents.get('version') == CACHE_VERSION \
+            and contents.get('stograde') == version \
+            and contents.get('fingerprint') == cache.fingerprint:
+        cache.entries = contents.get('entries', {})
+
+    return cache
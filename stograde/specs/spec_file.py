@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Union, Dict
+from typing import List, Optional, Union, Dict
 
 from .file_options import FileOptions
 
@@ -42,11 +42,13 @@ class SpecFile:
         return self
 
 
-def create_spec_file(file_spec: Union[Dict, List]) -> SpecFile:
+def create_spec_file(file_spec: Union[Dict, List], spec_options: Optional[Dict] = None) -> SpecFile:
     """Create a new SpecFile instance
 
     :param file_spec: A `dict` or `list` with the file specifications
+    :param spec_options: The `dict` under the spec's `options:`, which the file's own options override
     """
+    spec_options = spec_options or {}
 
     if isinstance(file_spec, dict):
         assert 'file' in file_spec
@@ -63,7 +65,7 @@ def create_spec_file(file_spec: Union[Dict, List]) -> SpecFile:
         assert isinstance(test_commands, list)
 
         file_options = file_spec.get('options', {})
-        options = FileOptions().update(file_options)
+        options = FileOptions().update(spec_options).update(file_options)
 
     elif isinstance(file_spec, list):  # legacy spec support
         file_name = file_spec[0]
@@ -71,7 +73,7 @@ def create_spec_file(file_spec: Union[Dict, List]) -> SpecFile:
         test_commands = []
         option_list = [opt for opt in file_spec[1:] if isinstance(opt, dict)]
         option_dict = {k: v for opt in option_list for k, v in opt.items()}
-        options = FileOptions().update(option_dict)
+        options = FileOptions().update(spec_options).update(option_dict)
 
     else:
         raise TypeError('Cannot parse "files:": incorrect data type for a file: {}'.format(type(file_spec)))
@@ -1,9 +1,8 @@
-import os
 import logging
 import sys
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
-from ..common.run import run
+from .host_capabilities import host_capabilities, HostCapabilities, spec_programs
 from ..toolkit import global_vars
 
 if TYPE_CHECKING:
@@ -15,26 +14,24 @@ def get_filenames(spec: 'Spec') -> List[str]:
     return [file.file_name for file in spec.files if not file.options.optional]
 
 
-def check_spec_dependencies(spec: 'Spec') -> bool:
+def check_spec_dependencies(spec: 'Spec', host: Optional[HostCapabilities] = None) -> bool:
+    host = host or host_capabilities()
     all_dependencies_present = True
     for filepath in spec.dependencies:
-        try:
-            os.stat(filepath)
-        except FileNotFoundError:
+        if not host.has_dependency(filepath):
             logging.warning('Skipping {}: required file "{}" could not be found'.format(spec.id, filepath))
             all_dependencies_present = False
     return all_dependencies_present
 
 
 def get_user_architecture() -> str:
-    """Get the user's architecture with 'uname -m'"""
-    _, user_arch, _ = run(['uname', '-m'])
-    return user_arch.rstrip()
+    """Get the user's architecture, like 'uname -m'"""
+    return host_capabilities().architecture
 
 
-def check_architecture(spec: 'Spec') -> bool:
+def check_architecture(spec: 'Spec', host: Optional[HostCapabilities] = None) -> bool:
     """Checks that the user is running the right architecture to test this spec"""
-    user_arch = get_user_architecture()
+    user_arch = (host or host_capabilities()).architecture
     spec_arch = spec.architecture
 
     if spec_arch is None or spec_arch == user_arch:
@@ -47,3 +44,20 @@ def check_architecture(spec: 'Spec') -> bool:
                   .format(spec.id, spec.architecture, user_arch),
                   file=sys.stderr)
         return False
+
+
+def check_programs(spec: 'Spec', host: Optional[HostCapabilities] = None) -> bool:
+    """Warn about any compilers or interpreters that this spec runs which aren't installed
+
+    The spec is still recorded, so that the missing program shows up in its results.
+    """
+    host = host or host_capabilities()
+    missing = sorted(program for program in spec_programs([spec]) if not host.has_program(program))
+
+    for program in missing:
+        if global_vars.CI:
+            logging.warning('{} runs {}, which is not installed'.format(spec.id, program))
+        else:
+            print('{} runs {}, which is not installed'.format(spec.id, program), file=sys.stderr)
+
+    return not missing
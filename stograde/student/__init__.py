@@ -5,5 +5,5 @@ from .process_student import prepare_student
 from .pull import pull
 from .record_student import record_student
 from .remove import remove
-from .reset import reset
 from .stash import stash
+from .sync import sync_students
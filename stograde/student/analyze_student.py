@@ -1,8 +1,7 @@
 import logging
 import os
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Set
 
-from ..common import chdir
 from ..process_assignment.assignment_status import AssignmentStatus
 from ..process_assignment.assignment_type import AssignmentType, get_assignment_type
 from ..process_assignment.warning_unmerged_branches import find_unmerged_branches
@@ -11,19 +10,26 @@ from ..toolkit import global_vars
 
 if TYPE_CHECKING:
     from ..specs.spec import Spec
+    from ..student.git_tree import Tree
     from ..student.student_result import StudentResult
 
 
-def analyze_student(student: 'StudentResult', specs: List['Spec'], check_for_branches: bool):
+def analyze_student(student: 'StudentResult',
+                    specs: List['Spec'],
+                    check_for_branches: bool,
+                    directory: str = '',
+                    tree: Optional['Tree'] = None):
+    """Find which assignments a student has turned in, either from their checkout in `directory`
+    or from a `tree` read from git"""
     logging.debug("Analyzing {}'s assignments".format(student.name))
 
-    directory = student.name if not global_vars.CI else '.'
+    if not directory:
+        directory = student.name if not global_vars.CI else '.'
     analyses = {}
-    with chdir(directory):
-        if check_for_branches and not global_vars.CI:
-            find_unmerged_branches(student)
-        for spec in specs:
-            analyses[spec.id] = analyze_assignment(spec)
+    if check_for_branches and not global_vars.CI:
+        find_unmerged_branches(student, directory)
+    for spec in specs:
+        analyses[spec.id] = analyze_assignment(spec, tree, cwd=directory)
 
     for name, analysis in analyses.items():
         a_type = get_assignment_type(name)
@@ -35,22 +41,32 @@ def analyze_student(student: 'StudentResult', specs: List['Spec'], check_for_bra
             student.worksheets[name] = analysis
 
 
-def analyze_assignment(spec: 'Spec') -> AssignmentStatus:
-    if not os.path.exists(spec.folder):
+def analyze_assignment(spec: 'Spec', tree: Optional['Tree'] = None, *, cwd: str = '.') -> AssignmentStatus:
+    if tree is not None:
+        folder = os.path.normpath(spec.folder)
+        if folder not in tree:
+            logging.debug('Cannot analyze assignment in directory {}: Does not exist'.format(spec.folder))
+            return AssignmentStatus.MISSING
+        return compare_files(tree[folder], spec)
+
+    folder = os.path.join(cwd, spec.folder)
+    if not os.path.exists(folder):
         logging.debug('Cannot analyze assignment in directory {}: Does not exist'.format(spec.folder))
         return AssignmentStatus.MISSING
 
-    with chdir(spec.folder):
-        files_that_do_exist = set(os.listdir('.'))
-        files_which_should_exist = set(get_filenames(spec))
-        intersection_of = files_that_do_exist.intersection(files_which_should_exist)
-
-        if intersection_of == files_which_should_exist:
-            # if every file that should exist, does: we're good.
-            return AssignmentStatus.SUCCESS
-        elif intersection_of:
-            # if some files that should exist, do: it's a partial assignment
-            return AssignmentStatus.PARTIAL
-        else:
-            # otherwise, none of the required files are there
-            return AssignmentStatus.MISSING
+    return compare_files(set(os.listdir(folder)), spec)
+
+
+def compare_files(files_that_do_exist: Set[str], spec: 'Spec') -> AssignmentStatus:
+    files_which_should_exist = set(get_filenames(spec))
+    intersection_of = files_that_do_exist.intersection(files_which_should_exist)
+
+    if intersection_of == files_which_should_exist:
+        # if every file that should exist, does: we're good.
+        return AssignmentStatus.SUCCESS
+    elif intersection_of:
+        # if some files that should exist, do: it's a partial assignment
+        return AssignmentStatus.PARTIAL
+    else:
+        # otherwise, none of the required files are there
+        return AssignmentStatus.MISSING
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..specs.spec import Spec
+
+
+@dataclass
+class AssignmentTask:
+    """One student's assignment to record, which can run alongside the student's other assignments"""
+    student: str  # The student's username
+    spec: 'Spec'  # The spec to record
+
+    def __str__(self) -> str:
+        return '{}/{}'.format(self.student, self.spec.id)
@@ -1,17 +1,20 @@
 import logging
 from typing import Optional
 
-from ..common import chdir, run
+from ..common import run
 
 
 def checkout_date(student: str, date: Optional[str] = None):
     if date:
         logging.debug("Checking out commits in {}'s repository before {}".format(student, date))
-        with chdir(student):
-            _, rev, _ = run(['git', 'rev-list', '-n', '1', '--before="{} 18:00"'.format(date), 'master'])
-        checkout_ref(student, rev.rstrip())
+        checkout_ref(student, find_rev_before(student, date))
+
+
+def find_rev_before(student: str, date: str) -> str:
+    """Find the last commit on a student's master before 6pm on `date`"""
+    _, rev, _ = run(['git', 'rev-list', '-n', '1', '--before="{} 18:00"'.format(date), 'master'], cwd=student)
+    return rev.rstrip()
 
 
 def checkout_ref(student: str, ref: str):
-    with chdir(student):
-        run(['git', 'checkout', ref, '--force', '--quiet'])
+    run(['git', 'checkout', ref, '--force', '--quiet'], cwd=student)
@@ -1,32 +1,56 @@
 import logging
 import sys
 from os import path
-from typing import Optional
+from typing import Iterable, Optional
 
+from .reference import reference_clone_options
+from .sparse import SPARSE_CLONE_OPTIONS, init_sparse_checkout
 from ..common import run
 from ..common.run_status import RunStatus
 
 
-def clone_student(student: str, base_url: str):
+def clone_student(student: str,
+                  base_url: str,
+                  sparse: bool = False,
+                  folders: Iterable[str] = (),
+                  shared_objects: bool = False):
     logging.debug("Cloning {}'s repository".format(student))
     if not path.exists(student):
-        clone_url('{}/{}.git'.format(base_url, student))
+        clone_url(student_url(student, base_url), into=student if sparse else None,
+                  sparse=sparse, shared_objects=shared_objects)
+        if sparse:
+            init_sparse_checkout(student, folders)
 
 
-def clone_url(url: str, into: Optional[str] = None):
+def student_url(student: str, base_url: str) -> str:
+    return '{}/{}.git'.format(base_url, student)
+
+
+def clone_url(url: str, into: Optional[str] = None, sparse: bool = False, shared_objects: bool = False):
+    options = (SPARSE_CLONE_OPTIONS if sparse else []) + reference_clone_options(shared_objects)
     if into:
         logging.info('cloning {} into {}'.format(url, into))
-        status, output, _ = run(['git', 'clone', '--quiet', url, into])
+        status, output, _ = run(['git', 'clone', '--quiet', *options, url, into])
     else:
         logging.info('cloning {}'.format(url))
-        status, output, _ = run(['git', 'clone', '--quiet', url])
+        status, output, _ = run(['git', 'clone', '--quiet', *options, url])
+
+    error = clone_error(url, status, output)
+    if error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    elif status is not RunStatus.SUCCESS:
+        print('Could not clone {}: {}'.format(url, output.strip()), file=sys.stderr)
 
+
+def clone_error(url: str, status: RunStatus, output: str) -> str:
+    """Explain why a clone failed, if it failed in a way that we recognize"""
     if status is RunStatus.CALLED_PROCESS_ERROR:
         if 'Permission denied (publickey)' in output:
-            print('Permission denied when cloning from {}'.format(url), file=sys.stderr)
-            print('Make sure that this SSH key is registered with StoGit.', file=sys.stderr)
-            sys.exit(1)
+            return ('Permission denied when cloning from {}\n'
+                    'Make sure that this SSH key is registered with StoGit.'.format(url))
 
         if 'The project you were looking for could not be found.' in output:
-            print('Could not find repository {}'.format(url), file=sys.stderr)
-            sys.exit(1)
+            return 'Could not find repository {}'.format(url)
+
+    return ''
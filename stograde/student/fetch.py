@@ -0,0 +1,48 @@
+import logging
+import sys
+from typing import List
+
+from .pull import pull_error
+from .remote_heads import MASTER, master_checked_out
+from ..common import run
+from ..common.run_status import RunStatus
+
+# Build outputs that a hard reset leaves behind because they are untracked
+BUILD_OUTPUTS = ['*.exec']
+
+# Bare repositories made with `git clone --bare` don't have a fetch refspec, so give one explicitly
+MIRROR_REFSPEC = ['+refs/heads/*:refs/heads/*']
+
+
+def fetch_and_reset(student: str):
+    """Make a student's repository match origin/master, discarding any local changes"""
+    logging.debug("Resetting {}'s repository to origin/master".format(student))
+    _, changed_files, _ = run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=student)
+    status, output, _ = run(['git', 'fetch', '--quiet', 'origin', 'master'], cwd=student)
+
+    if status is RunStatus.SUCCESS:
+        # Move master rather than a detached HEAD left behind by an interrupted run with --date
+        if not master_checked_out(student):
+            run(['git', 'symbolic-ref', 'HEAD', MASTER], cwd=student)
+        run(['git', 'reset', '--hard', '--quiet', 'FETCH_HEAD'], cwd=student)
+        run(['git', 'clean', '-fqx', '--', *BUILD_OUTPUTS], cwd=student)
+
+    if status is not RunStatus.SUCCESS:
+        print(pull_error(student, status, output) or 'Could not fetch {}: {}'.format(student, output.strip()),
+              file=sys.stderr)
+    elif changed_files:
+        print(discarded_changes_warning(student, changed_files), file=sys.stderr)
+
+
+def fetch_mirror(student: str):
+    """Update every branch of a bare repository, which has no working tree to pull into"""
+    logging.debug("Fetching {}'s repository".format(student))
+    status, output, _ = run(['git', 'fetch', '--quiet', 'origin', *MIRROR_REFSPEC], cwd=student)
+
+    if status is not RunStatus.SUCCESS:
+        print('Could not fetch {}: {}'.format(student, output.strip()), file=sys.stderr)
+
+
+def discarded_changes_warning(student: str, changed_files: str) -> str:
+    files: List[str] = [line[3:] for line in changed_files.splitlines() if line]
+    return 'Discarded local changes to {} in {}'.format(', '.join(files), student)
@@ -0,0 +1,41 @@
+import logging
+import os
+from typing import Dict, Set
+
+from .checkout import find_rev_before
+from ..common import run
+from ..common.run_status import RunStatus
+
+# Maps each folder in a commit (with '' for the top level) to the names of the files and folders inside it
+Tree = Dict[str, Set[str]]
+
+
+def read_tree(student: str, date: str = '') -> Tree:
+    """List every folder of a student's master, or their last commit before `date`, with a single `git ls-tree`
+
+    This works without a checkout, so the student's repository may be a bare mirror.
+    """
+    logging.debug("Reading {}'s files from git".format(student))
+    rev = find_rev_before(student, date) if date else 'master'
+    tree: Tree = {}
+    if not rev:
+        return tree
+
+    status, output, _ = run(['git', 'ls-tree', '-r', '-z', '--name-only', rev], cwd=student)
+
+    if status is not RunStatus.SUCCESS:
+        return tree
+
+    for path in output.split('\0'):
+        if not path:
+            continue
+        parts = path.split('/')
+        for depth in range(len(parts)):
+            tree.setdefault('/'.join(parts[:depth]), set()).add(parts[depth])
+
+    return tree
+
+
+def is_bare_repository(student: str) -> bool:
+    """Check whether a student's folder is a bare repository (such as one made with `git clone --mirror`)"""
+    return not os.path.exists(os.path.join(student, '.git')) and os.path.isfile(os.path.join(student, 'HEAD'))
@@ -1,16 +1,25 @@
-from typing import List, TYPE_CHECKING
+from typing import Collection, Iterable, List, TYPE_CHECKING
 
 from .analyze_student import analyze_student
-from .record_student import record_student
+from .record_student import record_assignment, record_student
+from ..common import load_history_index
+from ..common.process_group import reap_groups
+from ..process_assignment.record_result import RecordResult
+from ..process_assignment.warning_unmerged_branches import find_unmerged_branches
 from ..student import checkout_date, clone_student
+from ..student.fetch import fetch_and_reset, fetch_mirror
+from ..student.git_tree import is_bare_repository, read_tree
 from ..student.pull import pull
 from ..student.remove import remove
-from ..student.reset import reset
+from ..student.sparse import widen_sparse_checkout
 from ..student.stash import stash
+from ..student.sync_strategy import SyncStrategy
+from ..student.worktree import student_checkout
 from ..student.student_result import StudentResult
 from ..toolkit import global_vars
 
 if TYPE_CHECKING:
+    from .assignment_task import AssignmentTask
     from ..specs.spec import Spec
 
 
@@ -21,38 +30,98 @@ def process_student(
         basedir: str,
         clean: bool,
         date: str,
+        from_git: bool = False,
         interact: bool,
         record: bool,
         skip_branch_check: bool,
         skip_repo_update: bool,
+        skip_result_cache: bool = False,
         skip_web_compile: bool,
+        shared_objects: bool = False,
+        sparse: bool = False,
         specs: List['Spec'],
-        stogit_url: str
+        stogit_url: str,
+        sync_strategy: SyncStrategy = SyncStrategy.PULL,
+        up_to_date: Collection[str] = ()
 ) -> StudentResult:
     try:
         prepare_student(student,
                         stogit_url,
                         do_clean=clean,
                         do_clone=not global_vars.CI and not skip_repo_update,
-                        do_pull=not global_vars.CI and not skip_repo_update,
+                        do_pull=not global_vars.CI and not skip_repo_update and student not in up_to_date,
                         do_checkout=not global_vars.CI,
-                        date=date)
+                        sparse=sparse,
+                        shared_objects=shared_objects,
+                        folders=[spec.folder for spec in specs] if not from_git else [],
+                        sync_strategy=sync_strategy)
 
         student_result = StudentResult(name=student)
 
-        if record:
-            record_student(student=student_result, specs=specs, basedir=basedir,
-                           interact=interact, skip_web_compile=skip_web_compile)
+        if from_git:
+            # There is nothing to record without a checkout, and the tree can be read straight from git
+            analyze_student(student=student_result, specs=specs, check_for_branches=not skip_branch_check,
+                            tree=read_tree(student, date))
+        else:
+            with student_checkout(student, date) as directory:
+                if record:
+                    record_student(student=student_result, specs=specs, basedir=basedir, directory=directory,
+                                   interact=interact, skip_result_cache=skip_result_cache,
+                                   skip_web_compile=skip_web_compile)
 
-        if analyze:
-            analyze_student(student=student_result, specs=specs, check_for_branches=not skip_branch_check)
+                if analyze:
+                    analyze_student(student=student_result, specs=specs, check_for_branches=not skip_branch_check,
+                                    directory=directory)
+
+        return finish_student(student_result)
+
+    except Exception as err:
+        if global_vars.DEBUG:
+            raise err
+        else:
+            return StudentResult(name=student, error=str(err))
+
+    finally:
+        # Don't let anything that a student's programs left running slow down the next students
+        reap_groups()
+
+
+def prepare_for_recording(
+        student: str,
+        *,
+        analyze: bool,
+        clean: bool,
+        shared_objects: bool = False,
+        skip_repo_update: bool,
+        sparse: bool = False,
+        specs: List['Spec'],
+        stogit_url: str,
+        sync_strategy: SyncStrategy = SyncStrategy.PULL,
+        up_to_date: Collection[str] = ()
+) -> StudentResult:
+    """Sync a student's repository and do everything about them that doesn't depend on one assignment,
+    so that each of their assignments can then be recorded on its own with grade_assignment"""
+    try:
+        prepare_student(student,
+                        stogit_url,
+                        do_clean=clean,
+                        do_clone=not global_vars.CI and not skip_repo_update,
+                        do_pull=not global_vars.CI and not skip_repo_update and student not in up_to_date,
+                        do_checkout=not global_vars.CI,
+                        sparse=sparse,
+                        shared_objects=shared_objects,
+                        folders=[spec.folder for spec in specs],
+                        sync_strategy=sync_strategy)
 
-        if student_result.unmerged_branches:
-            for result in student_result.results:
-                result.warnings.unmerged_branches = student_result.unmerged_branches
+        student_result = StudentResult(name=student)
+
+        if specs:
+            find_unmerged_branches(student_result, student)
+            # Walk the history now, so that every assignment can load it from the repository's cache
+            load_history_index(student)
 
-        if date:
-            reset(student)
+        if analyze:
+            analyze_student(student=student_result, specs=specs, check_for_branches=False, directory=student)
 
         return student_result
 
@@ -62,6 +131,49 @@ def process_student(
         else:
             return StudentResult(name=student, error=str(err))
 
+    finally:
+        reap_groups()
+
+
+def grade_assignment(
+        task: 'AssignmentTask',
+        *,
+        basedir: str,
+        interact: bool,
+        skip_result_cache: bool = False,
+        skip_web_compile: bool
+) -> RecordResult:
+    """Record one assignment of a student whose repository prepare_for_recording has synced"""
+    try:
+        return record_assignment(student=StudentResult(name=task.student),
+                                 spec=task.spec,
+                                 basedir=basedir,
+                                 directory=task.student,
+                                 interact=interact,
+                                 skip_result_cache=skip_result_cache,
+                                 skip_web_compile=skip_web_compile,
+                                 history=load_history_index(task.student))
+
+    except Exception as err:
+        if global_vars.DEBUG:
+            raise err
+        else:
+            result = RecordResult(spec_id=task.spec.id, student=task.student)
+            result.warnings.recording_err = str(err)
+            return result
+
+    finally:
+        reap_groups()
+
+
+def finish_student(student_result: StudentResult) -> StudentResult:
+    """Warn about unmerged branches on each of a student's assignments"""
+    if student_result.unmerged_branches:
+        for result in student_result.results:
+            result.warnings.unmerged_branches = student_result.unmerged_branches
+
+    return student_result
+
 
 def prepare_student(student: str,
                     stogit_url: str,
@@ -69,14 +181,24 @@ def prepare_student(student: str,
                     do_clone: bool,
                     do_pull: bool,
                     do_checkout: bool,
-                    date: str = '') -> str:
+                    date: str = '',
+                    sparse: bool = False,
+                    shared_objects: bool = False,
+                    folders: Iterable[str] = (),
+                    sync_strategy: SyncStrategy = SyncStrategy.PULL) -> str:
     if do_clean:
         remove(student)
     if do_clone:
-        clone_student(student, base_url=stogit_url)
-    if do_pull:
+        clone_student(student, base_url=stogit_url, sparse=sparse, folders=folders, shared_objects=shared_objects)
+    if do_pull and is_bare_repository(student):
+        fetch_mirror(student)
+    elif do_pull and sync_strategy is SyncStrategy.RESET:
+        fetch_and_reset(student)
+    elif do_pull:
         stash(student)
         pull(student)
+    if folders:
+        widen_sparse_checkout(student, folders)
     if do_checkout:
         checkout_date(student, date=date)
 
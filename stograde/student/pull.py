@@ -1,15 +1,23 @@
 import logging
 import sys
 
-from ..common import chdir, run
+from ..common import run
 from ..common.run_status import RunStatus
 
 
 def pull(student: str):
     logging.debug("Pulling {}'s repository".format(student))
-    with chdir(student):
-        status, output, _ = run(['git', 'pull', '--quiet', 'origin', 'master'])
+    status, output, _ = run(['git', 'pull', '--quiet', 'origin', 'master'], cwd=student)
 
+    error = pull_error(student, status, output)
+    if error:
+        print(error, file=sys.stderr)
+
+
+def pull_error(student: str, status: RunStatus, output: str) -> str:
+    """Explain why a pull failed, if it failed in a way that we recognize"""
     if status is RunStatus.CALLED_PROCESS_ERROR and 'not a git repository' in output:
-        print('Student directory {} is not a git repository'.format(student), file=sys.stderr)
-        print('Try running "stograde repo reclone"', file=sys.stderr)
+        return ('Student directory {} is not a git repository\n'
+                'Try running "stograde repo reclone"'.format(student))
+
+    return ''
@@ -1,14 +1,16 @@
 import logging
 import os
-from typing import TYPE_CHECKING, List
+import time
+from typing import TYPE_CHECKING, List, Optional
 
-from ..common import chdir
+from ..common import load_history_index
 from ..process_assignment.process_assignment import process_assignment
 from ..process_assignment.record_result import RecordResult
 from ..process_assignment.warning_unmerged_branches import find_unmerged_branches
 from ..toolkit import global_vars
 
 if TYPE_CHECKING:
+    from ..common.history_index import HistoryIndex
     from ..specs.spec import Spec
     from ..student.student_result import StudentResult
 
@@ -17,28 +19,58 @@ def record_student(*,
                    student: 'StudentResult',
                    specs: List['Spec'],
                    basedir: str,
+                   directory: str = '',
                    interact: bool,
+                   skip_result_cache: bool = False,
                    skip_web_compile: bool):
     results = []
     if specs:
-        directory = student.name if not global_vars.CI else '.'
-        with chdir(directory):
-            find_unmerged_branches(student)
-
-            for spec in specs:
-                logging.debug("Recording {}'s {}".format(student.name, spec.id))
-                if os.path.exists(spec.folder):
-                    with chdir(spec.folder):
-                        assignment_result: RecordResult = process_assignment(student=student,
-                                                                             spec=spec,
-                                                                             basedir=basedir,
-                                                                             interact=interact,
-                                                                             skip_web_compile=skip_web_compile)
-                else:
-                    assignment_result = RecordResult(spec_id=spec.id,
-                                                     student=student.name)
-                    assignment_result.warnings.assignment_missing = True
-
-                results.append(assignment_result)
+        if not directory:
+            directory = student.name if not global_vars.CI else '.'
+        find_unmerged_branches(student, directory)
+
+        # Walk the repository's history at most once and share it between every assignment
+        history = load_history_index(directory)
+
+        for spec in specs:
+            results.append(record_assignment(student=student,
+                                             spec=spec,
+                                             basedir=basedir,
+                                             directory=directory,
+                                             interact=interact,
+                                             skip_result_cache=skip_result_cache,
+                                             skip_web_compile=skip_web_compile,
+                                             history=history))
 
     student.results = results
+
+
+def record_assignment(*,
+                      student: 'StudentResult',
+                      spec: 'Spec',
+                      basedir: str,
+                      directory: str,
+                      interact: bool,
+                      skip_result_cache: bool = False,
+                      skip_web_compile: bool,
+                      history: Optional['HistoryIndex'] = None) -> RecordResult:
+    """Record one of a student's assignments from their checkout in `directory`"""
+    logging.debug("Recording {}'s {}".format(student.name, spec.id))
+    folder = os.path.join(directory, spec.folder)
+    if not os.path.exists(folder):
+        assignment_result = RecordResult(spec_id=spec.id,
+                                         student=student.name)
+        assignment_result.warnings.assignment_missing = True
+        return assignment_result
+
+    start = time.perf_counter()
+    assignment_result = process_assignment(student=student,
+                                           spec=spec,
+                                           basedir=basedir,
+                                           interact=interact,
+                                           skip_result_cache=skip_result_cache,
+                                           skip_web_compile=skip_web_compile,
+                                           history=history,
+                                           cwd=folder)
+    assignment_result.duration = time.perf_counter() - start
+    return assignment_result
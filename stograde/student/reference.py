@@ -0,0 +1,56 @@
+"""Share the objects that every student's repository has in common through a reference repository
+
+Student repositories start from the same starter code, so clones made with `git clone --reference`
+borrow those objects from one bare repository (through .git/objects/info/alternates)
+instead of downloading and storing a copy each.
+The reference repository must not be deleted while any clone that borrows from it still exists.
+"""
+
+import logging
+import os
+from typing import List
+
+from .sparse import is_partial_clone
+from ..common import run
+from ..common.run_status import RunStatus
+
+REFERENCE_REPO = '.reference.git'
+
+
+def reference_clone_options(shared_objects: bool) -> List[str]:
+    """Extra arguments for `git clone` to borrow objects from the reference repository, if it exists"""
+    if not shared_objects:
+        return []
+    return ['--reference-if-able', os.path.abspath(REFERENCE_REPO)]
+
+
+def update_reference_repo(students: List[str], starter_url: str, *, include_local: bool):
+    """Create the reference repository if needed, and fetch the latest shared objects into it
+
+    `starter_url` is the remote of the first student, which provides the starter code and anything added
+    to it since. With `include_local`, every student's existing clone is copied in as well,
+    so that removing and recloning them only downloads what is new.
+    """
+    if not students:
+        return
+
+    if not os.path.exists(REFERENCE_REPO):
+        logging.debug('Creating the reference repository')
+        status, output, _ = run(['git', 'init', '--quiet', '--bare', REFERENCE_REPO])
+        if status is not RunStatus.SUCCESS:
+            logging.warning('Could not create the reference repository: {}'.format(output.strip()))
+            return
+        # A force-pushed student could leave objects that other clones borrow unreachable, so never prune any
+        run(['git', 'config', 'gc.pruneExpire', 'never'], cwd=REFERENCE_REPO)
+
+    sources = [(students[0], starter_url)]
+    if include_local:
+        # Fetching from a partial clone would make it download everything it left out first
+        sources += [(student, os.path.abspath(student)) for student in students
+                    if os.path.isdir(student) and not is_partial_clone(student)]
+
+    for student, source in sources:
+        logging.debug("Fetching {}'s objects into the reference repository".format(student))
+        # Keep a ref to everything fetched, so that the objects other clones borrow are never pruned
+        run(['git', 'fetch', '--quiet', '--no-tags', source, '+refs/heads/master:refs/students/{}'.format(student)],
+            cwd=REFERENCE_REPO)
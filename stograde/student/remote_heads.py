@@ -0,0 +1,98 @@
+"""Find which student repositories already match their remote before updating them
+
+`git ls-remote` only asks the server for the sha of master, so checking the whole class
+at once is much cheaper than stashing and pulling every repository.
+"""
+
+import asyncio
+import logging
+import os
+from typing import List, Optional, Set
+
+from .git_tree import is_bare_repository
+from ..common.repo_cache import read_bytes
+from ..common.run import run_async, run_until_complete
+from ..common.run_status import RunStatus
+
+MASTER = 'refs/heads/master'
+
+
+def find_up_to_date(students: List[str], *, concurrency: int) -> Set[str]:
+    """Find the students whose master is checked out, has no local changes, and matches origin's master,
+    asking up to `concurrency` remotes at once"""
+    return run_until_complete(find_up_to_date_async(students, concurrency=concurrency))
+
+
+async def find_up_to_date_async(students: List[str], *, concurrency: int) -> Set[str]:
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def check(student: str) -> Optional[str]:
+        local = local_master(student)
+        if not local:
+            return None
+        async with semaphore:
+            remote = await remote_master(student)
+            # Local changes still have to be stashed (or reset) before grading
+            if remote != local or await has_local_changes(student):
+                return None
+        return student
+
+    checked = await asyncio.gather(*[check(student) for student in students])
+    return {student for student in checked if student is not None}
+
+
+async def remote_master(student: str) -> str:
+    """Ask a student's remote for the sha of its master branch"""
+    logging.debug("Checking {}'s remote".format(student))
+    status, output, _ = await run_async(['git', 'ls-remote', '--quiet', 'origin', MASTER], cwd=student)
+    if status is not RunStatus.SUCCESS:
+        return ''
+
+    for line in output.splitlines():
+        sha, _, ref = line.partition('\t')
+        if ref == MASTER:
+            return sha
+    return ''
+
+
+async def has_local_changes(student: str) -> bool:
+    """Check whether a student's tracked files were changed since the last commit"""
+    if is_bare_repository(student):
+        return False
+    status, output, _ = await run_async(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=student)
+    return status is not RunStatus.SUCCESS or bool(output)
+
+
+def local_master(student: str) -> str:
+    """Read the sha of a student's master without running git
+
+    Returns an empty string if master is not checked out, such as after an interrupted run with --date.
+    """
+    git_dir = find_git_dir(student)
+    if not master_checked_out(student):
+        return ''
+
+    loose = read_bytes(os.path.join(git_dir, MASTER)).strip()
+    if loose:
+        return loose.decode('utf-8')
+
+    for line in read_bytes(os.path.join(git_dir, 'packed-refs')).splitlines():
+        sha, _, ref = line.partition(b' ')
+        if ref.strip() == MASTER.encode('utf-8'):
+            return sha.decode('utf-8')
+    return ''
+
+
+def master_checked_out(student: str) -> bool:
+    return read_bytes(os.path.join(find_git_dir(student), 'HEAD')).strip() == b'ref: ' + MASTER.encode('utf-8')
+
+
+def find_git_dir(student: str) -> str:
+    """Find a student's .git directory, which is the repository itself if it is bare"""
+    git_dir = os.path.join(student, '.git')
+    return git_dir if os.path.exists(git_dir) else student
+
+
+def report_up_to_date(up_to_date: Set[str], students: List[str]):
+    if up_to_date:
+        print('{} of {} repositories are already up to date'.format(len(up_to_date), len(students)))
@@ -0,0 +1,87 @@
+"""Keep student repositories as partial clones that only check out the assignments being graded
+
+A partial clone downloads commits and trees but leaves file contents on the server until they are
+needed, and a cone-mode sparse checkout only writes the listed folders (plus top-level files) to disk.
+"""
+
+import configparser
+import logging
+import os
+from typing import Iterable, List, Optional, Set
+
+from ..common import run
+
+# Extra arguments for `git clone`: skip every blob until it is checked out, and only check out the top level
+SPARSE_CLONE_OPTIONS = ['--filter=blob:none', '--sparse']
+
+
+def sparse_checkout_commands(folders: Iterable[str]) -> List[List[str]]:
+    """The commands that limit a freshly cloned repository to `folders`"""
+    commands = [['git', 'sparse-checkout', 'init', '--cone']]
+    folders = sorted(set(folders))
+    if folders:
+        commands.append(['git', 'sparse-checkout', 'set', *folders])
+    return commands
+
+
+def sparse_checkout_folders(student: str) -> Optional[Set[str]]:
+    """Read which folders a student's sparse checkout includes without running git
+
+    Returns None if the repository does not use a cone-mode sparse checkout.
+    """
+    git_dir = os.path.join(student, '.git')
+    try:
+        if not read_git_config(student).getboolean('core', 'sparsecheckout', fallback=False):
+            return None
+        with open(os.path.join(git_dir, 'info', 'sparse-checkout'), 'r', encoding='utf-8') as infile:
+            patterns = [line.strip() for line in infile]
+    except (configparser.Error, ValueError, OSError):
+        return None
+
+    # In cone mode, "/hw1/" includes a folder, while the parents of nested
+    # folders are listed as "/a/" and then excluded again with "!/a/*/"
+    included = {pattern[1:-1] for pattern in patterns
+                if len(pattern) > 2 and pattern.startswith('/') and pattern.endswith('/')}
+    parents_only = {pattern[2:-3] for pattern in patterns
+                    if pattern.startswith('!/') and pattern.endswith('/*/')}
+
+    return included - parents_only
+
+
+def is_partial_clone(student: str) -> bool:
+    """Check whether a student's repository was cloned without some of its objects"""
+    try:
+        return read_git_config(student).has_option('extensions', 'partialclone')
+    except configparser.Error:
+        return False
+
+
+def read_git_config(student: str) -> configparser.ConfigParser:
+    """Read a student's repository config, which is close enough to INI for simple lookups"""
+    git_dir = os.path.join(student, '.git')
+    config = configparser.ConfigParser(strict=False, interpolation=None)
+    # Newer versions of git keep some settings in the per-worktree config
+    config.read([os.path.join(git_dir, 'config'), os.path.join(git_dir, 'config.worktree')], encoding='utf-8')
+    return config
+
+
+def missing_sparse_folders(student: str, folders: Iterable[str]) -> List[str]:
+    """Find which of `folders` a sparse checkout would have to add, if the repository is sparse at all"""
+    current = sparse_checkout_folders(student)
+    if current is None:
+        return []
+    return sorted(set(folders) - current)
+
+
+def init_sparse_checkout(student: str, folders: Iterable[str]):
+    logging.debug("Limiting {}'s checkout to {}".format(student, ', '.join(sorted(set(folders))) or 'the top level'))
+    for command in sparse_checkout_commands(folders):
+        run(command, cwd=student)
+
+
+def widen_sparse_checkout(student: str, folders: Iterable[str]):
+    """Add any of `folders` that a sparse checkout is missing, downloading their contents"""
+    missing = missing_sparse_folders(student, folders)
+    if missing:
+        logging.debug("Adding {} to {}'s checkout".format(', '.join(missing), student))
+        run(['git', 'sparse-checkout', 'add', *missing], cwd=student)
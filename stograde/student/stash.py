@@ -1,16 +1,15 @@
 import logging
 
-from ..common import chdir, run
+from ..common import run
 
 
 def stash(student: str):
     logging.debug("Stashing {}'s repository".format(student))
-    with chdir(student):
-        if has_changed_files():
-            run(['git', 'stash', '-u'])
-            run(['git', 'stash', 'clear'])
+    if has_changed_files(student):
+        run(['git', 'stash', '-u'], cwd=student)
+        run(['git', 'stash', 'clear'], cwd=student)
 
 
-def has_changed_files() -> bool:
-    _, output, _ = run(['git', 'status', '--porcelain'])
+def has_changed_files(student: str) -> bool:
+    _, output, _ = run(['git', 'status', '--porcelain'], cwd=student)
     return bool(output)
@@ -0,0 +1,108 @@
+"""Clone and update many students' repositories at once in a pool of threads
+
+Cloning and pulling spend nearly all of their time waiting on the network,
+so they run in threads with their own concurrency limit instead of tying up a worker process each.
+"""
+
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from dataclasses import dataclass
+import os
+import sys
+from typing import List, Set
+
+from .clone import student_url
+from .process_student import prepare_student
+from .reference import update_reference_repo
+from .remote_heads import find_up_to_date, report_up_to_date
+from .sync_strategy import SyncStrategy
+from ..toolkit import global_vars
+from ..toolkit.progress_bar import make_progress_bar
+
+
+@dataclass
+class SyncResult:
+    """The outcome of preparing a student's repository"""
+    student: str  # The student's username
+    error: str = ''  # Why the repository could not be prepared
+
+
+def sync_students(students: List[str],
+                  stogit_url: str,
+                  *,
+                  do_clean: bool,
+                  do_clone: bool,
+                  do_pull: bool,
+                  sparse: bool = False,
+                  shared_objects: bool = False,
+                  sync_strategy: SyncStrategy = SyncStrategy.PULL,
+                  concurrency: int,
+                  no_progress_bar: bool) -> List[SyncResult]:
+    """Prepare every student's repository, running up to `concurrency` of them at once"""
+    up_to_date: Set[str] = set()
+    if do_pull and not do_clean:
+        up_to_date = find_up_to_date(students, concurrency=concurrency)
+        report_up_to_date(up_to_date, students)
+
+    if do_clone and shared_objects and students:
+        # Before any repositories are removed, so that they can donate their objects
+        update_reference_repo(students, student_url(students[0], stogit_url), include_local=do_clean)
+
+    print_progress = make_progress_bar(students, no_progress_bar=no_progress_bar)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        futures = [pool.submit(sync_student,
+                               student,
+                               stogit_url,
+                               do_clean=do_clean,
+                               do_clone=do_clone,
+                               do_pull=do_pull and student not in up_to_date,
+                               sparse=sparse,
+                               shared_objects=shared_objects,
+                               sync_strategy=sync_strategy)
+                   for student in students]
+        for future in as_completed(futures):
+            result = future.result()
+            print_progress(result.student)
+            results.append(result)
+
+    return results
+
+
+def sync_student(student: str,
+                 stogit_url: str,
+                 *,
+                 do_clean: bool,
+                 do_clone: bool,
+                 do_pull: bool,
+                 sparse: bool = False,
+                 shared_objects: bool = False,
+                 sync_strategy: SyncStrategy = SyncStrategy.PULL) -> SyncResult:
+    """Prepare one student's repository without checking out a date,
+    so that a problem with it doesn't stop the other students
+
+    The steps print their own errors as they happen.
+    """
+    url = student_url(student, stogit_url)
+    try:
+        prepare_student(student,
+                        stogit_url,
+                        do_clean=do_clean,
+                        do_clone=do_clone,
+                        do_pull=do_pull,
+                        do_checkout=False,
+                        sparse=sparse,
+                        shared_objects=shared_objects,
+                        sync_strategy=sync_strategy)
+    except SystemExit:
+        # clone_url exits once it has printed why the clone failed
+        return SyncResult(student=student, error='Could not clone {}'.format(url))
+    except Exception as err:
+        if global_vars.DEBUG:
+            raise err
+        print('\n{}'.format(err), file=sys.stderr)
+        return SyncResult(student=student, error=str(err))
+
+    if do_clone and not os.path.exists(student):
+        return SyncResult(student=student, error='Could not clone {}'.format(url))
+    return SyncResult(student=student)
@@ -0,0 +1,6 @@
+from enum import auto, Enum
+
+
+class SyncStrategy(Enum):
+    PULL = auto()  # Stash any local changes, then merge origin/master with `git pull`
+    RESET = auto()  # Fetch origin/master and hard reset to it, throwing away local changes
@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+import hashlib
+import logging
+import os
+import shutil
+from typing import Iterator
+
+from .checkout import find_rev_before
+from .remote_heads import find_git_dir
+from ..common import run
+from ..common.run_status import RunStatus
+
+# Where dated worktrees are checked out, inside each student's git directory
+DATED_DIR = 'stograde-dated'
+
+
+@contextmanager
+def student_checkout(student: str, date: str) -> Iterator[str]:
+    """Yield the directory to grade a student in: a worktree of their last commit before `date`,
+    or an empty string (meaning their own checkout) if there is no date"""
+    if date:
+        with dated_worktree(student, date) as path:
+            yield path
+    else:
+        yield ''
+
+
+@contextmanager
+def dated_worktree(student: str, date: str) -> Iterator[str]:
+    """Check out a student's last commit before `date` into a temporary worktree, and yield its path
+
+    The student's own checkout is left alone, so dated and normal runs can share the students directory.
+    If there were no commits before `date`, the yielded directory is empty.
+    Each date always gets the same directory, so that whatever a run that was killed left there is removed first.
+    """
+    logging.debug("Checking out commits in {}'s repository before {}".format(student, date))
+    rev = find_rev_before(student, date)
+    path = dated_worktree_path(student, date)
+
+    if os.path.exists(path):
+        remove_worktree(student, path)
+    # Forget any other worktrees whose directories are gone
+    run(['git', 'worktree', 'prune'], cwd=student)
+    os.makedirs(path)
+
+    added = False
+    if rev:
+        status, _, _ = run(['git', 'worktree', 'add', '--detach', '--quiet', path, rev], cwd=student)
+        added = status is RunStatus.SUCCESS
+
+    try:
+        yield path
+    finally:
+        if added:
+            remove_worktree(student, path)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def dated_worktree_path(student: str, date: str) -> str:
+    # Dates like "2 hrs ago" aren't safe to use as directory names
+    key = hashlib.sha1(date.encode('utf-8')).hexdigest()[:12]
+    return os.path.abspath(os.path.join(find_git_dir(student), DATED_DIR, key))
+
+
+def remove_worktree(student: str, path: str):
+    run(['git', 'worktree', 'remove', '--force', path], cwd=student)
+    shutil.rmtree(path, ignore_errors=True)
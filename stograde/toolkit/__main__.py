@@ -8,10 +8,13 @@ from typing import TYPE_CHECKING, List
 from . import global_vars
 from .args import process_args
 from .check_dependencies import check_dependencies
+from .config import conf
 from .create_students_dir import create_students_dir
 from .find_update import update_available
 from .stogit_url import compute_stogit_url
 from ..specs import create_data_dir, filter_assignments, find_all_specs, load_specs
+from ..specs.load import start_spec_fetch
+from ..student.sync_strategy import SyncStrategy
 
 if TYPE_CHECKING:
     from ..specs.spec import Spec
@@ -26,6 +29,13 @@ def main():
     skip_dependency_check: bool = args['skip_dependency_check']
     skip_version_check: bool = args['skip_version_check']
     stogit: str = args.get('stogit', '')
+    skip_spec_update: bool = args.get('skip_spec_update', False)
+    data_dir = os.path.join(base_dir, 'data')
+
+    spec_fetch = None
+    if not skip_spec_update and command not in ['drive', 'repo'] and os.path.exists(data_dir):
+        # Fetch the specs while the version and dependencies are checked
+        spec_fetch = start_spec_fetch(data_dir, conf.get_spec_update_interval())
 
     if not skip_version_check:
         current_version, new_version = update_available()
@@ -58,7 +68,10 @@ def main():
                      stogit_url=stogit_url,
                      base_dir=base_dir,
                      no_progress_bar=args['no_progress_bar'],
-                     workers=args['workers'])
+                     shared_objects=args['shared_objects'],
+                     sparse=args['sparse'],
+                     sync_strategy=SyncStrategy[args['sync_strategy'].upper()],
+                     sync_workers=args['sync_workers'])
         return  # stograde repo does not use the functionality below, so return
 
     if command == 'table':
@@ -66,16 +79,17 @@ def main():
                        for path in find_all_specs(os.path.join(base_dir, 'data', 'specs'))]
 
     date: str = args.get('date', '')
-    skip_spec_update: bool = args.get('skip_spec_update', False)
 
     if date:
         print('Checking out {}'.format(date))
 
     assignments = filter_assignments(assignments)
 
+    # The fetch (if any) was started above, so only apply what it found
     loaded_specs: List['Spec'] = load_specs(assignments,
-                                            data_dir=os.path.join(base_dir, 'data'),
-                                            skip_spec_update=skip_spec_update)
+                                            data_dir=data_dir,
+                                            skip_spec_update=True,
+                                            spec_fetch=spec_fetch)
 
     if not loaded_specs:
         if global_vars.CI:
@@ -39,8 +39,14 @@ def build_argparser():
                               help='Enable debugging mode (throw errors, implies -w1)')
     base_options.add_argument('--no-progress-bar', action='store_true',
                               help='Hide the progress bar')
-    base_options.add_argument('--workers', '-w', type=int, default=os.cpu_count(), metavar='N',
-                              help='The number of operations to perform in parallel')
+
+    # Parallel grading options
+    worker_options = argparse.ArgumentParser(add_help=False)
+    worker_options.add_argument('--workers', '-w', type=int, default=os.cpu_count(), metavar='N',
+                                help='The number of operations to perform in parallel')
+    worker_options.add_argument('--engine', choices=['process', 'thread'], default='process',
+                                help='Run parallel operations in separate processes, '
+                                     'or in threads (which skips copying specs and results between processes)')
 
     # Repository url modifiers
     repo_selection = argparse.ArgumentParser(add_help=False)
@@ -52,6 +58,23 @@ def build_argparser():
     repo_selection.add_argument('--stogit', metavar='URL',
                                 help='Use an alternate stogit base URL (eg, git@stogit.cs.stolaf.edu:sd/s17)')
 
+    # Repository syncing options
+    sync_options = argparse.ArgumentParser(add_help=False)
+    sync_options.add_argument('--sync-workers', type=int, default=32, metavar='N',
+                              help='The number of repositories to clone, update or check for updates at once')
+    sync_options.add_argument('--sync-strategy', choices=['pull', 'reset'], default='pull',
+                              help='How to update repositories: stash local changes and pull, or fetch and hard reset '
+                                   'to origin/master (faster, but throws away local changes)')
+
+    # Cloning options
+    clone_options = argparse.ArgumentParser(add_help=False)
+    clone_options.add_argument('--sparse', action='store_true',
+                               help='Clone new repositories without file contents, checking out only the folders '
+                                    'of the assignments being processed (later runs add folders as needed)')
+    clone_options.add_argument('--shared-objects', action='store_true',
+                               help='Store the objects that student repositories have in common once, '
+                                    'in students/.reference.git, and borrow them when cloning')
+
     # Recording options
     record_options = argparse.ArgumentParser(add_help=False)
     record_options.add_argument('--clean', action='store_true',
@@ -104,8 +127,9 @@ def build_argparser():
 
     # Record SubParser
     parser_record = sub_parsers.add_parser('record', help="Record students' work",
-                                           parents=[base_options, record_options, compile_options,
-                                                    repo_selection, table_options, student_selection],
+                                           parents=[base_options, worker_options, record_options, clone_options,
+                                                    sync_options, compile_options, repo_selection, table_options,
+                                                    student_selection],
                                            conflict_handler='resolve')
     parser_record.set_defaults(func=do_record)  # Set function to run from subcommands.py
     parser_record.add_argument('assignments', nargs='+', metavar='HW',
@@ -118,31 +142,39 @@ def build_argparser():
                                help="Interact with each student's submission individually")
     parser_record.add_argument('--skip-branch-check', '-B', action='store_true',
                                help='Do not check for unmerged branches')
+    parser_record.add_argument('--skip-result-cache', action='store_true',
+                               help='Compile and test every file, instead of reusing the results of identical files')
+    parser_record.add_argument('--show-usage', action='store_true',
+                               help='Show how much time and memory each command used, in the logs and the table')
 
     # Repo SubParser
     parser_repo = sub_parsers.add_parser('repo', help='Tools for cloning and updating student repositories',
                                          conflict_handler='resolve')
     repo_sub_parsers = parser_repo.add_subparsers()
     repo_sub_parsers.add_parser('clean', aliases=['reclone'], help='Remove and reclone student repositories',
-                                parents=[base_options, repo_selection, student_selection],
+                                parents=[base_options, repo_selection, student_selection, clone_options, sync_options],
                                 conflict_handler='resolve'
                                 ).set_defaults(func=do_repo_clean)  # Set function to run from subcommands.py
     repo_sub_parsers.add_parser('update', aliases=['clone'], help='Clone and/or update student repos',
-                                parents=[base_options, repo_selection, student_selection],
+                                parents=[base_options, repo_selection, student_selection, clone_options, sync_options],
                                 conflict_handler='resolve'
                                 ).set_defaults(func=do_repo_update)  # Set function to run from subcommands.py
 
     # Table SubParser
     parser_table = sub_parsers.add_parser('table', help='Print an table of the assignments submitted by students',
-                                          parents=[base_options, record_options, compile_options, repo_selection,
-                                                   table_options, student_selection],
+                                          parents=[base_options, worker_options, record_options, clone_options,
+                                                   sync_options, compile_options, repo_selection, table_options,
+                                                   student_selection],
                                           conflict_handler='resolve')
     parser_table.set_defaults(func=do_table)  # Set function to run from subcommands.py
+    parser_table.add_argument('--from-git', action='store_true',
+                              help='Read which files were turned in from git instead of the checked out files '
+                                   '(works with bare mirrors, and makes --date much faster)')
 
     # Web SubParser
     parser_web = sub_parsers.add_parser('web', help='Run the CLI for grading React App files',
-                                        parents=[base_options, record_options, compile_options,
-                                                 repo_selection, student_selection],
+                                        parents=[base_options, worker_options, record_options, clone_options,
+                                                 compile_options, repo_selection, student_selection],
                                         conflict_handler='resolve')
     parser_web.set_defaults(func=do_web)  # Set function to run from subcommands.py
     parser_web.add_argument('assignments', nargs=1, metavar='HW',
@@ -5,6 +5,9 @@ import os
 
 _dirs = AppDirs('stograde', 'StoDevX')
 
+# Where the caches that outlast a run are kept
+CACHE_DIR = _dirs.user_cache_dir
+
 
 class Config:
     _filename = os.path.join(_dirs.user_config_dir, 'stograde.ini')
@@ -37,6 +40,10 @@ class Config:
     def needs_update_check(self):
         return self.get_last_update_check() < datetime.now() - timedelta(minutes=15)
 
+    def get_spec_update_interval(self) -> timedelta:
+        """How long to go without checking the spec repository for updates, set in minutes"""
+        return timedelta(minutes=self._config.getfloat('general', 'spec_update_interval', fallback=15))
+
     def save_config(self):
         with open(self._filename, 'w', encoding='utf-8') as outfile:
             self._config.write(outfile)
@@ -0,0 +1,6 @@
+from enum import auto, Enum
+
+
+class Engine(Enum):
+    PROCESS = auto()  # Grade students in a pool of forked processes
+    THREAD = auto()  # Grade students in a pool of threads, which share this process's memory
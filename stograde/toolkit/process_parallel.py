@@ -1,8 +1,10 @@
-from concurrent.futures import as_completed, ProcessPoolExecutor
+from concurrent.futures import as_completed
 import functools
 import logging
-from typing import List, Callable, Any
+from typing import Callable, Any, List
 
+from .engine import Engine
+from .worker_pool import WorkerPool
 from ..toolkit.progress_bar import make_progress_bar
 
 
@@ -10,15 +12,16 @@ def process_parallel(students: List[str],
                      no_progress_bar: bool,
                      workers: int,
                      operation: functools.partial,
-                     progress_indicator: Callable[[Any], str] = lambda value: value) -> List:
+                     progress_indicator: Callable[[Any], str] = lambda value: value,
+                     engine: Engine = Engine.PROCESS) -> List:
     results = []
 
     if workers > 1:
         print_progress = make_progress_bar(students, no_progress_bar=no_progress_bar)
-        with ProcessPoolExecutor(max_workers=workers) as pool:
-            futures = [pool.submit(operation, name) for name in students]
+        with WorkerPool(operation, engine=engine, workers=workers) as pool:
+            futures = [pool.submit(name) for name in students]
             for future in as_completed(futures):
-                completed_student = future.result()
+                completed_student = pool.result(future)
                 print_progress(progress_indicator(completed_student))
                 results.append(completed_student)
     else:
@@ -0,0 +1,91 @@
+"""Sync students' repositories and record their assignments at the same time, in separate pools
+
+Syncing mostly waits on the network, and recording mostly waits on compilers and tests,
+so a student's assignments start recording as soon as their repository is ready,
+while other repositories are still syncing.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import functools
+import heapq
+from typing import Callable, Dict, List, Set, Tuple, TYPE_CHECKING
+
+from .engine import Engine
+from .progress_bar import make_progress_bar
+from .worker_pool import WorkerPool
+from ..student.assignment_task import AssignmentTask
+
+if TYPE_CHECKING:
+    from ..process_assignment.record_result import RecordResult
+    from ..specs.spec import Spec
+    from ..student.student_result import StudentResult
+
+
+def sync_then_grade(students: List[str],
+                    *,
+                    specs: List['Spec'],
+                    prepare: Callable[[str], 'StudentResult'],
+                    grade: Callable[[AssignmentTask], 'RecordResult'],
+                    order: List[AssignmentTask],
+                    engine: Engine,
+                    no_progress_bar: bool,
+                    sync_workers: int,
+                    workers: int) -> Tuple[List['StudentResult'], List['RecordResult']]:
+    """Prepare each student in a pool of `sync_workers` threads, and grade each of their assignments
+    in a pool of `workers` as soon as they are ready
+
+    Only `workers` assignments are handed to the grading pool at once,
+    so that whichever ready assignment comes first in `order` is always the next one to start.
+    The grading workers are given `grade` and the specs when they start, so each task only names its assignment.
+    """
+    rank = {str(task): index for index, task in enumerate(order)}
+    remaining = {student: len(specs) for student in students}
+    print_progress = make_progress_bar(students, no_progress_bar=no_progress_bar)
+
+    prepared: List['StudentResult'] = []
+    graded: List['RecordResult'] = []
+    ready: List[Tuple[int, str, AssignmentTask]] = []
+
+    # Enter the grading pool first, so that its processes are forked before any syncing threads exist
+    with WorkerPool(functools.partial(grade_by_id, grade=grade, specs={spec.id: spec for spec in specs}),
+                    engine=engine,
+                    workers=workers) as grade_pool, \
+            ThreadPoolExecutor(max_workers=sync_workers) as sync_pool:
+        syncing: Set[Future] = {sync_pool.submit(prepare, student) for student in students}
+        grading: Set[Future] = set()
+
+        while syncing or grading or ready:
+            while ready and len(grading) < workers:
+                _, _, task = heapq.heappop(ready)
+                grading.add(grade_pool.submit((task.student, task.spec.id)))
+
+            done, _ = wait(syncing | grading, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in syncing:
+                    syncing.remove(future)
+                    student = future.result()
+                    prepared.append(student)
+                    if student.error or not specs:
+                        print_progress(student.name)
+                        continue
+                    for spec in specs:
+                        task = AssignmentTask(student=student.name, spec=spec)
+                        heapq.heappush(ready, (rank.get(str(task), len(rank)), str(task), task))
+                else:
+                    grading.remove(future)
+                    result = grade_pool.result(future)
+                    graded.append(result)
+                    remaining[result.student] -= 1
+                    if not remaining[result.student]:
+                        print_progress(result.student)
+
+    return prepared, graded
+
+
+def grade_by_id(task_id: Tuple[str, str],
+                *,
+                grade: Callable[[AssignmentTask], 'RecordResult'],
+                specs: Dict[str, 'Spec']) -> 'RecordResult':
+    """Grade the assignment named by a (student, spec id) pair"""
+    student, spec_id = task_id
+    return grade(AssignmentTask(student=student, spec=specs[spec_id]))
@@ -1,11 +1,21 @@
 import functools
-from typing import List
+from typing import Dict, List, Set
 
+from . import global_vars
+from .engine import Engine
 from .process_parallel import process_parallel
+from .process_stages import sync_then_grade
+from .student_timings import load_timings, order_longest_first, order_tasks_longest_first, save_timings, Timings
 from ..common import chdir
+from ..process_assignment.record_result import RecordResult
 from ..specs.spec import Spec
-from ..student.process_student import process_student
+from ..student.assignment_task import AssignmentTask
+from ..student.clone import student_url
+from ..student.process_student import finish_student, grade_assignment, prepare_for_recording, process_student
+from ..student.reference import update_reference_repo
+from ..student.remote_heads import find_up_to_date, report_up_to_date
 from ..student.student_result import StudentResult
+from ..student.sync_strategy import SyncStrategy
 
 
 def process_students(specs: List['Spec'],
@@ -15,35 +25,155 @@ def process_students(specs: List['Spec'],
                      base_dir: str,
                      clean: bool,
                      date: str,
+                     engine: Engine = Engine.PROCESS,
+                     from_git: bool = False,
                      interact: bool,
                      no_progress_bar: bool,
                      record: bool,
                      skip_branch_check: bool,
                      skip_repo_update: bool,
+                     skip_result_cache: bool = False,
                      skip_web_compile: bool,
+                     shared_objects: bool = False,
+                     sparse: bool = False,
                      stogit_url: str,
+                     sync_strategy: SyncStrategy,
+                     sync_workers: int,
                      workers: int,
                      work_dir: str) -> List['StudentResult']:
     with chdir(work_dir):
-        single_analysis = functools.partial(
-            process_student,
-            analyze=analyze,
-            basedir=base_dir,
-            clean=clean,
-            date=date,
-            interact=interact,
-            skip_branch_check=skip_branch_check,
-            skip_repo_update=skip_repo_update,
-            record=record,
-            specs=specs,
-            skip_web_compile=skip_web_compile,
-            stogit_url=stogit_url
-        )
-
-        results: List['StudentResult'] = process_parallel(students,
-                                                          no_progress_bar,
-                                                          workers,
-                                                          single_analysis,
-                                                          progress_indicator=lambda value: value.name)
+        up_to_date: Set[str] = set()
+        if not clean and not skip_repo_update and not global_vars.CI:
+            up_to_date = find_up_to_date(students, concurrency=sync_workers)
+            report_up_to_date(up_to_date, students)
+
+        if shared_objects and not skip_repo_update and not global_vars.CI and students:
+            update_reference_repo(students, student_url(students[0], stogit_url), include_local=clean)
+
+        timings = load_timings(base_dir) if record else {}
+
+        if record and workers > 1 and by_assignment(specs, date=date, from_git=from_git, interact=interact):
+            results = process_assignments(specs,
+                                          students,
+                                          analyze=analyze,
+                                          base_dir=base_dir,
+                                          clean=clean,
+                                          engine=engine,
+                                          no_progress_bar=no_progress_bar,
+                                          skip_repo_update=skip_repo_update,
+                                          skip_result_cache=skip_result_cache,
+                                          skip_web_compile=skip_web_compile,
+                                          shared_objects=shared_objects,
+                                          sparse=sparse,
+                                          stogit_url=stogit_url,
+                                          sync_strategy=sync_strategy,
+                                          sync_workers=sync_workers,
+                                          timings=timings,
+                                          up_to_date=up_to_date,
+                                          workers=workers)
+        else:
+            single_analysis = functools.partial(
+                process_student,
+                analyze=analyze,
+                basedir=base_dir,
+                clean=clean,
+                date=date,
+                from_git=from_git,
+                interact=interact,
+                skip_branch_check=skip_branch_check,
+                skip_repo_update=skip_repo_update,
+                skip_result_cache=skip_result_cache,
+                record=record,
+                specs=specs,
+                skip_web_compile=skip_web_compile,
+                shared_objects=shared_objects,
+                sparse=sparse,
+                stogit_url=stogit_url,
+                sync_strategy=sync_strategy,
+                up_to_date=up_to_date
+            )
+
+            if record and workers > 1:
+                students = order_longest_first(students, [spec.id for spec in specs], timings)
+
+            results = process_parallel(students,
+                                       no_progress_bar,
+                                       workers,
+                                       single_analysis,
+                                       progress_indicator=lambda value: value.name,
+                                       engine=engine)
+
+        if record and not interact:
+            save_timings(base_dir, timings, results)
 
     return results
+
+
+def by_assignment(specs: List['Spec'], *, date: str, from_git: bool, interact: bool) -> bool:
+    """Whether each of a student's assignments can be recorded as its own task
+
+    A dated checkout only lasts as long as one task, and assignments that share a folder would trip over each other.
+    """
+    folders = [spec.folder for spec in specs]
+    return not date and not from_git and not interact and len(set(folders)) == len(folders)
+
+
+def process_assignments(specs: List['Spec'],
+                        students: List[str],
+                        *,
+                        analyze: bool,
+                        base_dir: str,
+                        clean: bool,
+                        engine: Engine,
+                        no_progress_bar: bool,
+                        skip_repo_update: bool,
+                        skip_result_cache: bool,
+                        skip_web_compile: bool,
+                        shared_objects: bool,
+                        sparse: bool,
+                        stogit_url: str,
+                        sync_strategy: SyncStrategy,
+                        sync_workers: int,
+                        timings: Timings,
+                        up_to_date: Set[str],
+                        workers: int) -> List['StudentResult']:
+    """Sync every student, recording each (student, assignment) pair as its own task once the student is ready,
+    so that a student with many slow assignments is spread over the whole pool"""
+    prepare = functools.partial(prepare_for_recording,
+                                analyze=analyze,
+                                clean=clean,
+                                shared_objects=shared_objects,
+                                skip_repo_update=skip_repo_update,
+                                sparse=sparse,
+                                specs=specs,
+                                stogit_url=stogit_url,
+                                sync_strategy=sync_strategy,
+                                up_to_date=up_to_date)
+    grade = functools.partial(grade_assignment,
+                              basedir=base_dir,
+                              interact=False,
+                              skip_result_cache=skip_result_cache,
+                              skip_web_compile=skip_web_compile)
+
+    # Estimate every task before anything is synced, since that changes the sizes of the repositories
+    tasks = [AssignmentTask(student=student, spec=spec) for student in students for spec in specs]
+    prepared, graded = sync_then_grade(order_longest_first(students, [spec.id for spec in specs], timings),
+                                       specs=specs,
+                                       prepare=prepare,
+                                       grade=grade,
+                                       order=order_tasks_longest_first(tasks, timings),
+                                       engine=engine,
+                                       no_progress_bar=no_progress_bar,
+                                       sync_workers=sync_workers,
+                                       workers=workers)
+
+    # Put each student's assignments back together, in the order of the specs
+    by_student: Dict[str, Dict[str, RecordResult]] = {}
+    for result in graded:
+        by_student.setdefault(result.student, {})[result.spec_id] = result
+    for student in prepared:
+        if not student.error:
+            student.results = [by_student[student.name][spec.id] for spec in specs]
+            finish_student(student)
+
+    return prepared
@@ -8,6 +8,11 @@ CHAR = '·' if sys.stderr.encoding == 'UTF-8' else '='
 def progress_bar(size: int, current: int, message: str = ''):
     cols, _ = get_terminal_size()
 
+    # Leave room for the message when there are more items than fit in half of the terminal
+    width = min(size, cols // 2)
+    current = current * width // size if size else 0
+    size = width
+
     filled = [CHAR for _ in range(current)]
     empty = [' ' for _ in range(size - current)]
     bar = ''.join(filled + empty)
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import sys
@@ -52,13 +53,14 @@ def send_recording_to_gist(table: str, results: List['FormattedResult'], assignm
 def save_recordings(results: List['StudentResult'],
                     table: str,
                     gist: bool = False,
-                    format_type: 'FormatType' = FormatType.MD):
+                    format_type: 'FormatType' = FormatType.MD,
+                    show_usage: bool = False):
     """Take the list of recordings, group by assignment, then save to disk"""
 
     if format_type is FormatType.MD:
-        formatter = markdown
+        formatter = functools.partial(markdown, show_usage=show_usage)
     elif format_type is FormatType.HTML:
-        formatter = html
+        formatter = functools.partial(html, show_usage=show_usage)
     else:
         raise ValueError('Unrecognized formatter')
 
@@ -0,0 +1,116 @@
+"""Remember how long each student's assignments took to record, so that the slowest can be started first
+
+When every worker is busy with a long student until the end, the run finishes about when they do,
+instead of one slow student starting last and running alone while the other workers sit idle.
+Timings are kept for each course directory, since courses can share usernames and assignment names.
+"""
+
+import json
+import logging
+import os
+import statistics
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from .config import CACHE_DIR
+from ..common import atomic_write, dirsize
+
+if TYPE_CHECKING:
+    from ..student.assignment_task import AssignmentTask
+    from ..student.student_result import StudentResult
+
+TIMINGS_VERSION = 2
+TIMINGS_PATH = os.path.join(CACHE_DIR, 'timings.json')
+
+# Seconds that each student's assignments took to record, by student and then by spec
+Timings = Dict[str, Dict[str, float]]
+
+
+def load_all_timings() -> Dict[str, Timings]:
+    """Load the timings of every course, by the course's absolute directory"""
+    try:
+        with open(TIMINGS_PATH, 'r', encoding='utf-8') as infile:
+            contents = json.load(infile)
+        if contents.get('version') != TIMINGS_VERSION:
+            return {}
+        return dict(contents['courses'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def load_timings(course_dir: str) -> Timings:
+    """Load the timings of the course in `course_dir`"""
+    return load_all_timings().get(os.path.abspath(course_dir), {})
+
+
+def save_timings(course_dir: str, timings: Timings, results: Iterable['StudentResult']):
+    """Add how long each assignment in `results` took to the `timings` of the course in `course_dir`,
+    then store them alongside every other course's"""
+    for student in results:
+        for result in student.results:
+            if result.duration is not None:
+                timings.setdefault(student.name, {})[result.spec_id] = round(result.duration, 3)
+
+    courses = load_all_timings()
+    courses[os.path.abspath(course_dir)] = timings
+    try:
+        atomic_write(TIMINGS_PATH, json.dumps({'version': TIMINGS_VERSION, 'courses': courses}))
+    except OSError:
+        pass
+
+
+def estimate_durations(students: List[str],
+                       spec_ids: List[str],
+                       timings: Timings,
+                       sizes: Optional[Dict[str, int]] = None) -> Dict[str, float]:
+    """Guess how long each student will take to record, in seconds
+
+    A student who was recorded before takes as long as their assignments took last time.
+    Anyone else is estimated from the size of their repository (in the current directory),
+    at the rate that the students who do have timings were recorded.
+    Repository sizes are remembered in `sizes`, if given.
+    """
+    sizes = {} if sizes is None else sizes
+
+    def size_of(student: str) -> int:
+        if student not in sizes:
+            sizes[student] = dirsize(student)
+        return sizes[student]
+
+    estimates: Dict[str, float] = {}
+    complete: List[str] = []
+    missing: List[str] = []
+
+    for student in students:
+        durations = [timings[student][spec_id] for spec_id in spec_ids if spec_id in timings.get(student, {})]
+        if durations:
+            estimates[student] = sum(durations)
+            if len(durations) == len(spec_ids):
+                complete.append(student)
+        else:
+            missing.append(student)
+
+    if missing:
+        rates = [estimates[student] / size for student in complete for size in [size_of(student)] if size]
+        # Without any history, sizes still order the other students, even if they aren't in seconds
+        rate = statistics.median(rates) if rates else 1.0
+        for student in missing:
+            estimates[student] = size_of(student) * rate
+
+    return estimates
+
+
+def order_longest_first(students: List[str], spec_ids: List[str], timings: Timings) -> List[str]:
+    """Order students so that the ones expected to take the longest are started first"""
+    estimates = estimate_durations(students, spec_ids, timings)
+    ordered = sorted(students, key=lambda student: estimates[student], reverse=True)
+    logging.debug('Longest-first order: {}'.format(', '.join(ordered)))
+    return ordered
+
+
+def order_tasks_longest_first(tasks: List['AssignmentTask'], timings: Timings) -> List['AssignmentTask']:
+    """Order (student, assignment) tasks so that the ones expected to take the longest are started first"""
+    students = sorted({task.student for task in tasks})
+    sizes: Dict[str, int] = {}
+    estimates = {spec_id: estimate_durations(students, [spec_id], timings, sizes)
+                 for spec_id in {task.spec.id for task in tasks}}
+    return sorted(tasks, key=lambda task: estimates[task.spec.id][task.student], reverse=True)
@@ -1,4 +1,3 @@
-import functools
 import logging
 import os
 import sys
@@ -7,14 +6,15 @@ from threading import Thread
 from typing import Any, Dict, List, TYPE_CHECKING
 
 from . import global_vars
-from .process_parallel import process_parallel
+from .engine import Engine
 from .process_students import process_students
 from .save_recordings import save_recordings
 from ..common import chdir
 from ..drive import authenticate_drive, get_assignment_files, group_files, format_file_group
 from ..formatters import tabulate
 from ..formatters.format_type import FormatType
-from ..student import ci_analyze, prepare_student
+from ..student import ci_analyze, sync_students
+from ..student.sync_strategy import SyncStrategy
 from ..webapp import is_web_spec, launch_cli, server
 
 if TYPE_CHECKING:
@@ -42,6 +42,8 @@ def do_ci(specs: List['Spec'],
                                                       skip_repo_update=True,
                                                       skip_web_compile=skip_web_compile,
                                                       stogit_url=stogit_url,
+                                                      sync_strategy=SyncStrategy.PULL,
+                                                      sync_workers=1,
                                                       workers=1,
                                                       work_dir='.')
 
@@ -102,14 +104,21 @@ def do_record(specs: List['Spec'],
         format_type = FormatType.HTML
     else:
         raise ValueError('Unrecognized formatter')
+    engine = Engine[args['engine'].upper()]
     gist: bool = args['gist']
     interact: bool = args['interact']
     no_partials: bool = args['no_partials']
     no_progress_bar: bool = args['no_progress_bar']
     skip_branch_check: bool = args['skip_branch_check']
     skip_repo_update: bool = args['skip_repo_update']
+    skip_result_cache: bool = args['skip_result_cache']
     skip_web_compile: bool = args['skip_web_compile']
     sort_by: str = args['sort_by']
+    shared_objects: bool = args['shared_objects']
+    show_usage: bool = args['show_usage']
+    sparse: bool = args['sparse']
+    sync_strategy = SyncStrategy[args['sync_strategy'].upper()]
+    sync_workers: int = args['sync_workers']
     workers: int = args['workers'] if not global_vars.DEBUG and not interact else 1
 
     show_table: bool = args['table']
@@ -123,65 +132,71 @@ def do_record(specs: List['Spec'],
                                                       base_dir=base_dir,
                                                       clean=clean,
                                                       date=date,
+                                                      engine=engine,
                                                       interact=interact,
                                                       no_progress_bar=no_progress_bar,
                                                       record=True,
                                                       skip_branch_check=skip_branch_check,
                                                       skip_repo_update=skip_repo_update,
+                                                      skip_result_cache=skip_result_cache,
                                                       skip_web_compile=skip_web_compile,
+                                                      shared_objects=shared_objects,
+                                                      sparse=sparse,
                                                       stogit_url=stogit_url,
+                                                      sync_strategy=sync_strategy,
+                                                      sync_workers=sync_workers,
                                                       workers=workers,
                                                       work_dir='./students')
 
     table: str = ''
     if create_table:
-        table = tabulate(results, sort_by=sort_by, highlight_partials=not no_partials)
+        table = tabulate(results, sort_by=sort_by, highlight_partials=not no_partials, show_usage=show_usage)
     if show_table:
         print('\n' + table + '\n')
 
-    save_recordings(results, table, gist=gist, format_type=format_type)
+    save_recordings(results, table, gist=gist, format_type=format_type, show_usage=show_usage)
 
 
 def do_repo_clean(students: List[str],
                   stogit_url: str,
                   base_dir: str,
                   no_progress_bar: bool,
-                  workers: int):
+                  shared_objects: bool,
+                  sparse: bool,
+                  sync_strategy: SyncStrategy,
+                  sync_workers: int):
     with chdir(os.path.join(base_dir, 'students')):
-        single_repo = functools.partial(
-            prepare_student,
-            stogit_url=stogit_url,
-            do_clean=True,
-            do_clone=True,
-            do_pull=True,
-            do_checkout=False
-        )
-
-        process_parallel(students=students,
-                         no_progress_bar=no_progress_bar,
-                         workers=workers,
-                         operation=single_repo)
+        sync_students(students,
+                      stogit_url,
+                      do_clean=True,
+                      do_clone=True,
+                      do_pull=True,
+                      sparse=sparse,
+                      shared_objects=shared_objects,
+                      sync_strategy=sync_strategy,
+                      concurrency=sync_workers,
+                      no_progress_bar=no_progress_bar)
 
 
 def do_repo_update(students: List[str],
                    stogit_url: str,
                    base_dir: str,
                    no_progress_bar: bool,
-                   workers: int):
+                   shared_objects: bool,
+                   sparse: bool,
+                   sync_strategy: SyncStrategy,
+                   sync_workers: int):
     with chdir(os.path.join(base_dir, 'students')):
-        single_repo = functools.partial(
-            prepare_student,
-            stogit_url=stogit_url,
-            do_clean=False,
-            do_clone=True,
-            do_pull=True,
-            do_checkout=False
-        )
-
-        process_parallel(students=students,
-                         no_progress_bar=no_progress_bar,
-                         workers=workers,
-                         operation=single_repo)
+        sync_students(students,
+                      stogit_url,
+                      do_clean=False,
+                      do_clone=True,
+                      do_pull=True,
+                      sparse=sparse,
+                      shared_objects=shared_objects,
+                      sync_strategy=sync_strategy,
+                      concurrency=sync_workers,
+                      no_progress_bar=no_progress_bar)
 
 
 def do_table(specs: List['Spec'],
@@ -191,10 +206,16 @@ def do_table(specs: List['Spec'],
              args: Dict[str, Any]):
     clean: bool = args['clean']
     date: str = args['date']
+    engine = Engine[args['engine'].upper()]
+    from_git: bool = args['from_git']
     no_partials: bool = args['no_partials']
     no_progress_bar: bool = args['no_progress_bar']
     skip_repo_update: bool = args['skip_repo_update']
     sort_by: str = args['sort_by']
+    shared_objects: bool = args['shared_objects']
+    sparse: bool = args['sparse']
+    sync_strategy = SyncStrategy[args['sync_strategy'].upper()]
+    sync_workers: int = args['sync_workers']
     workers: int = args['workers'] if not global_vars.DEBUG else 1
 
     results: List['StudentResult'] = process_students(specs=specs,
@@ -203,13 +224,19 @@ def do_table(specs: List['Spec'],
                                                       base_dir=base_dir,
                                                       clean=clean,
                                                       date=date,
+                                                      engine=engine,
+                                                      from_git=from_git,
                                                       interact=False,
                                                       no_progress_bar=no_progress_bar,
                                                       record=False,
                                                       skip_branch_check=True,
                                                       skip_repo_update=skip_repo_update,
                                                       skip_web_compile=True,
+                                                      shared_objects=shared_objects,
+                                                      sparse=sparse,
                                                       stogit_url=stogit_url,
+                                                      sync_strategy=sync_strategy,
+                                                      sync_workers=sync_workers,
                                                       workers=workers,
                                                       work_dir='./students')
 
@@ -223,8 +250,11 @@ def do_web(specs: List['Spec'],
            args: Dict[str, Any]):
     clean: bool = args['clean']
     date: str = args['date']
+    engine = Engine[args['engine'].upper()]
     no_progress_bar: bool = args['no_progress_bar']
     skip_repo_update: bool = args['skip_repo_update']
+    shared_objects: bool = args['shared_objects']
+    sparse: bool = args['sparse']
     workers: int = args['workers'] if not global_vars.DEBUG else 1
     port: int = args['port']
     spec: 'Spec' = specs[0]
@@ -238,8 +268,11 @@ def do_web(specs: List['Spec'],
     launch_cli(base_dir=base_dir,
                clean=clean,
                date=date,
+               engine=engine,
                no_progress_bar=no_progress_bar,
                skip_repo_update=skip_repo_update,
+               shared_objects=shared_objects,
+               sparse=sparse,
                spec=spec,
                stogit_url=stogit_url,
                students=students,
@@ -0,0 +1,132 @@
+"""Run one operation over many arguments in a pool, shipping the operation to each worker only once
+
+The operation (and everything bound into it, such as the specs) is stored in this module before any worker starts,
+so a forked worker inherits it, and each task only carries its argument, like a student's name, across the process
+boundary. Where workers aren't forked, each task carries the operation, too.
+Large results are written to a spool file by the worker and read back here,
+instead of being sent through the pool's result pipe, which one thread in this process has to drain.
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+from .engine import Engine
+
+# Results that pickle to more than this many bytes are spooled instead of being sent through the pipe
+SPOOL_THRESHOLD = 64 * 1024
+
+# How long each worker waits when the pool is warmed up, which is much longer than forking all of them takes
+WARM_UP_SECONDS = 0.1
+
+# The operation (and spool directory) of the process pool that is open, which forked workers inherit
+_operation: Optional[Callable[[Any], Any]] = None
+_spool_dir: Optional[str] = None
+
+
+@dataclass
+class SpooledResult:
+    """Where a worker left a result that was too big to send back through the pipe"""
+    path: str
+
+
+def install_operation(operation: Optional[Callable[[Any], Any]], spool_dir: Optional[str]):
+    """Set the operation that workers forked from now on will run"""
+    global _operation, _spool_dir
+    _operation = operation
+    _spool_dir = spool_dir
+
+
+def run_installed(argument: Any) -> Any:
+    """Run the operation that the worker inherited"""
+    return run_operation(_operation, _spool_dir, argument)
+
+
+def warm_up() -> int:
+    time.sleep(WARM_UP_SECONDS)
+    return os.getpid()
+
+
+def run_operation(operation: Callable[[Any], Any], spool_dir: Optional[str], argument: Any) -> Any:
+    """Run an operation, spooling the result if it is large"""
+    result = operation(argument)
+    if spool_dir is None:
+        return result
+
+    data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(data) <= SPOOL_THRESHOLD:
+        return result
+
+    fd, path = tempfile.mkstemp(dir=spool_dir, suffix='.pickle')
+    with os.fdopen(fd, 'wb') as outfile:
+        outfile.write(data)
+    return SpooledResult(path)
+
+
+class WorkerPool:
+    """A pool of `workers` that each run `operation`, given one argument per task
+
+    Only one process pool can be open at a time, since its workers inherit the operation from this module.
+    """
+
+    def __init__(self, operation: Callable[[Any], Any], *, engine: Engine, workers: int):
+        self.operation = operation
+        self.engine = engine
+        self.workers = workers
+        self.spool_dir: Optional[str] = None
+        self.executor: Optional[Executor] = None
+        self.inherited = False  # Whether the workers inherit the operation, instead of each task carrying it
+
+    def __enter__(self) -> 'WorkerPool':
+        if self.engine is Engine.THREAD:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        else:
+            self.spool_dir = tempfile.mkdtemp(prefix='stograde-spool-')
+            # Python 3.6's ProcessPoolExecutor has no initializer, so the workers inherit the operation instead
+            self.inherited = multiprocessing.get_start_method() == 'fork'
+            install_operation(self.operation, self.spool_dir)
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            self.start_workers()
+        return self
+
+    def start_workers(self):
+        """Start every worker process now, rather than when the first tasks are submitted
+
+        Forking while other threads hold locks (like logging's, or a stream's) would leave the worker with locks
+        that nothing will ever release, so the pool should be started before any other threads are.
+        Each warm-up task keeps its worker busy, so that the next one goes to a new worker.
+        """
+        for future in [self.executor.submit(warm_up) for _ in range(self.workers)]:
+            future.result()
+
+    def __exit__(self, *exc_info):
+        self.executor.shutdown(wait=True)
+        if self.spool_dir is not None:
+            install_operation(None, None)
+            shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+    def submit(self, argument: Any) -> Future:
+        if self.engine is Engine.THREAD:
+            # Threads share the operation already
+            return self.executor.submit(self.operation, argument)
+        elif self.inherited:
+            return self.executor.submit(run_installed, argument)
+        return self.executor.submit(run_operation, self.operation, self.spool_dir, argument)
+
+    @staticmethod
+    def result(future: Future) -> Any:
+        """Get a finished task's result, reading it back from the spool if the worker left it there"""
+        result = future.result()
+        if not isinstance(result, SpooledResult):
+            return result
+
+        with open(result.path, 'rb') as infile:
+            loaded = pickle.load(infile)
+        os.remove(result.path)
+        return loaded
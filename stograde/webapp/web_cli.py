@@ -14,13 +14,17 @@ from ..student.process_student import prepare_student
 
 if TYPE_CHECKING:
     from ..specs.spec import Spec
+    from ..toolkit.engine import Engine
 
 
 def launch_cli(base_dir: str,
                clean: bool,
                date: str,
+               engine: 'Engine',
                no_progress_bar: bool,
                skip_repo_update: bool,
+               shared_objects: bool,
+               sparse: bool,
                spec: 'Spec',
                stogit_url: str,
                students: List[str],
@@ -43,12 +47,16 @@ def launch_cli(base_dir: str,
             do_clone=not skip_repo_update,
             do_pull=not skip_repo_update,
             do_checkout=True,
-            date=date)
+            date=date,
+            sparse=sparse,
+            shared_objects=shared_objects,
+            folders=[spec.folder])
 
         process_parallel(students=students,
                          no_progress_bar=no_progress_bar,
                          workers=workers,
-                         operation=single_repo)
+                         operation=single_repo,
+                         engine=engine)
 
         while True:
             student = ask_student(usernames)
@@ -94,30 +102,32 @@ def check_student(student: str,
                   base_dir: str):
     """Process student's files and populate file list"""
     files = []
-    if os.path.exists('{}/{}'.format(student, spec.id)):
+    folder = '{}/{}'.format(student, spec.id)
+    if os.path.exists(folder):
         print('Processing...')
-        with chdir('{}/{}'.format(student, spec.id)):
-            # prepare the current folder
-            supporting_dir, written_files = import_supporting(spec=spec,
-                                                              basedir=base_dir)
-
-            for file in spec.files:
-                if file.options.web_file:
-                    result = FileResult(file_name=file.file_name)
-                    exists = get_file(file_spec=file,
-                                      file_result=result)
-
-                    description = file.file_name
-
-                    if not exists:
-                        if result.optional:
-                            description = '{} MISSING (OPTIONAL)'.format(file.file_name)
-                        else:
-                            description = '{} MISSING'.format(file.file_name)
-
-                    files = files + [description]
-            # and we remove any supporting files
-            remove_supporting(written_files)
+        # prepare the folder
+        supporting_dir, written_files = import_supporting(spec=spec,
+                                                          basedir=base_dir,
+                                                          cwd=folder)
+
+        for file in spec.files:
+            if file.options.web_file:
+                result = FileResult(file_name=file.file_name)
+                exists = get_file(file_spec=file,
+                                  file_result=result,
+                                  cwd=folder)
+
+                description = file.file_name
+
+                if not exists:
+                    if result.optional:
+                        description = '{} MISSING (OPTIONAL)'.format(file.file_name)
+                    else:
+                        description = '{} MISSING'.format(file.file_name)
+
+                files = files + [description]
+        # and we remove any supporting files
+        remove_supporting(written_files, cwd=folder)
 
     return files
 
@@ -153,19 +163,21 @@ def ask_file(files: List[str],
                     file_spec = f
                     break
             if file_spec:
-                with chdir('{}/{}'.format(student, spec.id)):
-                    # prepare the current folder
-                    supporting_dir, written_files = import_supporting(spec=spec,
-                                                                      basedir=basedir)
-                    process_file(file_spec=file_spec,
-                                 supporting_dir=supporting_dir,
-                                 interact=False,
-                                 skip_web_compile=False)
-
-                    server.work_dir = os.getcwd()
-
-                    # and we remove any supporting files
-                    remove_supporting(written_files)
+                folder = '{}/{}'.format(student, spec.id)
+                # prepare the folder
+                supporting_dir, written_files = import_supporting(spec=spec,
+                                                                  basedir=basedir,
+                                                                  cwd=folder)
+                process_file(file_spec=file_spec,
+                             supporting_dir=supporting_dir,
+                             interact=False,
+                             skip_web_compile=False,
+                             cwd=folder)
+
+                server.work_dir = os.path.abspath(folder)
+
+                # and we remove any supporting files
+                remove_supporting(written_files, cwd=folder)
 
         else:
             return
@@ -0,0 +1,35 @@
+import os
+from unittest import mock
+
+import pytest
+
+from stograde.common.atomic_write import atomic_write
+
+
+def test_atomic_write(tmpdir):
+    path = str(tmpdir.join('cache', 'file.json'))
+
+    atomic_write(path, '{}')
+    atomic_write(path, '{"a": 1}')
+    with open(path, encoding='utf-8') as infile:
+        assert infile.read() == '{"a": 1}'
+
+    atomic_write(path, b'\x80\x04', 'wb')
+    with open(path, 'rb') as infile:
+        assert infile.read() == b'\x80\x04'
+
+    assert os.listdir(str(tmpdir.join('cache'))) == ['file.json']
+
+
+def test_atomic_write_failure(tmpdir):
+    path = str(tmpdir.join('file.json'))
+    atomic_write(path, 'old')
+
+    with mock.patch('os.replace', side_effect=OSError('An error was thrown')):
+        with pytest.raises(OSError):
+            atomic_write(path, 'new')
+
+    # The old file is untouched, and the temporary file is cleaned up
+    assert os.listdir(str(tmpdir)) == ['file.json']
+    with open(path, encoding='utf-8') as infile:
+        assert infile.read() == 'old'
@@ -22,6 +22,12 @@ def test_cat_hide_contents(fs):
     assert result[1] == ''
 
 
+def test_cat_cwd(fs):
+    fs.create_file('folder/foo.txt', contents='insert a story here')
+
+    assert cat('foo.txt', cwd='folder') == (RunStatus.SUCCESS, 'insert a story here')
+
+
 def test_cat_missing():
     result = cat('file.txt')
     assert result[0] == RunStatus.FILE_NOT_FOUND
@@ -1,5 +1,6 @@
 import os
 
+from stograde.common import chdir
 from stograde.common.find_unmerged_branches_in_cwd import find_unmerged_branches_in_cwd
 from test.utils import git, touch
 
@@ -29,3 +30,36 @@ def test_find_unmerged_branches_in_cwd(tmpdir):
         git('merge', 'branch')
 
         assert find_unmerged_branches_in_cwd() == []
+
+
+def test_find_unmerged_branches_in_cwd_remote_branches(tmpdir):
+    with tmpdir.as_cwd():
+        git('init', 'remote')
+        with chdir('remote'):
+            git('config', 'user.email', 'an_email@email_provider.com')
+            git('config', 'user.name', 'Some Random Name')
+            touch('file1')
+            git('add', 'file1')
+            git('commit', '-m', 'initial')
+
+            git('checkout', '-b', 'lab8')
+            touch('file2')
+            git('add', 'file2')
+            git('commit', '-m', 'newcommit')
+            git('checkout', 'master')
+
+        git('clone', '--quiet', 'remote', 'student')
+        with chdir('student'):
+            # origin/HEAD is a symbolic ref to origin/master, and is left out
+            assert find_unmerged_branches_in_cwd() == ['remotes/origin/lab8']
+
+
+def test_find_unmerged_branches_in_cwd_not_a_repo(tmpdir):
+    with tmpdir.as_cwd():
+        assert find_unmerged_branches_in_cwd() == []
+
+
+def test_find_unmerged_branches_in_cwd_no_master(tmpdir):
+    with tmpdir.as_cwd():
+        git('init')
+        assert find_unmerged_branches_in_cwd() == []
@@ -0,0 +1,57 @@
+import os
+
+from stograde.common import build_history_index
+from stograde.common.modification_time import ModificationTime
+from test.utils import git, touch
+
+
+def make_repo():
+    git('init')
+    git('config', 'user.email', 'an_email@email_provider.com')
+    git('config', 'user.name', 'Some Random Name')
+
+    os.makedirs('hw1')
+    touch('hw1/test_file.txt')
+    touch('hw1/other file.txt')
+    git('add', 'hw1')
+    git('commit', '-m', '"add files"', '--date="Fri Apr 17 09:31:00 2020 -0500"')
+
+    with open('hw1/test_file.txt', 'a') as file:
+        file.write('add content')
+    git('add', 'hw1/test_file.txt')
+    git('commit', '-m', '"update file"', '--date="Sat Apr 25 17:18:33 2020 -0500"')
+
+    git('commit', '--allow-empty', '-m', '"empty commit"')
+
+
+def test_build_history_index(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo()
+        index = build_history_index('.')
+
+        assert index.lookup('hw1/test_file.txt', ModificationTime.FIRST) == ('Fri Apr 17 09:31:00 2020 -0500',
+                                                                             '2020-04-17 09:31:00 -0500')
+        assert index.lookup('hw1/test_file.txt', ModificationTime.LATEST) == ('Sat Apr 25 17:18:33 2020 -0500',
+                                                                              '2020-04-25 17:18:33 -0500')
+        assert index.lookup('hw1/other file.txt', ModificationTime.LATEST) == ('Fri Apr 17 09:31:00 2020 -0500',
+                                                                               '2020-04-17 09:31:00 -0500')
+        assert index.lookup('hw1/missing.txt') == ('', '')
+
+
+def test_build_history_index_subdirectory(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo()
+        index = build_history_index('hw1')
+
+        assert set(index.files.keys()) == {'test_file.txt', 'other file.txt'}
+        assert index.lookup(os.path.join('hw1', 'test_file.txt'),
+                            ModificationTime.FIRST) == ('Fri Apr 17 09:31:00 2020 -0500', '2020-04-17 09:31:00 -0500')
+
+
+def test_build_history_index_not_a_repo(tmpdir):
+    with tmpdir.as_cwd():
+        touch('test_file.txt')
+        index = build_history_index('.')
+
+    assert index.files == {}
+    assert index.lookup('test_file.txt') == ('', '')
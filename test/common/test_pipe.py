@@ -1,4 +1,4 @@
-from stograde.common.pipe import pipe, expand_chunk, process_chunk
+from stograde.common.pipe import pipe, expand_chunk, process_chunk, split_pipeline
 
 
 def test_expand_chunk(fs):
@@ -9,6 +9,15 @@ def test_expand_chunk(fs):
     assert sorted(expand_chunk('file*')) == sorted(['file1', 'file2'])
 
 
+def test_expand_chunk_cwd(fs):
+    fs.create_file('folder/file1')
+    fs.create_file('file2')
+
+    assert expand_chunk('file*', 'folder') == ['file1']
+    assert expand_chunk('./file*', 'folder') == ['./file1']
+    assert expand_chunk('/folder/file*', 'elsewhere') == ['/folder/file1']
+
+
 def test_process_chunk(fs):
     fs.create_file('file1')
     fs.create_file('file2')
@@ -18,3 +27,15 @@ def test_process_chunk(fs):
 
 def test_pipe():
     assert pipe('echo hi | cat') == (['cat'], b'hi\n')
+
+
+def test_pipe_cwd(tmpdir):
+    tmpdir.join('file1').write('contents')
+    assert pipe('cat file1 | cat', str(tmpdir)) == (['cat'], b'contents')
+
+
+def test_split_pipeline(fs):
+    fs.create_file('folder/file1')
+
+    assert split_pipeline('cat file* | wc -l', 'folder') == [['cat', 'file1'], ['wc', '-l']]
+    assert split_pipeline('echo hi') == [['echo', 'hi']]
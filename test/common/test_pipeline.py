@@ -0,0 +1,137 @@
+import time
+
+from stograde.common.pipeline import run_pipeline
+from stograde.common.resource_limits import ResourceLimits
+from stograde.common.run_status import RunStatus
+from test.utils import process_alive
+
+
+def test_run_pipeline():
+    result = run_pipeline([['echo', 'hello'], ['tr', 'a-z', 'A-Z']], capture_limit=1000)
+
+    assert result.status is RunStatus.SUCCESS
+    assert result.output == 'HELLO\n'
+    assert [stage.returncode for stage in result.stages] == [0, 0]
+
+
+def test_run_pipeline_stages_run_at_once():
+    # `yes` never ends on its own, so this only finishes if `head` exiting stops it
+    start = time.perf_counter()
+    result = run_pipeline([['yes'], ['head', '-n', '3']], timeout=5, capture_limit=1000)
+
+    assert time.perf_counter() - start < 5
+    assert result.status is RunStatus.SUCCESS
+    assert result.output == 'y\ny\ny\n'
+    assert result.stages[0].status is RunStatus.CALLED_PROCESS_ERROR
+
+
+def test_run_pipeline_input_data():
+    result = run_pipeline([['cat'], ['wc', '-l']], input_data=b'a\nb\nc\n', capture_limit=1000)
+
+    assert result.status is RunStatus.SUCCESS
+    assert result.output.strip() == '3'
+
+
+def test_run_pipeline_cwd(tmpdir):
+    tmpdir.join('a_file.txt').write('contents\n')
+
+    result = run_pipeline([['cat', 'a_file.txt'], ['cat']], cwd=str(tmpdir), capture_limit=1000)
+
+    assert result.output == 'contents\n'
+
+
+def test_run_pipeline_stage_statuses():
+    result = run_pipeline([['false'], ['echo', 'done']], capture_limit=1000)
+
+    assert result.status is RunStatus.SUCCESS
+    assert result.stages[0].status is RunStatus.CALLED_PROCESS_ERROR
+    assert result.stages[0].returncode == 1
+    assert result.stages[1].status is RunStatus.SUCCESS
+
+    result = run_pipeline([['echo', 'start'], ['false']], capture_limit=1000)
+
+    assert result.status is RunStatus.CALLED_PROCESS_ERROR
+
+
+def test_run_pipeline_timeout():
+    start = time.perf_counter()
+    result = run_pipeline([['sleep', '10'], ['cat']], timeout=0.5, capture_limit=1000)
+
+    assert time.perf_counter() - start < 5
+    assert result.status is RunStatus.TIMEOUT_EXPIRED
+
+
+def test_run_pipeline_file_not_found():
+    result = run_pipeline([['echo', 'hi'], ['not-a-real-command-abc']], capture_limit=1000)
+
+    assert result.status is RunStatus.FILE_NOT_FOUND
+    assert result.stages[1].status is RunStatus.FILE_NOT_FOUND
+    assert result.stages[1].returncode is None
+
+
+def test_run_pipeline_output_limit():
+    result = run_pipeline([['yes'], ['cat']], timeout=5, capture_limit=10, kill_on_limit=True)
+
+    assert result.status is RunStatus.OUTPUT_LIMIT_EXCEEDED
+    assert len(result.output) == 14
+
+
+def test_run_pipeline_limits_apply_to_each_stage():
+    limits = ResourceLimits(cpu_time=1)
+    result = run_pipeline([['sh', '-c', 'while true; do :; done'], ['cat']],
+                          timeout=10, capture_limit=1000, limits=limits)
+
+    assert result.stages[0].status is RunStatus.RESOURCE_LIMIT_EXCEEDED
+
+
+def test_run_pipeline_timeout_with_cpu_limit():
+    # Being killed by the timeout isn't running out of CPU time
+    result = run_pipeline([['sleep', '10']], timeout=0.5, capture_limit=1000, limits=ResourceLimits(cpu_time=1))
+
+    assert result.status is RunStatus.TIMEOUT_EXPIRED
+    assert result.stages[0].status is RunStatus.CALLED_PROCESS_ERROR
+
+
+def test_run_pipeline_timeout_kills_children(tmpdir):
+    # The shell's child would keep running if only the shell were killed
+    script = 'sleep 10 & echo $! > child.pid; wait'
+    result = run_pipeline([['sh', '-c', script]], cwd=str(tmpdir), timeout=0.5, capture_limit=1000)
+
+    assert result.status is RunStatus.TIMEOUT_EXPIRED
+    assert not process_alive(int(tmpdir.join('child.pid').read()))
+
+
+def test_run_pipeline_background_child_does_not_time_out(tmpdir):
+    start = time.perf_counter()
+    result = run_pipeline([['sh', '-c', 'sleep 10 & echo $! > child.pid; echo done']],
+                          cwd=str(tmpdir), timeout=5, capture_limit=1000)
+
+    assert time.perf_counter() - start < 5
+    assert result.status is RunStatus.SUCCESS
+    assert result.output == 'done\n'
+    assert not process_alive(int(tmpdir.join('child.pid').read()))
+
+
+def test_run_pipeline_usage():
+    result = run_pipeline([['sh', '-c', 'i=0; while [ $i -lt 20000 ]; do i=$((i+1)); done; echo done'], ['cat']],
+                          capture_limit=1000)
+
+    assert result.usage.cpu_time > 0
+    assert result.usage.cpu_time >= result.stages[0].usage.cpu_time
+    assert result.usage.wall_time >= max(stage.usage.wall_time for stage in result.stages)
+    assert result.usage.max_rss > 0
+    assert result.usage.output_bytes == len('done\n')
+
+
+def test_run_pipeline_usage_counts_truncated_output():
+    result = run_pipeline([['head', '-c', '5000', '/dev/zero']], capture_limit=10)
+
+    assert len(result.output) == 14
+    assert result.usage.output_bytes == 5000
+
+
+def test_run_pipeline_usage_not_started():
+    result = run_pipeline([['not-a-real-command-abc']], capture_limit=1000)
+
+    assert result.usage is None
+    assert result.stages[0].usage is None
@@ -0,0 +1,41 @@
+import subprocess
+
+from stograde.common.process_group import reap_groups, started_groups, stop_group, track_group
+from test.utils import process_alive
+
+
+def test_stop_group_kills_children(tmpdir):
+    proc = subprocess.Popen(['sh', '-c', 'sleep 10 & echo $! > child.pid; wait'],
+                            cwd=str(tmpdir), start_new_session=True)
+    while not tmpdir.join('child.pid').exists() or not tmpdir.join('child.pid').read():
+        pass
+
+    stop_group(proc)
+    proc.wait(timeout=5)
+
+    assert not process_alive(int(tmpdir.join('child.pid').read()))
+
+
+def test_reap_groups_kills_stragglers(tmpdir):
+    proc = subprocess.Popen(['sh', '-c', 'sleep 10 & echo $! > child.pid'],
+                            cwd=str(tmpdir), start_new_session=True)
+    track_group(proc)
+    proc.wait(timeout=5)
+
+    child = int(tmpdir.join('child.pid').read())
+    assert process_alive(child, grace=0)
+
+    reap_groups()
+
+    assert not started_groups()
+    assert not process_alive(child)
+
+
+def test_reap_groups_ignores_finished_groups():
+    proc = subprocess.Popen(['true'], start_new_session=True)
+    track_group(proc)
+    proc.wait(timeout=5)
+
+    reap_groups()
+
+    assert not started_groups()
@@ -0,0 +1,105 @@
+import sys
+from unittest import mock
+
+from stograde.common import load_history_index
+from stograde.common.find_unmerged_branches_in_cwd import find_unmerged_branches_in_cwd
+from stograde.common.repo_cache import load_repo_cache
+from test.utils import git, touch
+
+
+def make_repo():
+    git('init')
+    git('config', 'user.email', 'an_email@email_provider.com')
+    git('config', 'user.name', 'Some Random Name')
+
+    touch('file1')
+    git('add', 'file1')
+    git('commit', '-m', 'initial', '--date="Fri Apr 17 09:31:00 2020 -0500"')
+
+
+def test_load_repo_cache_not_a_repo(tmpdir):
+    with tmpdir.as_cwd():
+        assert load_repo_cache('.') is None
+
+
+def test_load_repo_cache_persists(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo()
+
+        load_repo_cache('.').set('key', ['value'])
+
+        assert load_repo_cache('.').get('key') == ['value']
+
+
+def test_load_repo_cache_invalidated_by_new_commit(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo()
+
+        cache = load_repo_cache('.')
+        cache.set('key', ['value'])
+
+        touch('file2')
+        git('add', 'file2')
+        git('commit', '-m', 'another')
+
+        new_cache = load_repo_cache('.')
+
+    assert new_cache.fingerprint != cache.fingerprint
+    assert new_cache.get('key') is None
+
+
+def test_load_repo_cache_invalidated_by_new_branch(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo()
+
+        load_repo_cache('.').set('key', ['value'])
+        git('branch', 'other')
+
+        assert load_repo_cache('.').get('key') is None
+
+
+def test_load_history_index_cached(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo()
+
+        index = load_history_index('.')
+
+        with mock.patch('stograde.common.history_index.run') as mock_run:
+            cached_index = load_history_index('.')
+
+        assert cached_index.lookup('file1') == ('Fri Apr 17 09:31:00 2020 -0500', '2020-04-17 09:31:00 -0500')
+
+    mock_run.assert_not_called()
+    assert cached_index == index
+
+
+def test_find_unmerged_branches_in_cwd_cached(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo()
+        git('checkout', '-b', 'branch')
+        touch('file2')
+        git('add', 'file2')
+        git('commit', '-m', 'newcommit')
+        git('checkout', 'master')
+
+        assert find_unmerged_branches_in_cwd() == ['branch']
+
+        # stograde.common re-exports the function under the same name as its module
+        module = sys.modules['stograde.common.find_unmerged_branches_in_cwd']
+        with mock.patch.object(module, 'run') as mock_run:
+            assert find_unmerged_branches_in_cwd() == ['branch']
+
+    mock_run.assert_not_called()
+
+
+def test_load_repo_cache_worktree(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo()
+        git('worktree', 'add', '--detach', '--quiet', 'worktree', 'HEAD')
+
+        load_repo_cache('worktree').set('key', ['value'])
+        assert load_repo_cache('worktree').get('key') == ['value']
+
+        # The worktree shares its refs with the main repository
+        git('branch', 'other')
+        assert load_repo_cache('worktree').get('key') is None
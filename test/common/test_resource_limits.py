@@ -0,0 +1,114 @@
+import resource
+import signal
+import sys
+
+import pytest
+
+from stograde.common import resource_limits
+from stograde.common.resource_limits import exceeded_limit, limit_values, ResourceLimits
+from stograde.common.run import run
+from stograde.common.run_status import RunStatus
+
+
+def test_resource_limits_bool():
+    assert not ResourceLimits()
+    assert ResourceLimits(cpu_time=1)
+    assert ResourceLimits().wrap(['echo', 'hi']) == ['echo', 'hi']
+
+
+def test_resource_limits_wrap(monkeypatch):
+    limits = ResourceLimits(cpu_time=5)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    cpu = (5, 6) if hard == resource.RLIM_INFINITY else (min(5, hard), min(6, hard))
+
+    monkeypatch.setattr(resource_limits, 'PRLIMIT', '/usr/bin/prlimit')
+    assert limits.wrap(['echo', 'hi']) == ['/usr/bin/prlimit', '--cpu={}:{}'.format(*cpu), '--', 'echo', 'hi']
+
+    monkeypatch.setattr(resource_limits, 'PRLIMIT', None)
+    assert limits.wrap(['echo', 'hi'])[-6:] == [str(resource.RLIMIT_CPU), str(cpu[0]), str(cpu[1]), '--', 'echo', 'hi']
+
+
+def test_resource_limits_wrap_missing_program(tmpdir):
+    limits = ResourceLimits(cpu_time=5)
+
+    with pytest.raises(FileNotFoundError):
+        limits.wrap(['definitelynotaprogram'])
+    with pytest.raises(FileNotFoundError):
+        limits.wrap(['./missing.exec'], cwd=str(tmpdir))
+
+    tmpdir.join('not_executable.exec').write('')
+    with pytest.raises(PermissionError):
+        limits.wrap(['./not_executable.exec'], cwd=str(tmpdir))
+
+
+def test_exceeded_limit():
+    assert exceeded_limit(ResourceLimits(cpu_time=1), -signal.SIGXCPU, '')
+    assert not exceeded_limit(ResourceLimits(), -signal.SIGXCPU, '')
+    assert not exceeded_limit(None, -signal.SIGXCPU, '')
+    assert exceeded_limit(ResourceLimits(file_size=1), -signal.SIGXFSZ, '')
+    assert exceeded_limit(ResourceLimits(address_space=1), -signal.SIGABRT,
+                          "terminate called after throwing an instance of 'std::bad_alloc'")
+    assert not exceeded_limit(ResourceLimits(address_space=1), 1, 'some other failure')
+
+
+def test_exceeded_limit_killed():
+    # Only the hard CPU limit kills a command that used up its CPU time
+    assert exceeded_limit(ResourceLimits(cpu_time=1), -signal.SIGKILL, '', cpu_time=1.5)
+    assert not exceeded_limit(ResourceLimits(cpu_time=1), -signal.SIGKILL, '', cpu_time=0.01)
+    assert not exceeded_limit(ResourceLimits(cpu_time=1), -signal.SIGKILL, '')
+
+
+def test_exceeded_limit_processes():
+    assert exceeded_limit(ResourceLimits(processes=10), 1, 'fork: Resource temporarily unavailable')
+    assert not exceeded_limit(ResourceLimits(processes=10), 1, 'some other failure')
+    assert not exceeded_limit(ResourceLimits(cpu_time=1), 1, 'fork: Resource temporarily unavailable')
+
+
+def test_limit_values_keeps_lower_limits(monkeypatch):
+    monkeypatch.setattr(resource, 'getrlimit', lambda _: (1000, 5000))
+    assert limit_values(resource.RLIMIT_FSIZE, 2000, 10000) == (1000, 5000)
+    assert limit_values(resource.RLIMIT_FSIZE, 500) == (500, 500)
+
+    monkeypatch.setattr(resource, 'getrlimit', lambda _: (resource.RLIM_INFINITY, resource.RLIM_INFINITY))
+    assert limit_values(resource.RLIMIT_FSIZE, 2000, 10000) == (2000, 10000)
+
+
+@pytest.fixture(params=['prlimit', 'python'])
+def wrapper(request, monkeypatch):
+    """Apply limits with prlimit (where it is installed) and with the Python wrapper"""
+    if request.param == 'prlimit' and not resource_limits.PRLIMIT:
+        pytest.skip('prlimit is not installed')
+    if request.param == 'python':
+        monkeypatch.setattr(resource_limits, 'PRLIMIT', None)
+
+
+def test_run_missing_program_with_limits():
+    status, output, _ = run(['definitelynotaprogram'], limits=ResourceLimits(cpu_time=1))
+    assert status == RunStatus.FILE_NOT_FOUND
+    assert output == "[Errno 2] No such file or directory: 'definitelynotaprogram'"
+
+
+def test_run_cpu_limit(wrapper):
+    status, _, _ = run([sys.executable, '-c', 'while True: pass'], timeout=20, limits=ResourceLimits(cpu_time=1))
+    assert status == RunStatus.RESOURCE_LIMIT_EXCEEDED
+
+
+def test_run_file_size_limit(tmpdir, wrapper):
+    status, _, _ = run(['dd', 'if=/dev/zero', 'of=big', 'bs=1024', 'count=2048'], cwd=str(tmpdir),
+                       capture_limit=1000, limits=ResourceLimits(file_size=1024 * 1024))
+    assert status == RunStatus.RESOURCE_LIMIT_EXCEEDED
+    assert tmpdir.join('big').size() == 1024 * 1024
+
+
+def test_run_memory_limit(wrapper):
+    status, output, _ = run([sys.executable, '-c', 'data = bytearray(1024 * 1024 * 1024)'],
+                            capture_limit=10000, limits=ResourceLimits(address_space=256 * 1024 * 1024))
+    assert status == RunStatus.RESOURCE_LIMIT_EXCEEDED
+    assert 'MemoryError' in output
+
+
+def test_run_within_limits(wrapper):
+    limits = ResourceLimits(address_space=256 * 1024 * 1024, cpu_time=5, processes=10000, file_size=1024)
+    status, output, _ = run(['echo', 'hi'], limits=limits)
+    assert status == RunStatus.SUCCESS
+    assert output == 'hi\n'
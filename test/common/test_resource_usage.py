@@ -0,0 +1,39 @@
+import subprocess
+import time
+
+from stograde.common.resource_usage import ResourceUsage, total_usage, usage_from_rusage, wait_for_usage
+
+
+def test_wait_for_usage():
+    proc = subprocess.Popen(['sh', '-c', 'exit 3'])
+    returncode, rusage = wait_for_usage(proc.pid)
+
+    assert returncode == 3
+    assert rusage.ru_maxrss > 0
+
+
+def test_wait_for_usage_signal():
+    proc = subprocess.Popen(['sleep', '10'])
+    proc.kill()
+    returncode, _ = wait_for_usage(proc.pid)
+
+    assert returncode == -9
+
+
+def test_usage_from_rusage():
+    start = time.monotonic()
+    proc = subprocess.Popen(['sh', '-c', 'i=0; while [ $i -lt 20000 ]; do i=$((i+1)); done'])
+    _, rusage = wait_for_usage(proc.pid)
+    usage = usage_from_rusage(rusage, wall_time=time.monotonic() - start)
+
+    assert usage.cpu_time > 0
+    assert usage.wall_time >= usage.cpu_time * 0.5
+    assert usage.max_rss > 0
+
+
+def test_total_usage():
+    total = total_usage([ResourceUsage(wall_time=1, cpu_time=0.5, max_rss=100, output_bytes=10),
+                         ResourceUsage(wall_time=2, cpu_time=1.5, max_rss=300, output_bytes=5)])
+
+    assert total == ResourceUsage(wall_time=3, cpu_time=2, max_rss=300, output_bytes=15)
+    assert total_usage([]) == ResourceUsage()
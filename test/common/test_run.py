@@ -1,7 +1,8 @@
+import asyncio
 from subprocess import CompletedProcess
 from unittest import mock
 
-from stograde.common.run import run
+from stograde.common.run import run, run_async
 from stograde.common.run_status import RunStatus
 
 
@@ -12,6 +13,12 @@ def test_run():
     assert again is False
 
 
+def test_run_cwd(tmpdir):
+    status, result, _ = run(['pwd'], cwd=str(tmpdir))
+    assert status == RunStatus.SUCCESS
+    assert result == str(tmpdir) + '\n'
+
+
 def test_run_stdin():
     status, result, again = run(['cat'], input_data=b'hello')
     assert status == RunStatus.SUCCESS
@@ -26,6 +33,46 @@ def test_run_timeout():
     assert again is False
 
 
+def test_run_capture_limit():
+    status, result, _ = run(['yes'], timeout=5, capture_limit=10, kill_on_limit=True)
+    assert status == RunStatus.OUTPUT_LIMIT_EXCEEDED
+    assert result == 'y\n' * 7
+
+
+def test_run_capture_limit_without_kill():
+    status, result, _ = run(['seq', '100000'], capture_limit=10)
+    assert status == RunStatus.SUCCESS
+    assert result == '1\n2\n3\n4\n5\n6\n7\n'
+
+
+def test_run_capture_limit_timeout():
+    status, result, _ = run(['sh', '-c', 'echo hi; sleep 5'], timeout=0.5, capture_limit=10)
+    assert status == RunStatus.TIMEOUT_EXPIRED
+    assert result == 'hi\n'
+
+
+def test_run_capture_limit_error():
+    status, result, _ = run(['sh', '-c', 'cat; exit 3'], input_data=b'input', capture_limit=10)
+    assert status == RunStatus.CALLED_PROCESS_ERROR
+    assert result == 'input'
+
+    status, result, _ = run(['false'], capture_limit=10)
+    assert status == RunStatus.CALLED_PROCESS_ERROR
+    assert result == "Command '['false']' returned non-zero exit status 1."
+
+
+def test_run_capture_limit_partial_character():
+    # 'ü' is two bytes, and the limit (plus its margin) cuts the last one in half
+    status, result, _ = run(['printf', 'üüüüüüü'], capture_limit=9)
+    assert status == RunStatus.SUCCESS
+    assert result == 'üüüüüü'
+
+
+def test_run_capture_limit_not_found():
+    status, _, _ = run(['notfound'], capture_limit=10)
+    assert status == RunStatus.FILE_NOT_FOUND
+
+
 def test_run_not_found():
     with mock.patch('subprocess.run', side_effect=FileNotFoundError("[Errno 2] No such file or directory: 'notfound'")):
         status, result, again = run(['notfound'])
@@ -85,6 +132,14 @@ def test_run_interactive_n(capsys):
                    'Submission recording completed.\n')
 
 
+def test_run_interactive_cwd(tmpdir, capsys):
+    with mock.patch('builtins.input', return_value='n'):
+        status, result, again = run(['pwd'], cwd=str(tmpdir), interact=True)
+    assert status == RunStatus.SUCCESS
+    assert result == str(tmpdir) + '\r\n'
+    assert again is False
+
+
 def test_run_interactive_unicode_decode_error(capsys):
     with mock.patch('builtins.input', return_value='n'):
         status, result, again = run(['echo', b'\x81'], interact=True)
@@ -96,3 +151,37 @@ def test_run_interactive_unicode_decode_error(capsys):
 
     assert out == ("Recording ['echo', b'\\x81']. Send EOF (^D) to end.\n\n\n"
                    'Submission recording completed.\n')
+
+
+def run_async_sync(*args, **kwargs):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(run_async(*args, **kwargs))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def test_run_async(tmpdir):
+    status, result, again = run_async_sync(['pwd'], cwd=str(tmpdir))
+    assert status == RunStatus.SUCCESS
+    assert result == str(tmpdir) + '\n'
+    assert again is False
+
+
+def test_run_async_error():
+    status, result, _ = run_async_sync(['false'])
+    assert status == RunStatus.CALLED_PROCESS_ERROR
+    assert result == "Command '['false']' returned non-zero exit status 1."
+
+
+def test_run_async_timeout():
+    status, result, _ = run_async_sync(['sleep', '1'], timeout=0.5)
+    assert status == RunStatus.TIMEOUT_EXPIRED
+    assert result == "Command '['sleep', '1']' timed out after 0.5 seconds"
+
+
+def test_run_async_not_found():
+    status, _, _ = run_async_sync(['notfound-stograde-command'])
+    assert status == RunStatus.FILE_NOT_FOUND
@@ -1,3 +1,29 @@
+import pytest
+
+from stograde.process_file import result_cache
+from stograde.specs import host_capabilities
+from stograde.toolkit import student_timings
+
+
 def pytest_collection_modifyitems(session, config, items):
     ignored_names = ['test_file']
     items[:] = [item for item in items if item.name not in ignored_names]
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path, monkeypatch):
+    """Keep tests from reading or filling the user's cache of compile and test results"""
+    monkeypatch.setattr(result_cache, 'RESULTS_DIR', str(tmp_path / 'result-cache'))
+
+
+@pytest.fixture(autouse=True)
+def isolated_student_timings(tmp_path, monkeypatch):
+    """Keep tests from reading or changing how long the user's students took to record"""
+    monkeypatch.setattr(student_timings, 'TIMINGS_PATH', str(tmp_path / 'timings.json'))
+
+
+@pytest.fixture(autouse=True)
+def isolated_host_capabilities(tmp_path, monkeypatch):
+    """Probe this machine afresh in each test, without reading or changing the user's stored probe"""
+    monkeypatch.setattr(host_capabilities, 'PROBE_PATH', str(tmp_path / 'host.json'))
+    monkeypatch.setattr(host_capabilities, '_host', None)
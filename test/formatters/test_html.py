@@ -1,7 +1,9 @@
+from dataclasses import replace
 import re
 import textwrap
 from unittest import mock
 
+from stograde.common.resource_usage import ResourceUsage
 from stograde.formatters.format_type import FormatType
 from stograde.formatters.html import format_file_contents, format_file_compilation, \
     format_file_tests, format_file, format_warnings, format_header, format_files_list, format_assignment_html, \
@@ -780,6 +782,14 @@ def test_format_file_compilation_no_warnings():
     assert formatted == '<p><b>no warnings: <code>test command</code></b></p>\n'
 
 
+def test_format_file_compilation_usage():
+    usage = ResourceUsage(wall_time=1.5, cpu_time=1.25, max_rss=2048, output_bytes=0)
+
+    formatted = format_file_compilation([replace(compile_results[0], usage=usage)], show_usage=True)
+    assert formatted == '<p><b>no warnings: <code>test command</code></b> ' \
+                        '(1.50s, 1.25s CPU, 2.0 MB memory, 0 B output)</p>\n'
+
+
 def test_format_file_compilation_warnings():
     formatted = format_file_compilation([compile_results[1]])
     assert '\n' + formatted == textwrap.dedent('''
@@ -818,6 +828,14 @@ def test_format_file_tests_no_output():
         ''')
 
 
+def test_format_file_tests_usage():
+    usage = ResourceUsage(wall_time=0.5, cpu_time=0.25, max_rss=512, output_bytes=2048)
+
+    formatted = format_file_tests([replace(test_results[0], usage=usage)], show_usage=True)
+    assert formatted == '<p><b>results of <code>test command</code></b> ' \
+                        '(status: SUCCESS; 0.50s, 0.25s CPU, 512.0 KB memory, 2.0 KB output)</p>\n'
+
+
 def test_format_file_tests_output():
     formatted = format_file_tests([test_results[1]])
     assert '\n' + formatted == textwrap.dedent('''
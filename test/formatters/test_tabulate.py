@@ -1,9 +1,16 @@
 import textwrap
 
+from stograde.common.resource_usage import ResourceUsage
+from stograde.common.run_status import RunStatus
+
 from stograde.process_assignment.assignment_status import AssignmentStatus
+from stograde.process_assignment.record_result import RecordResult
+from stograde.process_file.compile_result import CompileResult
+from stograde.process_file.file_result import FileResult
+from stograde.process_file.test_result import TestResult
 from stograde.student.student_result import StudentResult
 from stograde.formatters.tabulate import find_columns, pad, MISSING, concat, symbol, columnize, get_nums, \
-    sort_by_hw_count, sort_by_username, tabulate, asciiify
+    sort_by_hw_count, sort_by_username, summarize_usage, tabulate, asciiify
 
 
 def test_pad():
@@ -228,3 +235,33 @@ def test_tabulate():
         rives1  | 1 2 - - | 1 2 | 1
         rives3  | 1 2 3 4 | - - | -
         rives2  | 1 2 3 - | - - | -""")
+
+
+def test_summarize_usage():
+    file_result = FileResult('a.cpp',
+                             compile_results=[CompileResult('g++ a.cpp', '', RunStatus.SUCCESS,
+                                                            usage=ResourceUsage(cpu_time=1.0, max_rss=4096))],
+                             test_results=[TestResult('./a.exec', '', False, RunStatus.SUCCESS,
+                                                      usage=ResourceUsage(cpu_time=0.5, max_rss=1024)),
+                                           TestResult('./a.exec', '', False, RunStatus.SUCCESS)])
+    student = StudentResult(name='rives', results=[RecordResult('hw1', 'rives', file_results=[file_result])])
+
+    assert summarize_usage(student) == '1.50s CPU, 4.0 MB memory'
+    assert summarize_usage(StudentResult(name='rives')) == MISSING
+
+
+def test_tabulate_show_usage():
+    file_result = FileResult('a.cpp', test_results=[TestResult('./a.exec', '', False, RunStatus.SUCCESS,
+                                                               usage=ResourceUsage(cpu_time=0.5, max_rss=1024))])
+    students = [
+        StudentResult(name='rives1',
+                      results=[RecordResult('hw1', 'rives1', file_results=[file_result])],
+                      homeworks={'hw1': AssignmentStatus.SUCCESS}),
+        StudentResult(name='rives2', homeworks={'hw1': AssignmentStatus.SUCCESS}),
+    ]
+
+    assert '\n' + tabulate(students, show_usage=True) == textwrap.dedent("""
+        USER    | 1 |  |  | USAGE
+        --------+---+--+--+------
+        rives1  | 1 |  |  | 0.50s CPU, 1.0 MB memory
+        rives2  | 1 |  |  | -""")
@@ -0,0 +1,17 @@
+from stograde.common.resource_usage import ResourceUsage
+from stograde.formatters.usage import format_size, format_usage
+
+
+def test_format_size():
+    assert format_size(0) == '0 B'
+    assert format_size(1023) == '1023 B'
+    assert format_size(1536) == '1.5 KB'
+    assert format_size(5 * 1024 * 1024) == '5.0 MB'
+    assert format_size(3 * 1024 * 1024 * 1024) == '3.0 GB'
+
+
+def test_format_usage():
+    usage = ResourceUsage(wall_time=2.0, cpu_time=1.5, max_rss=10240, output_bytes=100)
+
+    assert format_usage(usage) == '2.00s, 1.50s CPU, 10.0 MB memory, 100 B output'
+    assert format_usage(None) == ''
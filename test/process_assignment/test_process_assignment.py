@@ -116,3 +116,29 @@ def test_remove_execs(tmpdir):
         remove_execs(spec)
 
         assert set(os.listdir('.')) == {'non_exec_file.txt', 'non_spec_exec.exec'}
+
+
+def test_process_assignment_cwd(tmpdir):
+    spec = Spec('hw1', 'hw1', architecture=None,
+                files=[SpecFile('a_file.txt', ['cp $@ $@.exec'], ['cat $@.exec'], FileOptions())])
+
+    with tmpdir.as_cwd():
+        git('init', '--quiet')
+        os.makedirs('hw1')
+        with open(os.path.join('hw1', 'a_file.txt'), 'w') as outfile:
+            outfile.write('contents\n')
+
+        # Nothing should change the directory of the whole process
+        with mock.patch('os.chdir', side_effect=AssertionError('os.chdir was called')):
+            result = process_assignment(student=StudentResult('student1'),
+                                        spec=spec,
+                                        basedir='',
+                                        interact=False,
+                                        skip_web_compile=False,
+                                        skip_result_cache=True,
+                                        cwd='hw1')
+
+        assert result.warnings == SubmissionWarnings()
+        assert result.file_results[0].contents == 'contents\n'
+        assert result.file_results[0].test_results[0].output == 'contents\n'
+        assert os.listdir('hw1') == ['a_file.txt']
@@ -262,6 +262,37 @@ def test_test_file_truncated(datafiles):
                                               truncated_after=180)]
 
 
+def test_test_file_kill_on_truncate(tmpdir):
+    spec = SpecFile(file_name='chatty.sh',
+                    compile_commands=[],
+                    test_commands=['yes chatty'],
+                    options=FileOptions(truncate_output=14, kill_on_truncate=True))
+    result = FileResult(file_name='chatty.sh')
+
+    test_file(file_spec=spec, file_results=result, supporting_dir='', interact=False, cwd=str(tmpdir))
+
+    assert result.test_results == [TestResult(command='yes chatty',
+                                              output='chatty\nchatty\n',
+                                              error=True,
+                                              status=RunStatus.OUTPUT_LIMIT_EXCEEDED,
+                                              truncated_after=14)]
+
+
+def test_test_file_usage(tmpdir):
+    spec = SpecFile(file_name='a_file.txt',
+                    compile_commands=['echo compiled'],
+                    test_commands=['echo tested | cat'],
+                    options=FileOptions())
+    result = FileResult(file_name='a_file.txt')
+
+    compile_file(file_spec=spec, results=result, supporting_dir='', cwd=str(tmpdir))
+    test_file(file_spec=spec, file_results=result, supporting_dir='', interact=False, cwd=str(tmpdir))
+
+    assert result.compile_results[0].usage.output_bytes == len('compiled\n')
+    assert result.test_results[0].usage.output_bytes == len('tested\n')
+    assert result.test_results[0].usage.max_rss > 0
+
+
 # ----------------------------- process_file -----------------------------
 
 def test_process_file_fail_get(tmpdir):
@@ -0,0 +1,134 @@
+from importlib import import_module
+import os
+from unittest import mock
+
+from stograde.common import chdir
+from stograde.common.pipeline import PipelineResult
+from stograde.common.resource_usage import ResourceUsage
+from stograde.common.run_status import RunStatus
+from stograde.process_assignment.process_assignment import process_assignment
+from stograde.process_file.compile_result import CompileResult
+from stograde.process_file.result_cache import CachedResults, load_results, result_key, save_results, \
+    snapshot_digest
+from stograde.process_file.test_result import TestResult
+from stograde.specs.file_options import FileOptions
+from stograde.specs.spec import Spec
+from stograde.specs.spec_file import SpecFile
+from stograde.student.student_result import StudentResult
+from test.utils import git, touch
+
+# The package re-exports the process_file function under the same name as its module
+process_file_module = import_module('stograde.process_file.process_file')
+
+
+def make_assignment():
+    """Create a committed hw1 folder with a single file"""
+    git('init', '--quiet')
+    os.makedirs('hw1')
+    with open(os.path.join('hw1', 'a_file.txt'), 'w') as outfile:
+        outfile.write('contents\n')
+    git('add', '.')
+    git('-c', 'user.email=an_email@email_provider.com', '-c', 'user.name=Some Random Name',
+        'commit', '--quiet', '-m', 'initial')
+
+
+def record(spec: Spec, **kwargs):
+    with chdir('hw1'):
+        return process_assignment(student=StudentResult('student1'),
+                                  spec=spec,
+                                  basedir='',
+                                  interact=False,
+                                  skip_web_compile=False,
+                                  **kwargs)
+
+
+def test_save_and_load_results():
+    results = CachedResults(compile_results=[CompileResult(command='g++ a.cpp', output='', status=RunStatus.SUCCESS)],
+                            test_results=[TestResult(command='./a.cpp.exec', output='out', error=False,
+                                                     status=RunStatus.CALLED_PROCESS_ERROR, truncated_after=0)])
+    save_results('abcdef', results)
+
+    assert load_results('abcdef') == results
+    assert load_results('123456') is None
+
+
+def test_save_and_load_results_usage():
+    usage = ResourceUsage(wall_time=0.5, cpu_time=0.25, max_rss=1024, output_bytes=3)
+    results = CachedResults(test_results=[TestResult(command='./a.cpp.exec', output='out', error=False,
+                                                     status=RunStatus.SUCCESS, usage=usage)])
+    save_results('abcdef', results)
+
+    assert load_results('abcdef').test_results[0].usage == usage
+
+
+def test_save_results_skips_timeouts():
+    results = CachedResults(test_results=[TestResult(command='./a.cpp.exec', output='', error=True,
+                                                     status=RunStatus.TIMEOUT_EXPIRED, truncated_after=0)])
+    save_results('abcdef', results)
+
+    assert load_results('abcdef') is None
+
+
+def test_save_results_skips_resource_limits():
+    results = CachedResults(test_results=[TestResult(command='./a.cpp.exec', output='', error=True,
+                                                     status=RunStatus.RESOURCE_LIMIT_EXCEEDED, truncated_after=0)])
+    save_results('abcdef', results)
+
+    assert load_results('abcdef') is None
+
+
+def test_snapshot_digest(tmpdir):
+    with tmpdir.as_cwd():
+        touch('a_file.txt')
+        original = snapshot_digest('.')
+
+        touch('a_file.txt.exec')
+        assert snapshot_digest('.') == original
+
+        with open('a_file.txt', 'w') as outfile:
+            outfile.write('changed')
+        assert snapshot_digest('.') != original
+
+
+def test_result_key_depends_on_commands():
+    file_spec = SpecFile('a_file.txt', ['cat $@'], [], FileOptions())
+    other_spec = SpecFile('a_file.txt', [], ['cat $@'], FileOptions())
+
+    key = result_key(snapshot='snapshot', file_spec=file_spec, supporting_dir='', skip_compile=False)
+
+    assert key == result_key(snapshot='snapshot', file_spec=file_spec, supporting_dir='', skip_compile=False)
+    assert key != result_key(snapshot='other', file_spec=file_spec, supporting_dir='', skip_compile=False)
+    assert key != result_key(snapshot='snapshot', file_spec=other_spec, supporting_dir='', skip_compile=False)
+    assert key != result_key(snapshot='snapshot', file_spec=file_spec, supporting_dir='', skip_compile=True)
+
+
+def test_process_assignment_reuses_results(tmpdir):
+    spec = Spec('hw1', 'hw1', architecture=None,
+                files=[SpecFile('a_file.txt', [], ['cat $@'], FileOptions())])
+
+    with tmpdir.as_cwd():
+        make_assignment()
+        first = record(spec)
+
+        with mock.patch.object(process_file_module, 'run_pipeline') as mock_run:
+            second = record(spec)
+
+        assert not mock_run.called
+        assert first.file_results == second.file_results
+        assert second.file_results[0].test_results[0].output == 'contents\n'
+
+
+def test_process_assignment_skip_result_cache(tmpdir):
+    spec = Spec('hw1', 'hw1', architecture=None,
+                files=[SpecFile('a_file.txt', [], ['cat $@'], FileOptions())])
+
+    with tmpdir.as_cwd():
+        make_assignment()
+        record(spec)
+
+        with mock.patch.object(process_file_module, 'run_pipeline',
+                               return_value=PipelineResult(status=RunStatus.SUCCESS, output='fresh')) as mock_run:
+            result = record(spec, skip_result_cache=True)
+
+        assert mock_run.called
+        assert result.file_results[0].test_results[0].output == 'fresh'
@@ -7,6 +7,7 @@ from stograde.common import chdir
 from stograde.specs import filter_assignments
 from stograde.specs.filter_specs import get_spec_paths, find_all_specs, filter_loaded_specs
 from stograde.specs.spec import Spec
+from stograde.specs.spec_file import create_spec_file
 from stograde.specs.util import get_user_architecture
 
 _dir = os.path.dirname(os.path.realpath(__file__))
@@ -130,3 +131,38 @@ def test_filter_loaded_specs_missing_dependency(caplog):
     log_messages = {(log.msg, log.levelname) for log in caplog.records}
     assert log_messages == {('Skipping hw1: required file "definitelymissingdependency.txt" could not be found',
                              'WARNING')}
+
+
+def test_filter_loaded_specs_probes_host_once():
+    specs = [Spec(id='hw{}'.format(number), folder='hw{}'.format(number), architecture='totallynottherightarchitecture')
+             for number in range(40)]
+
+    with mock.patch('subprocess.Popen') as popen, mock.patch('platform.machine', return_value='x86_64') as machine:
+        filter_loaded_specs(specs)
+
+    popen.assert_not_called()
+    machine.assert_called_once()
+
+
+def test_filter_loaded_specs_missing_program(capsys):
+    spec = Spec(id='hw1', folder='hw1', architecture=None)
+    spec.files.append(create_spec_file({'file': 'test.cpp', 'commands': ['definitelynotacompiler $@']}))
+
+    filtered_specs = filter_loaded_specs([spec])
+
+    _, err = capsys.readouterr()
+
+    # The spec is still recorded, so that the missing compiler shows up in its results
+    assert filtered_specs == [spec]
+    assert err == 'hw1 runs definitelynotacompiler, which is not installed\n'
+
+
+@mock.patch('stograde.toolkit.global_vars.CI', True)
+def test_filter_loaded_specs_missing_program_ci(caplog):
+    spec = Spec(id='hw1', folder='hw1', architecture=None)
+    spec.files.append(create_spec_file({'file': 'test.cpp', 'commands': ['definitelynotacompiler $@']}))
+
+    assert filter_loaded_specs([spec]) == [spec]
+
+    log_messages = {(log.msg, log.levelname) for log in caplog.records}
+    assert log_messages == {('hw1 runs definitelynotacompiler, which is not installed', 'WARNING')}
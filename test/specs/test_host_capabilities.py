@@ -0,0 +1,95 @@
+import json
+import platform
+import time
+from unittest import mock
+
+from stograde.specs import host_capabilities as host_module
+from stograde.specs.host_capabilities import host_capabilities, HostCapabilities, load_host_capabilities, \
+    spec_programs
+from stograde.specs.spec import Spec
+from stograde.specs.spec_file import create_spec_file
+
+
+def test_host_capabilities_probed_once():
+    host = host_capabilities()
+
+    assert host.architecture == platform.machine()
+    assert host_capabilities() is host
+
+
+def test_host_capabilities_programs():
+    host = HostCapabilities(architecture='x86_64')
+
+    assert host.has_program('python3')
+    assert not host.has_program('definitelynotaprogram')
+    assert host.programs == {'python3': True, 'definitelynotaprogram': False}
+    assert host.changed
+
+
+def test_host_capabilities_dependencies(tmpdir):
+    host = HostCapabilities(architecture='x86_64')
+    present = tmpdir.join('present.txt')
+    present.write('')
+
+    assert host.has_dependency(str(present))
+    assert not host.has_dependency(str(tmpdir.join('missing.txt')))
+    assert not host.changed
+
+
+def test_host_capabilities_saved_and_loaded():
+    host = host_capabilities()
+    host.has_program('definitelynotaprogram')
+    host.save()
+
+    with mock.patch('shutil.which') as which:
+        loaded = load_host_capabilities(platform.machine())
+    which.assert_not_called()
+
+    assert loaded.architecture == host.architecture
+    assert loaded.programs == {'definitelynotaprogram': False}
+    # Dependencies are only remembered for the rest of the run
+    assert loaded.dependencies == {}
+
+
+def write_probe(**changes):
+    contents = {'version': host_module.PROBE_VERSION,
+                'host': platform.node(),
+                'probed_at': time.time(),
+                'architecture': platform.machine(),
+                'programs': {'definitelynotaprogram': True}}
+    contents.update(changes)
+    with open(host_module.PROBE_PATH, 'w', encoding='utf-8') as outfile:
+        json.dump(contents, outfile)
+
+
+def test_host_capabilities_expire():
+    write_probe(probed_at=time.time() - host_module.PROBE_TTL - 1)
+
+    assert load_host_capabilities(platform.machine()) is None
+
+
+def test_host_capabilities_from_another_machine():
+    # A home directory shared between machines shares the stored probe, too
+    write_probe(architecture='armv7l')
+    assert load_host_capabilities(platform.machine()) is None
+    assert host_capabilities().architecture == platform.machine()
+    assert not host_capabilities().has_program('definitelynotaprogram')
+
+    write_probe(host='another-machine')
+    assert load_host_capabilities(platform.machine()) is None
+
+
+def test_host_capabilities_ignores_corrupt_file():
+    with open(host_module.PROBE_PATH, 'w', encoding='utf-8') as outfile:
+        outfile.write('not json')
+
+    assert load_host_capabilities(platform.machine()) is None
+
+
+def test_spec_programs():
+    spec = Spec(id='hw1', folder='hw1', architecture=None)
+    spec.files.append(create_spec_file({'file': 'test.cpp',
+                                        'commands': ['g++ --std=c++11 $@ -o $@.exec'],
+                                        'tests': ['$@.exec', 'cat input.txt | ./a.out | python3 check.py']}))
+
+    assert spec_programs([spec]) == {'g++', 'cat', 'python3'}
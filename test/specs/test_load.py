@@ -1,9 +1,13 @@
+from concurrent.futures import Future
+from datetime import timedelta
 import os
+import time
 
 import pytest
 
+from stograde.common.run_status import RunStatus
 from stograde.specs import load_specs
-from stograde.specs.load import check_for_spec_updates
+from stograde.specs.load import check_for_spec_updates, spec_update_due, start_spec_fetch
 from test.utils import git, touch
 
 _dir = os.path.dirname(os.path.realpath(__file__))
@@ -27,6 +31,52 @@ def test_load_specs_failed_update(datafiles, capsys):
     assert err == 'Error fetching specs\ngit log failed\n'
 
 
+@pytest.mark.datafiles(os.path.join(_dir, 'fixtures'))
+def test_load_specs_background_fetch(datafiles, capsys):
+    spec_fetch = Future()
+    spec_fetch.set_result(RunStatus.CALLED_PROCESS_ERROR)
+
+    specs = load_specs(['hw1', 'hw2', 'hw3'], str(datafiles), skip_spec_update=True, spec_fetch=spec_fetch)
+
+    assert len(specs) == 3
+
+    _, err = capsys.readouterr()
+
+    assert err == 'Error fetching specs\ngit log failed\n'
+
+
+def test_spec_update_due(tmpdir):
+    with tmpdir.as_cwd():
+        # Not a git repository, so there is nothing to fetch
+        assert not spec_update_due('.', timedelta(minutes=15))
+
+        git('init')
+        assert spec_update_due('.', timedelta(minutes=15))
+
+        touch(os.path.join('.git', 'FETCH_HEAD'))
+        assert not spec_update_due('.', timedelta(minutes=15))
+
+        an_hour_ago = time.time() - 60 * 60
+        os.utime(os.path.join('.git', 'FETCH_HEAD'), (an_hour_ago, an_hour_ago))
+        assert spec_update_due('.', timedelta(minutes=15))
+
+
+def test_start_spec_fetch_recently_fetched(tmpdir):
+    with tmpdir.as_cwd():
+        git('init')
+        touch(os.path.join('.git', 'FETCH_HEAD'))
+
+        assert start_spec_fetch('.', timedelta(minutes=15)) is None
+
+
+def test_start_spec_fetch(tmpdir):
+    with tmpdir.as_cwd():
+        git('init')
+
+        # There is no origin to fetch from
+        assert start_spec_fetch('.', timedelta(minutes=15)).result() is RunStatus.CALLED_PROCESS_ERROR
+
+
 def test_check_for_spec_updates_update_found(tmpdir, capsys):
     with tmpdir.as_cwd():
         git('init')
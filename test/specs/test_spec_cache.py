@@ -0,0 +1,91 @@
+import os
+from unittest import mock
+
+from stograde.specs import spec_cache
+from stograde.specs.spec import Spec
+from stograde.specs.spec_cache import CACHE_FILE, load_spec_cache
+from test.utils import git
+
+
+def make_data_repo(path):
+    os.makedirs(os.path.join(path, 'specs'))
+    with open(os.path.join(path, 'specs', 'hw1.yaml'), 'w', encoding='utf-8') as outfile:
+        outfile.write('---\nassignment: hw1\n')
+    git('init', path)
+    git('-C', path, 'config', 'user.email', 'an_email@email_provider.com')
+    git('-C', path, 'config', 'user.name', 'Some Random Name')
+    git('-C', path, 'add', 'specs')
+    git('-C', path, 'commit', '-m', 'Add hw1')
+
+
+def load(data_dir: str) -> Spec:
+    cache = load_spec_cache(data_dir)
+    spec = cache.load_spec('hw1.yaml', os.path.join(data_dir, 'specs'))
+    cache.save()
+    return spec
+
+
+def test_spec_cache_skips_parsing(tmpdir):
+    make_data_repo(str(tmpdir))
+
+    assert load(str(tmpdir)) == Spec('hw1', 'hw1', None)
+    assert os.path.exists(os.path.join(str(tmpdir), '.git', CACHE_FILE))
+
+    with mock.patch.object(spec_cache, 'parse_spec') as parse_spec:
+        assert load(str(tmpdir)) == Spec('hw1', 'hw1', None)
+    parse_spec.assert_not_called()
+
+
+def test_spec_cache_reparses_changed_files(tmpdir):
+    make_data_repo(str(tmpdir))
+    load(str(tmpdir))
+
+    with open(os.path.join(str(tmpdir), 'specs', 'hw1.yaml'), 'w', encoding='utf-8') as outfile:
+        outfile.write('---\nassignment: hw1\nfolder: homework1\n')
+
+    assert load(str(tmpdir)).folder == 'homework1'
+
+
+def test_spec_cache_dropped_on_new_commit(tmpdir):
+    make_data_repo(str(tmpdir))
+    load(str(tmpdir))
+
+    git('-C', str(tmpdir), 'commit', '--allow-empty', '-m', 'Move HEAD')
+
+    assert load_spec_cache(str(tmpdir)).entries == {}
+
+
+def test_spec_cache_without_git(tmpdir):
+    os.makedirs(os.path.join(str(tmpdir), 'specs'))
+    with open(os.path.join(str(tmpdir), 'specs', 'hw1.yaml'), 'w', encoding='utf-8') as outfile:
+        outfile.write('---\nassignment: hw1\n')
+
+    cache = load_spec_cache(str(tmpdir))
+    assert cache.path is None
+    assert load(str(tmpdir)) == Spec('hw1', 'hw1', None)
+
+
+def test_spec_cache_ignores_corrupt_file(tmpdir):
+    make_data_repo(str(tmpdir))
+    with open(os.path.join(str(tmpdir), '.git', CACHE_FILE), 'wb') as outfile:
+        outfile.write(b'not a pickle')
+
+    assert load_spec_cache(str(tmpdir)).entries == {}
+    assert load(str(tmpdir)) == Spec('hw1', 'hw1', None)
+
+
+def test_spec_cache_ignores_unreadable_pickle(tmpdir):
+    make_data_repo(str(tmpdir))
+    with open(os.path.join(str(tmpdir), '.git', CACHE_FILE), 'wb') as outfile:
+        # A pickle with a protocol that no Python has yet
+        outfile.write(b'\x80\x63')
+
+    assert load_spec_cache(str(tmpdir)).entries == {}
+
+
+def test_spec_cache_protocol(tmpdir):
+    make_data_repo(str(tmpdir))
+    load(str(tmpdir))
+
+    with open(os.path.join(str(tmpdir), '.git', CACHE_FILE), 'rb') as infile:
+        assert infile.read(2) == b'\x80\x04'
@@ -6,6 +6,7 @@ def check_file_options_has_defaults(options: FileOptions,
                                     *,
                                     test_compile_optional: bool = True,
                                     test_hide_contents: bool = True,
+                                    test_kill_on_truncate: bool = True,
                                     test_optional: bool = True,
                                     test_timeout: bool = True,
                                     test_truncate_output: bool = True,
@@ -18,6 +19,8 @@ def check_file_options_has_defaults(options: FileOptions,
         assert options.compile_optional == defaults.compile_optional
     if test_hide_contents:
         assert options.hide_contents == defaults.hide_contents
+    if test_kill_on_truncate:
+        assert options.kill_on_truncate == defaults.kill_on_truncate
     if test_optional:
         assert options.optional == defaults.optional
     if test_timeout:
@@ -130,6 +133,32 @@ def test_create_spec_file_with_hide_contents():
                                     test_hide_contents=False)
 
 
+def test_create_spec_file_with_kill_on_truncate():
+    new_file = create_spec_file({
+        'file': 'test_file7.txt',
+        'options': {
+            'kill_on_truncate': True
+        }
+    })
+
+    assert new_file.options.kill_on_truncate is True
+    check_file_options_has_defaults(new_file.options,
+                                    test_kill_on_truncate=False)
+
+
+def test_create_spec_file_with_spec_options():
+    new_file = create_spec_file({
+        'file': 'test_file7.txt',
+        'options': {
+            'cpu_limit': 10
+        }
+    }, {'cpu_limit': 2, 'memory_limit': 512})
+
+    assert new_file.options.cpu_limit == 10
+    assert new_file.options.memory_limit == 512
+    check_file_options_has_defaults(new_file.options)
+
+
 def test_create_spec_file_with_optional():
     new_file = create_spec_file({
         'file': 'test_file8.txt',
@@ -0,0 +1,55 @@
+import os
+
+from stograde.student.fetch import fetch_and_reset
+from stograde.student.remote_heads import local_master
+from test.student.test_remote_heads import clone_students
+from test.student.test_sync import push_change
+from test.utils import git, touch
+
+
+def test_fetch_and_reset(tmpdir, capsys):
+    with tmpdir.as_cwd():
+        clone_students('student1')
+        push_change('student1', 'file2')
+
+        with open(os.path.join('students', 'student1', 'file1'), 'w') as outfile:
+            outfile.write('local change')
+        touch(os.path.join('students', 'student1', 'file1.exec'))
+        touch(os.path.join('students', 'student1', 'notes.txt'))
+
+        os.chdir('students')
+        fetch_and_reset('student1')
+
+        assert os.path.exists(os.path.join('student1', 'file2'))
+        with open(os.path.join('student1', 'file1')) as infile:
+            assert infile.read() == ''
+        assert not os.path.exists(os.path.join('student1', 'file1.exec'))
+        assert os.path.exists(os.path.join('student1', 'notes.txt'))
+
+    _, err = capsys.readouterr()
+    assert err == 'Discarded local changes to file1 in student1\n'
+
+
+def test_fetch_and_reset_detached_head(tmpdir, capsys):
+    with tmpdir.as_cwd():
+        clone_students('student1')
+        push_change('student1', 'file2')
+
+        os.chdir('students')
+        git('-C', 'student1', 'checkout', '--quiet', '--detach')
+        fetch_and_reset('student1')
+
+        assert os.path.exists(os.path.join('student1', 'file2'))
+        assert local_master('student1') != ''
+
+    _, err = capsys.readouterr()
+    assert err == ''
+
+
+def test_fetch_and_reset_not_a_repo(tmpdir, capsys):
+    with tmpdir.as_cwd():
+        os.makedirs('student1')
+        fetch_and_reset('student1')
+
+    _, err = capsys.readouterr()
+    assert err.startswith('Student directory student1 is not a git repository')
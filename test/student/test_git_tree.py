@@ -0,0 +1,116 @@
+import os
+from unittest import mock
+
+from stograde.common import chdir
+from stograde.process_assignment.assignment_status import AssignmentStatus
+from stograde.specs.spec import Spec
+from stograde.specs.spec_file import SpecFile
+from stograde.student.analyze_student import analyze_assignment
+from stograde.student.fetch import fetch_mirror
+from stograde.student.git_tree import is_bare_repository, read_tree
+from stograde.student.process_student import process_student
+from test.utils import git, touch
+
+SPECS = [Spec('hw1', 'hw1', architecture=None, files=[SpecFile('a_file.txt'), SpecFile('b_file.txt')]),
+         Spec('lab1', 'lab1', architecture=None, files=[SpecFile('c_file.txt')]),
+         Spec('ws1', 'ws1', architecture=None, files=[SpecFile('d_file.txt')])]
+
+
+def make_student():
+    os.makedirs('work')
+    with chdir('work'):
+        git('init')
+        git('config', 'user.email', 'an_email@email_provider.com')
+        git('config', 'user.name', 'Some Random Name')
+
+        os.makedirs('hw1')
+        touch(os.path.join('hw1', 'a_file.txt'))
+        git('add', 'hw1')
+        with mock.patch.dict(os.environ, {'GIT_COMMITTER_DATE': 'Tue Apr 21 12:28:03 2020 -0500'}):
+            git('commit', '-m', '"Add hw1"')
+
+        os.makedirs(os.path.join('lab1', 'nested'))
+        touch(os.path.join('lab1', 'c_file.txt'))
+        touch(os.path.join('lab1', 'nested', 'file.txt'))
+        touch(os.path.join('hw1', 'b_file.txt'))
+        git('add', 'lab1', 'hw1')
+        with mock.patch.dict(os.environ, {'GIT_COMMITTER_DATE': 'Sat Apr 25 20:27:05 2020 -0500'}):
+            git('commit', '-m', '"Add lab1"')
+
+    git('clone', '--quiet', '--mirror', 'work', 'student')
+
+
+def test_read_tree(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+        tree = read_tree('student')
+
+    assert tree == {'': {'hw1', 'lab1'},
+                    'hw1': {'a_file.txt', 'b_file.txt'},
+                    'lab1': {'c_file.txt', 'nested'},
+                    'lab1/nested': {'file.txt'}}
+
+    assert analyze_assignment(SPECS[0], tree) is AssignmentStatus.SUCCESS
+    assert analyze_assignment(SPECS[1], tree) is AssignmentStatus.SUCCESS
+    assert analyze_assignment(SPECS[2], tree) is AssignmentStatus.MISSING
+
+
+def test_read_tree_date(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+        tree = read_tree('student', 'Apr 23 2020')
+
+    assert tree == {'': {'hw1'}, 'hw1': {'a_file.txt'}}
+    assert analyze_assignment(SPECS[0], tree) is AssignmentStatus.PARTIAL
+    assert analyze_assignment(SPECS[1], tree) is AssignmentStatus.MISSING
+
+
+def test_read_tree_before_first_commit(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+        assert read_tree('student', 'Jan 1 2000') == {}
+
+
+def test_is_bare_repository(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+        assert is_bare_repository('student')
+        assert not is_bare_repository('work')
+        assert not is_bare_repository('missing')
+
+
+def test_fetch_mirror(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+        with chdir('work'):
+            os.makedirs('ws1')
+            touch(os.path.join('ws1', 'd_file.txt'))
+            git('add', 'ws1')
+            git('commit', '-m', '"Add ws1"')
+
+        fetch_mirror('student')
+
+        assert 'ws1' in read_tree('student')
+
+
+def test_process_student_from_git(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+        result = process_student(student='student',
+                                 analyze=True,
+                                 basedir='',
+                                 clean=False,
+                                 date='Apr 23 2020',
+                                 from_git=True,
+                                 interact=False,
+                                 record=False,
+                                 skip_branch_check=True,
+                                 skip_repo_update=True,
+                                 skip_web_compile=True,
+                                 specs=SPECS,
+                                 stogit_url='')
+
+    assert result.error == ''
+    assert result.homeworks == {'hw1': AssignmentStatus.PARTIAL}
+    assert result.labs == {'lab1': AssignmentStatus.MISSING}
+    assert result.worksheets == {'ws1': AssignmentStatus.MISSING}
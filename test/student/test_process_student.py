@@ -5,13 +5,15 @@ from stograde.common import chdir
 from stograde.process_assignment.record_result import RecordResult
 from stograde.process_assignment.submission_warnings import SubmissionWarnings
 from stograde.specs.spec import Spec
-from stograde.student.process_student import prepare_student, process_student
+from stograde.student.assignment_task import AssignmentTask
+from stograde.student.process_student import grade_assignment, prepare_for_recording, prepare_student, process_student
+from stograde.student.sync_strategy import SyncStrategy
 from test.utils import git, touch
 
 
-@mock.patch('stograde.student.process_student.reset')
+@mock.patch('stograde.student.process_student.student_checkout')
 @mock.patch('stograde.student.process_student.prepare_student')
-def test_process_student_prepare_student_call(mock_prepare, mock_reset):
+def test_process_student_prepare_student_call(mock_prepare, mock_checkout):
     process_student(student='student',
                     analyze=False,
                     basedir='',
@@ -30,9 +32,13 @@ def test_process_student_prepare_student_call(mock_prepare, mock_reset):
                                                              'do_clone': True,
                                                              'do_pull': True,
                                                              'do_checkout': True,
-                                                             'date': 'a_date'})
+                                                             'sparse': False,
+                                                             'shared_objects': False,
+                                                             'folders': [],
+                                                             'sync_strategy': SyncStrategy.PULL})
 
-    assert mock_reset.called
+    # The student's own checkout is left alone, and the dated commit is graded in a worktree instead
+    assert mock_checkout.call_args == (('student', 'a_date'),)
 
 
 @mock.patch('stograde.student.process_student.prepare_student')
@@ -55,7 +61,31 @@ def test_process_student_prepare_student_call_skip_repo_update(mock_prepare):
                                                              'do_clone': False,
                                                              'do_pull': False,
                                                              'do_checkout': True,
-                                                             'date': ''})
+                                                             'sparse': False,
+                                                             'shared_objects': False,
+                                                             'folders': [],
+                                                             'sync_strategy': SyncStrategy.PULL})
+
+
+@mock.patch('stograde.student.process_student.prepare_student')
+def test_process_student_prepare_student_call_up_to_date(mock_prepare):
+    process_student(student='student',
+                    analyze=False,
+                    basedir='',
+                    clean=False,
+                    date='',
+                    interact=False,
+                    record=False,
+                    skip_branch_check=False,
+                    skip_repo_update=False,
+                    skip_web_compile=False,
+                    specs=[],
+                    stogit_url='a_url',
+                    up_to_date={'student'})
+
+    assert mock_prepare.called
+    assert mock_prepare.call_args[1]['do_clone'] is True
+    assert mock_prepare.call_args[1]['do_pull'] is False
 
 
 @mock.patch('stograde.toolkit.global_vars.CI', True)
@@ -79,7 +109,10 @@ def test_process_student_prepare_student_call_ci(mock_prepare):
                                                              'do_clone': False,
                                                              'do_pull': False,
                                                              'do_checkout': False,
-                                                             'date': ''})
+                                                             'sparse': False,
+                                                             'shared_objects': False,
+                                                             'folders': [],
+                                                             'sync_strategy': SyncStrategy.PULL})
 
 
 @mock.patch('stograde.student.process_student.analyze_student')
@@ -213,6 +246,26 @@ def test_process_student_error_debug(mock_prepare):
     assert mock_prepare.called
 
 
+@mock.patch('stograde.student.process_student.reap_groups')
+@mock.patch('stograde.student.process_student.prepare_student',
+            side_effect=KeyError('An exception was thrown'))
+def test_process_student_reaps_groups(mock_prepare, mock_reap):
+    process_student(student='student',
+                    analyze=False,
+                    basedir='',
+                    clean=False,
+                    date='',
+                    interact=False,
+                    record=False,
+                    skip_branch_check=False,
+                    skip_repo_update=True,
+                    skip_web_compile=False,
+                    specs=[],
+                    stogit_url='')
+
+    assert mock_reap.called
+
+
 # ----------------------------- prepare_student -----------------------------
 
 @mock.patch('stograde.student.process_student.checkout_date')
@@ -275,6 +328,23 @@ def test_prepare_student_pull(mock_remove, mock_clone, mock_stash, mock_pull, mo
     assert not mock_checkout.called
 
 
+@mock.patch('stograde.student.process_student.fetch_and_reset')
+@mock.patch('stograde.student.process_student.pull')
+@mock.patch('stograde.student.process_student.stash')
+def test_prepare_student_reset_strategy(mock_stash, mock_pull, mock_fetch_and_reset):
+    prepare_student(student='',
+                    stogit_url='',
+                    do_clean=False,
+                    do_clone=False,
+                    do_pull=True,
+                    do_checkout=False,
+                    sync_strategy=SyncStrategy.RESET)
+
+    assert mock_fetch_and_reset.called
+    assert not mock_stash.called
+    assert not mock_pull.called
+
+
 @mock.patch('stograde.student.process_student.checkout_date')
 @mock.patch('stograde.student.process_student.pull')
 @mock.patch('stograde.student.process_student.stash')
@@ -293,3 +363,67 @@ def test_prepare_student_checkout(mock_remove, mock_clone, mock_stash, mock_pull
     assert not mock_stash.called
     assert not mock_pull.called
     assert mock_checkout.called
+
+
+# ----------------------------- prepare_for_recording -----------------------------
+
+@mock.patch('stograde.student.process_student.prepare_student',
+            side_effect=KeyError('An exception was thrown'))
+def test_prepare_for_recording_error(mock_prepare):
+    student_result = prepare_for_recording('student',
+                                           analyze=True,
+                                           clean=False,
+                                           skip_repo_update=True,
+                                           specs=[],
+                                           stogit_url='')
+
+    assert student_result.name == 'student'
+    assert student_result.error == "'An exception was thrown'"
+
+
+@mock.patch('stograde.student.process_student.prepare_student')
+def test_prepare_for_recording_analyze(mock_prepare, tmpdir):
+    with tmpdir.as_cwd():
+        os.makedirs(os.path.join('student', 'hw1'))
+        with chdir('student'):
+            git('init', '--quiet')
+        touch(os.path.join('student', 'hw1', 'a_file.txt'))
+
+        student_result = prepare_for_recording('student',
+                                               analyze=True,
+                                               clean=False,
+                                               skip_repo_update=True,
+                                               specs=[Spec('hw1', 'hw1', None, files=[])],
+                                               stogit_url='')
+
+    assert student_result.error == ''
+    assert student_result.results == []
+    assert 'hw1' in student_result.homeworks
+
+
+# ----------------------------- grade_assignment -----------------------------
+
+def test_grade_assignment_missing(tmpdir):
+    with tmpdir.as_cwd():
+        os.makedirs('student')
+        with chdir('student'):
+            git('init', '--quiet')
+
+        result = grade_assignment(AssignmentTask('student', Spec('hw1', 'hw1', None, files=[])),
+                                  basedir='',
+                                  interact=False,
+                                  skip_web_compile=False)
+
+    assert result == RecordResult('hw1', 'student', warnings=SubmissionWarnings(assignment_missing=True))
+
+
+@mock.patch('stograde.student.process_student.record_assignment', side_effect=KeyError('An exception was thrown'))
+def test_grade_assignment_error(mock_record, tmpdir):
+    with tmpdir.as_cwd():
+        result = grade_assignment(AssignmentTask('student', Spec('hw1', 'hw1', None, files=[])),
+                                  basedir='',
+                                  interact=False,
+                                  skip_web_compile=False)
+
+    assert result.spec_id == 'hw1'
+    assert result.warnings.recording_err == "'An exception was thrown'"
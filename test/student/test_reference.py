@@ -0,0 +1,78 @@
+import os
+
+from stograde.student import clone_student, sync_students
+from stograde.student.reference import REFERENCE_REPO, update_reference_repo
+from test.utils import git, touch
+
+
+def make_remotes(*names: str):
+    """Create remotes/name.git for each student, all starting from the same starter code"""
+    git('init', 'starter')
+    git('-C', 'starter', 'config', 'user.email', 'an_email@email_provider.com')
+    git('-C', 'starter', 'config', 'user.name', 'Some Random Name')
+    touch(os.path.join('starter', 'README.md'))
+    git('-C', 'starter', 'add', 'README.md')
+    git('-C', 'starter', 'commit', '-m', 'starter code')
+
+    for name in names:
+        git('clone', '--quiet', '--bare', 'starter', os.path.join('remotes', name + '.git'))
+
+
+def borrows_objects(student: str) -> bool:
+    return os.path.exists(os.path.join(student, '.git', 'objects', 'info', 'alternates'))
+
+
+def test_update_reference_repo(tmpdir):
+    with tmpdir.as_cwd():
+        make_remotes('student1', 'student2')
+        url = 'file://' + os.path.abspath('remotes')
+        os.makedirs('students')
+        os.chdir('students')
+
+        update_reference_repo(['student1', 'student2'], url + '/student1.git', include_local=False)
+
+        _, refs, _ = git('-C', REFERENCE_REPO, 'for-each-ref', '--format=%(refname)')
+        assert refs.split() == ['refs/students/student1']
+
+        clone_student('student2', url, shared_objects=True)
+
+        assert borrows_objects('student2')
+        assert os.path.exists(os.path.join('student2', 'README.md'))
+
+
+def test_update_reference_repo_include_local(tmpdir):
+    with tmpdir.as_cwd():
+        make_remotes('student1', 'student2')
+        url = 'file://' + os.path.abspath('remotes')
+        os.makedirs('students')
+        os.chdir('students')
+        clone_student('student2', url)
+
+        update_reference_repo(['student1', 'student2'], url + '/student1.git', include_local=True)
+
+        _, refs, _ = git('-C', REFERENCE_REPO, 'for-each-ref', '--format=%(refname)')
+        assert refs.split() == ['refs/students/student1', 'refs/students/student2']
+
+
+def test_sync_students_shared_objects_clean(tmpdir):
+    with tmpdir.as_cwd():
+        make_remotes('student1', 'student2')
+        url = 'file://' + os.path.abspath('remotes')
+        os.makedirs('students')
+        os.chdir('students')
+
+        results = sync_students(['student1', 'student2'], url,
+                                do_clean=False, do_clone=True, do_pull=True,
+                                shared_objects=True, concurrency=2, no_progress_bar=True)
+        assert all(not result.error for result in results)
+        assert borrows_objects('student1') and borrows_objects('student2')
+
+        results = sync_students(['student1', 'student2'], url,
+                                do_clean=True, do_clone=True, do_pull=True,
+                                shared_objects=True, concurrency=2, no_progress_bar=True)
+
+        # The reference repository survives the reclone, and the new clones borrow from it again
+        assert all(not result.error for result in results)
+        assert os.path.isdir(REFERENCE_REPO)
+        assert borrows_objects('student1') and borrows_objects('student2')
+        assert os.path.exists(os.path.join('student2', 'README.md'))
@@ -0,0 +1,99 @@
+import os
+
+from stograde.student import sync_students
+from stograde.student.sync_strategy import SyncStrategy
+from stograde.student.remote_heads import find_up_to_date, local_master
+from test.student.test_sync import make_remote, push_change
+from test.utils import git
+
+
+def clone_students(*names: str):
+    for name in names:
+        make_remote(name)
+        git('clone', '--quiet', os.path.join('remotes', name + '.git'), os.path.join('students', name))
+
+
+def test_find_up_to_date(tmpdir):
+    with tmpdir.as_cwd():
+        clone_students('student1', 'student2')
+        push_change('student2', 'file2')
+
+        os.chdir('students')
+        assert find_up_to_date(['student1', 'student2', 'missing'], concurrency=2) == {'student1'}
+
+
+def test_find_up_to_date_local_changes(tmpdir):
+    with tmpdir.as_cwd():
+        clone_students('student1', 'student2')
+
+        os.chdir('students')
+        with open(os.path.join('student1', 'file1'), 'w') as outfile:
+            outfile.write('local change')
+
+        # student1's master still matches the remote, but its changes have to be cleared before grading
+        assert find_up_to_date(['student1', 'student2'], concurrency=2) == {'student2'}
+
+
+def test_sync_students_clears_local_changes_when_up_to_date(tmpdir, capsys):
+    with tmpdir.as_cwd():
+        clone_students('student1', 'student2')
+
+        os.chdir('students')
+        for student in ['student1', 'student2']:
+            with open(os.path.join(student, 'file1'), 'w') as outfile:
+                outfile.write('local change')
+
+        sync_students(['student1'], 'file://' + os.path.abspath('../remotes'),
+                      do_clean=False, do_clone=True, do_pull=True,
+                      concurrency=1, no_progress_bar=True)
+        sync_students(['student2'], 'file://' + os.path.abspath('../remotes'),
+                      do_clean=False, do_clone=True, do_pull=True, sync_strategy=SyncStrategy.RESET,
+                      concurrency=1, no_progress_bar=True)
+
+        for student in ['student1', 'student2']:
+            with open(os.path.join(student, 'file1')) as infile:
+                assert infile.read() == ''
+
+    _, err = capsys.readouterr()
+    assert 'Discarded local changes to file1 in student2' in err
+
+
+def test_find_up_to_date_detached_head(tmpdir):
+    with tmpdir.as_cwd():
+        clone_students('student1')
+
+        os.chdir('students')
+        git('-C', 'student1', 'checkout', '--quiet', '--detach')
+
+        assert local_master('student1') == ''
+        assert find_up_to_date(['student1'], concurrency=1) == set()
+
+
+def test_local_master_packed(tmpdir):
+    with tmpdir.as_cwd():
+        clone_students('student1')
+
+        os.chdir('students')
+        loose = local_master('student1')
+        git('-C', 'student1', 'pack-refs', '--all')
+
+        assert not os.path.exists(os.path.join('student1', '.git', 'refs', 'heads', 'master'))
+        assert loose
+        assert local_master('student1') == loose
+
+
+def test_sync_students_skips_up_to_date(tmpdir, capsys):
+    with tmpdir.as_cwd():
+        clone_students('student1', 'student2')
+        push_change('student2', 'file2')
+
+        os.chdir('students')
+        results = sync_students(['student1', 'student2'], 'file://' + os.path.abspath('../remotes'),
+                                do_clean=False, do_clone=True, do_pull=True,
+                                concurrency=2, no_progress_bar=True)
+
+        assert all(not result.error for result in results)
+        assert os.path.exists(os.path.join('student2', 'file2'))
+
+    out, _ = capsys.readouterr()
+    assert '1 of 2 repositories are already up to date' in out
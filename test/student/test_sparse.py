@@ -0,0 +1,70 @@
+import os
+
+from stograde.student import clone_student
+from stograde.student.sparse import missing_sparse_folders, sparse_checkout_folders, widen_sparse_checkout
+from test.utils import git, touch
+
+
+def make_remote():
+    """Create remotes/student1.git with an hw1 and an hw2 folder"""
+    git('init', os.path.join('work', 'student1'))
+    with open(os.path.join('work', 'student1', 'README.md'), 'w') as outfile:
+        outfile.write('readme')
+    for folder in ['hw1', 'hw2']:
+        os.makedirs(os.path.join('work', 'student1', folder))
+        touch(os.path.join('work', 'student1', folder, 'file.cpp'))
+    git('-C', os.path.join('work', 'student1'), 'add', '.')
+    git('-C', os.path.join('work', 'student1'), '-c', 'user.email=an_email@email_provider.com',
+        '-c', 'user.name=Some Random Name', 'commit', '-m', 'initial')
+    git('clone', '--bare', os.path.join('work', 'student1'), os.path.join('remotes', 'student1.git'))
+    git('-C', os.path.join('remotes', 'student1.git'), 'config', 'uploadpack.allowFilter', 'true')
+
+
+def test_clone_student_sparse(tmpdir):
+    with tmpdir.as_cwd():
+        make_remote()
+        clone_student('student1', 'file://' + os.path.abspath('remotes'), sparse=True, folders=['hw1'])
+
+        assert os.path.exists(os.path.join('student1', 'README.md'))
+        assert os.path.exists(os.path.join('student1', 'hw1', 'file.cpp'))
+        assert not os.path.exists(os.path.join('student1', 'hw2'))
+        assert sparse_checkout_folders('student1') == {'hw1'}
+
+
+def test_widen_sparse_checkout(tmpdir):
+    with tmpdir.as_cwd():
+        make_remote()
+        clone_student('student1', 'file://' + os.path.abspath('remotes'), sparse=True, folders=['hw1'])
+
+        assert missing_sparse_folders('student1', ['hw1', 'hw2']) == ['hw2']
+
+        widen_sparse_checkout('student1', ['hw1', 'hw2'])
+
+        assert os.path.exists(os.path.join('student1', 'hw1', 'file.cpp'))
+        assert os.path.exists(os.path.join('student1', 'hw2', 'file.cpp'))
+        assert sparse_checkout_folders('student1') == {'hw1', 'hw2'}
+
+
+def test_sparse_checkout_folders_full_clone(tmpdir):
+    with tmpdir.as_cwd():
+        make_remote()
+        clone_student('student1', 'file://' + os.path.abspath('remotes'))
+
+        assert sparse_checkout_folders('student1') is None
+        assert missing_sparse_folders('student1', ['hw1']) == []
+
+
+def test_sparse_checkout_folders_nested(tmpdir):
+    with tmpdir.as_cwd():
+        git('init', 'student1')
+        git('-C', 'student1', 'sparse-checkout', 'init', '--cone')
+        git('-C', 'student1', 'sparse-checkout', 'set', 'labs/lab1', 'hw1')
+
+        # "labs" is only listed so that "labs/lab1" can be included
+        assert sparse_checkout_folders('student1') == {'hw1', 'labs/lab1'}
+        assert missing_sparse_folders('student1', ['labs', 'hw1']) == ['labs']
+
+
+def test_sparse_checkout_folders_missing_repo(tmpdir):
+    with tmpdir.as_cwd():
+        assert sparse_checkout_folders('student1') is None
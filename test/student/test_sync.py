@@ -0,0 +1,137 @@
+import os
+
+from stograde.student import sync_students
+from stograde.student.sync_strategy import SyncStrategy
+from test.utils import git, touch
+
+
+def make_remote(name: str):
+    """Create a repository to clone from in remotes/name.git"""
+    git('init', os.path.join('work', name))
+    git('-C', os.path.join('work', name), 'config', 'user.email', 'an_email@email_provider.com')
+    git('-C', os.path.join('work', name), 'config', 'user.name', 'Some Random Name')
+    touch(os.path.join('work', name, 'file1'))
+    git('-C', os.path.join('work', name), 'add', 'file1')
+    git('-C', os.path.join('work', name), 'commit', '-m', 'initial')
+    git('clone', '--bare', os.path.join('work', name), os.path.join('remotes', name + '.git'))
+
+
+def push_change(name: str, file_name: str):
+    touch(os.path.join('work', name, file_name))
+    git('-C', os.path.join('work', name), 'add', file_name)
+    git('-C', os.path.join('work', name), 'commit', '-m', 'another')
+    git('-C', os.path.join('work', name), 'push', '--quiet', os.path.abspath(os.path.join('remotes', name + '.git')),
+        'master')
+
+
+def test_sync_students_clone_and_pull(tmpdir):
+    with tmpdir.as_cwd():
+        make_remote('student1')
+        make_remote('student2')
+        url = 'file://' + os.path.abspath('remotes')
+
+        os.makedirs('students')
+        os.chdir('students')
+
+        results = sync_students(['student1', 'student2'], url,
+                                do_clean=False, do_clone=True, do_pull=True,
+                                concurrency=4, no_progress_bar=True)
+
+        assert sorted(r.student for r in results) == ['student1', 'student2']
+        assert all(not r.error for r in results)
+        assert os.path.exists(os.path.join('student1', 'file1'))
+        assert os.path.exists(os.path.join('student2', 'file1'))
+
+        os.chdir('..')
+        push_change('student1', 'file2')
+        os.chdir('students')
+
+        sync_students(['student1'], url,
+                      do_clean=False, do_clone=True, do_pull=True,
+                      concurrency=4, no_progress_bar=True)
+
+        assert os.path.exists(os.path.join('student1', 'file2'))
+
+
+def test_sync_students_clean(tmpdir):
+    with tmpdir.as_cwd():
+        make_remote('student1')
+        url = 'file://' + os.path.abspath('remotes')
+
+        os.makedirs(os.path.join('students', 'student1'))
+        touch(os.path.join('students', 'student1', 'junk'))
+        os.chdir('students')
+
+        results = sync_students(['student1'], url,
+                                do_clean=True, do_clone=True, do_pull=False,
+                                concurrency=1, no_progress_bar=True)
+
+        assert results[0].error == ''
+        assert os.path.exists(os.path.join('student1', 'file1'))
+        assert not os.path.exists(os.path.join('student1', 'junk'))
+
+
+def test_sync_students_reports_errors(tmpdir, capsys):
+    with tmpdir.as_cwd():
+        url = 'file://' + os.path.abspath('remotes')
+
+        results = sync_students(['nobody'], url,
+                                do_clean=False, do_clone=True, do_pull=True,
+                                concurrency=1, no_progress_bar=True)
+
+    assert results[0].student == 'nobody'
+    assert results[0].error.startswith('Could not clone {}/nobody.git'.format(url))
+
+    _, err = capsys.readouterr()
+    assert 'Could not clone {}/nobody.git'.format(url) in err
+
+
+def test_sync_students_sparse(tmpdir):
+    with tmpdir.as_cwd():
+        make_remote('student1')
+        os.makedirs(os.path.join('work', 'student1', 'hw1'))
+        os.makedirs(os.path.join('work', 'student1', 'hw2'))
+        push_change('student1', os.path.join('hw1', 'file.cpp'))
+        push_change('student1', os.path.join('hw2', 'file.cpp'))
+        url = 'file://' + os.path.abspath('remotes')
+
+        os.makedirs('students')
+        os.chdir('students')
+
+        results = sync_students(['student1'], url,
+                                do_clean=False, do_clone=True, do_pull=True,
+                                sparse=True, concurrency=1, no_progress_bar=True)
+
+        assert results[0].error == ''
+        assert os.path.exists(os.path.join('student1', 'file1'))
+        assert not os.path.exists(os.path.join('student1', 'hw1'))
+        assert not os.path.exists(os.path.join('student1', 'hw2'))
+
+
+def test_sync_students_reset_strategy(tmpdir, capsys):
+    with tmpdir.as_cwd():
+        make_remote('student1')
+        url = 'file://' + os.path.abspath('remotes')
+
+        os.makedirs('students')
+        os.chdir('students')
+        sync_students(['student1'], url,
+                      do_clean=False, do_clone=True, do_pull=False,
+                      concurrency=1, no_progress_bar=True)
+
+        with open(os.path.join('student1', 'file1'), 'w') as outfile:
+            outfile.write('local change')
+
+        os.chdir('..')
+        push_change('student1', 'file2')
+        os.chdir('students')
+
+        results = sync_students(['student1'], url,
+                                do_clean=False, do_clone=True, do_pull=True,
+                                sync_strategy=SyncStrategy.RESET, concurrency=1, no_progress_bar=True)
+
+        assert results[0].error == ''
+        assert os.path.exists(os.path.join('student1', 'file2'))
+
+    _, err = capsys.readouterr()
+    assert 'Discarded local changes to file1 in student1' in err
@@ -0,0 +1,85 @@
+import os
+from unittest import mock
+
+from stograde.common import chdir
+from stograde.student.worktree import dated_worktree, student_checkout
+from test.utils import git, touch
+
+
+def make_student():
+    os.makedirs('student')
+    with chdir('student'):
+        git('init')
+        git('config', 'user.email', 'an_email@email_provider.com')
+        git('config', 'user.name', 'Some Random Name')
+
+        touch('a_file.txt')
+        git('add', 'a_file.txt')
+        with mock.patch.dict(os.environ, {'GIT_COMMITTER_DATE': 'Tue Apr 21 12:28:03 2020 -0500'}):
+            git('commit', '-m', '"Add file"')
+
+        touch('b_file.txt')
+        git('add', 'b_file.txt')
+        with mock.patch.dict(os.environ, {'GIT_COMMITTER_DATE': 'Sat Apr 25 20:27:05 2020 -0500'}):
+            git('commit', '-m', '"Add another file"')
+
+
+def test_dated_worktree(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+
+        with dated_worktree('student', 'Apr 23 2020') as path:
+            assert os.path.exists(os.path.join(path, 'a_file.txt'))
+            assert not os.path.exists(os.path.join(path, 'b_file.txt'))
+
+            # The student's own checkout is untouched
+            assert os.path.exists(os.path.join('student', 'b_file.txt'))
+            _, head, _ = git('-C', 'student', 'symbolic-ref', 'HEAD')
+            assert head.strip() == 'refs/heads/master'
+
+        assert not os.path.exists(path)
+        _, worktrees, _ = git('-C', 'student', 'worktree', 'list', '--porcelain')
+        assert worktrees.count('worktree ') == 1
+
+
+def test_dated_worktree_overlapping(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+
+        with dated_worktree('student', 'Apr 23 2020') as first:
+            with dated_worktree('student', 'Apr 30 2020') as second:
+                assert not os.path.exists(os.path.join(first, 'b_file.txt'))
+                assert os.path.exists(os.path.join(second, 'b_file.txt'))
+
+
+def test_dated_worktree_left_by_killed_run(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+
+        # A run that is killed never leaves the with block, so its worktree is never removed
+        leftover = dated_worktree('student', 'Apr 23 2020')
+        path = leftover.__enter__()
+        touch(os.path.join(path, 'stale.txt'))
+
+        with dated_worktree('student', 'Apr 23 2020') as again:
+            assert again == path
+            assert os.path.exists(os.path.join(again, 'a_file.txt'))
+            assert not os.path.exists(os.path.join(again, 'stale.txt'))
+
+        _, worktrees, _ = git('-C', 'student', 'worktree', 'list', '--porcelain')
+        assert worktrees.count('worktree ') == 1
+
+
+def test_dated_worktree_before_first_commit(tmpdir):
+    with tmpdir.as_cwd():
+        make_student()
+
+        with dated_worktree('student', 'Jan 1 2000') as path:
+            assert os.listdir(path) == []
+
+        assert not os.path.exists(path)
+
+
+def test_student_checkout_no_date():
+    with student_checkout('student', '') as path:
+        assert path == ''
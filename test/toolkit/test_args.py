@@ -112,6 +112,28 @@ def test_process_args_repo():
     assert not assignments
 
 
+def test_process_args_repo_has_no_workers(capsys):
+    # Repository commands only take --sync-workers, so --workers would be silently ignored
+    args = [sys.argv[0]] + ['repo', 'update', '--student', 'student9', '--workers', '4']
+
+    with mock.patch('sys.argv', args):
+        with pytest.raises(SystemExit):
+            process_args()
+
+    _, err = capsys.readouterr()
+    assert 'unrecognized arguments: --workers 4' in err
+
+
+def test_process_args_record_workers():
+    args = [sys.argv[0]] + ['record', 'hw1', '--student', 'student9', '--workers', '4', '--engine', 'thread']
+
+    with mock.patch('sys.argv', args):
+        parsed, _, _ = process_args()
+
+    assert parsed['workers'] == 4
+    assert parsed['engine'] == 'thread'
+
+
 def test_no_sub_command(capsys):
     try:
         with mock.patch('sys.argv', [sys.argv[0]]):
@@ -49,3 +49,18 @@ def test_needs_update_check(datafiles):
             assert c.needs_update_check()
             c.set_last_update_check()
             assert not c.needs_update_check()
+
+
+@pytest.mark.datafiles(os.path.join(_dir, 'fixtures', 'config'))
+def test_get_spec_update_interval(datafiles):
+    with chdir(str(datafiles)):
+        with mock.patch('stograde.toolkit.config.Config._filename', 'stograde.ini'):
+            c = Config()
+            assert c.get_spec_update_interval() == datetime.timedelta(minutes=15)
+
+            # Every Config shares one parser, so don't leave the setting behind for other tests
+            try:
+                c._config.set('general', 'spec_update_interval', '60')
+                assert c.get_spec_update_interval() == datetime.timedelta(hours=1)
+            finally:
+                c._config.remove_option('general', 'spec_update_interval')
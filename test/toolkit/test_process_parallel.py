@@ -1,6 +1,7 @@
 import functools
 import logging
 
+from stograde.toolkit.engine import Engine
 from stograde.toolkit.process_parallel import process_parallel
 
 
@@ -19,3 +20,16 @@ def test_process_parallel_single_thread(caplog):
     log_messages = {(log.msg, log.levelname) for log in caplog.records}
     assert log_messages == {('Processing student1', 'DEBUG'),
                             ('a_function: student1', 'INFO')}
+
+
+def test_process_parallel_threads():
+    seen = []
+    operation = functools.partial(seen.append)
+    process_parallel(['student1', 'student2', 'student3'],
+                     no_progress_bar=True,
+                     workers=2,
+                     operation=operation,
+                     engine=Engine.THREAD)
+
+    # The threads share this process's memory, so they can all add to the same list
+    assert sorted(seen) == ['student1', 'student2', 'student3']
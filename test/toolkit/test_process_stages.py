@@ -0,0 +1,105 @@
+import multiprocessing
+import threading
+import time
+
+from stograde.process_assignment.record_result import RecordResult
+from stograde.specs.spec import Spec
+from stograde.student.assignment_task import AssignmentTask
+from stograde.student.student_result import StudentResult
+from stograde.toolkit.engine import Engine
+from stograde.toolkit.process_stages import sync_then_grade
+
+SPECS = [Spec('hw1', 'hw1', None), Spec('hw2', 'hw2', None)]
+
+
+def stages(students, prepare, grade, order=(), workers=2, engine=Engine.THREAD):
+    return sync_then_grade(students,
+                           specs=SPECS,
+                           prepare=prepare,
+                           grade=grade,
+                           order=list(order),
+                           engine=engine,
+                           no_progress_bar=True,
+                           sync_workers=4,
+                           workers=workers)
+
+
+def graded(task: AssignmentTask) -> RecordResult:
+    return RecordResult(task.spec.id, task.student)
+
+
+def test_sync_then_grade():
+    prepared, results = stages(['student1', 'student2'], StudentResult, graded)
+
+    assert sorted(student.name for student in prepared) == ['student1', 'student2']
+    assert sorted('{}/{}'.format(result.student, result.spec_id) for result in results) == \
+        ['student1/hw1', 'student1/hw2', 'student2/hw1', 'student2/hw2']
+
+
+def test_sync_then_grade_skips_errors():
+    def prepare(student):
+        return StudentResult(student, error='could not clone' if student == 'broken' else '')
+
+    prepared, results = stages(['broken', 'student1'], prepare, graded)
+
+    assert len(prepared) == 2
+    assert {result.student for result in results} == {'student1'}
+
+
+def test_sync_then_grade_starts_ready_students_early():
+    slow_synced = threading.Event()
+    graded_before_slow_synced = []
+
+    def prepare(student):
+        if student == 'slow':
+            time.sleep(0.5)
+            slow_synced.set()
+        return StudentResult(student)
+
+    def grade(task):
+        if task.student == 'fast':
+            graded_before_slow_synced.append(not slow_synced.is_set())
+        return graded(task)
+
+    stages(['slow', 'fast'], prepare, grade)
+
+    assert graded_before_slow_synced == [True, True]
+
+
+def test_sync_then_grade_order():
+    grading_started = threading.Event()
+    started = []
+
+    def prepare(student):
+        if student != 'first':
+            grading_started.wait(timeout=5)
+        return StudentResult(student)
+
+    def grade(task):
+        started.append(str(task))
+        if not grading_started.is_set():
+            grading_started.set()
+            # Give the other students time to be ready, so that they compete for the only grading worker
+            time.sleep(0.3)
+        return graded(task)
+
+    order = [AssignmentTask('b', SPECS[1]), AssignmentTask('a', SPECS[0]),
+             AssignmentTask('b', SPECS[0]), AssignmentTask('a', SPECS[1])]
+    stages(['first', 'a', 'b'], prepare, grade, order=order, workers=1)
+
+    # The tasks that aren't in `order` go last, once they are no longer the only ones that are ready
+    assert started == ['first/hw1', 'b/hw2', 'a/hw1', 'b/hw1', 'a/hw2', 'first/hw2']
+
+
+def test_sync_then_grade_forks_before_syncing():
+    workers_while_syncing = []
+
+    def prepare(student):
+        workers_while_syncing.append(len(multiprocessing.active_children()))
+        return StudentResult(student)
+
+    prepared, results = stages(['student1', 'student2'], prepare, graded, workers=3, engine=Engine.PROCESS)
+
+    # Every grading worker was already running before the first repository was synced
+    assert workers_while_syncing == [3, 3]
+    assert len(results) == 4
@@ -0,0 +1,78 @@
+from unittest import mock
+
+from stograde.process_assignment.record_result import RecordResult
+from stograde.specs.spec import Spec
+from stograde.student.student_result import StudentResult
+from stograde.student.sync_strategy import SyncStrategy
+from stograde.toolkit.engine import Engine
+from stograde.toolkit.process_students import by_assignment, process_students
+
+SPECS = [Spec('hw1', 'hw1', None), Spec('hw2', 'hw2', None)]
+
+
+def record(students, **kwargs):
+    return process_students(specs=SPECS,
+                            students=students,
+                            analyze=False,
+                            base_dir='',
+                            clean=False,
+                            date='',
+                            engine=Engine.THREAD,
+                            interact=False,
+                            no_progress_bar=True,
+                            record=True,
+                            skip_branch_check=False,
+                            skip_repo_update=True,
+                            skip_web_compile=False,
+                            stogit_url='',
+                            sync_strategy=SyncStrategy.PULL,
+                            sync_workers=1,
+                            work_dir='.',
+                            **kwargs)
+
+
+def test_by_assignment():
+    assert by_assignment(SPECS, date='', from_git=False, interact=False)
+    assert not by_assignment(SPECS, date='2020-01-01', from_git=False, interact=False)
+    assert not by_assignment(SPECS, date='', from_git=True, interact=False)
+    assert not by_assignment(SPECS, date='', from_git=False, interact=True)
+    assert not by_assignment([Spec('hw1', 'hw1', None), Spec('hw1-extra', 'hw1', None)],
+                             date='', from_git=False, interact=False)
+
+
+def prepared(student, **kwargs):
+    if student == 'broken':
+        return StudentResult(student, error='could not clone')
+    return StudentResult(student, unmerged_branches=['a-branch'])
+
+
+def graded(task, **kwargs):
+    return RecordResult(task.spec.id, task.student, first_submission='{}/{}'.format(task.student, task.spec.id))
+
+
+@mock.patch('stograde.toolkit.process_students.grade_assignment', side_effect=graded)
+@mock.patch('stograde.toolkit.process_students.prepare_for_recording', side_effect=prepared)
+def test_process_students_by_assignment(mock_prepare, mock_grade, tmpdir):
+    with tmpdir.as_cwd():
+        results = record(['student1', 'broken', 'student2'], workers=4)
+
+    assert mock_prepare.call_count == 3
+    assert mock_grade.call_count == 4
+
+    by_name = {student.name: student for student in results}
+    assert by_name['broken'].error == 'could not clone'
+    assert by_name['broken'].results == []
+    for name in ['student1', 'student2']:
+        assert [result.first_submission for result in by_name[name].results] == [name + '/hw1', name + '/hw2']
+        assert all(result.warnings.unmerged_branches == ['a-branch'] for result in by_name[name].results)
+
+
+@mock.patch('stograde.toolkit.process_students.process_student',
+            side_effect=lambda student, **kwargs: StudentResult(student))
+@mock.patch('stograde.toolkit.process_students.prepare_for_recording')
+def test_process_students_one_worker(mock_prepare, mock_process, tmpdir):
+    with tmpdir.as_cwd():
+        record(['student1', 'student2'], workers=1)
+
+    assert not mock_prepare.called
+    assert mock_process.call_count == 2
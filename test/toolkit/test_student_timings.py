@@ -0,0 +1,86 @@
+import os
+
+from stograde.process_assignment.record_result import RecordResult
+from stograde.specs.spec import Spec
+from stograde.student.assignment_task import AssignmentTask
+from stograde.student.student_result import StudentResult
+from stograde.toolkit import student_timings
+from stograde.toolkit.student_timings import estimate_durations, load_timings, order_longest_first, \
+    order_tasks_longest_first, save_timings
+
+
+def make_repo(name: str, size: int):
+    os.makedirs(name)
+    with open(os.path.join(name, 'file.txt'), 'w') as outfile:
+        outfile.write('x' * size)
+
+
+def test_save_and_load_timings(tmpdir):
+    course = str(tmpdir.join('sd'))
+    assert load_timings(course) == {}
+
+    results = [StudentResult('rives', results=[RecordResult('hw1', 'rives', duration=1.5),
+                                               RecordResult('hw2', 'rives')])]
+    save_timings(course, {'other': {'hw1': 2.0}}, results)
+
+    assert load_timings(course) == {'other': {'hw1': 2.0}, 'rives': {'hw1': 1.5}}
+
+
+def test_timings_kept_per_course(tmpdir):
+    # The same username and assignment in another course is another student's work
+    for course, duration in [('sd', 1.5), ('ads', 9.0)]:
+        results = [StudentResult('rives', results=[RecordResult('hw1', 'rives', duration=duration)])]
+        save_timings(str(tmpdir.join(course)), {}, results)
+
+    assert load_timings(str(tmpdir.join('sd'))) == {'rives': {'hw1': 1.5}}
+    assert load_timings(str(tmpdir.join('ads'))) == {'rives': {'hw1': 9.0}}
+
+
+def test_load_timings_other_version(tmpdir):
+    with open(student_timings.TIMINGS_PATH, 'w') as outfile:
+        outfile.write('{"version": 1, "students": {"rives": {"hw1": 1.0}}}')
+
+    assert load_timings(str(tmpdir)) == {}
+
+
+def test_estimate_durations_from_history():
+    timings = {'slow': {'hw1': 10.0, 'hw2': 5.0}, 'fast': {'hw1': 1.0}}
+
+    assert estimate_durations(['slow', 'fast'], ['hw1', 'hw2'], timings) == {'slow': 15.0, 'fast': 1.0}
+
+
+def test_estimate_durations_from_size(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo('known', 100)
+        make_repo('big', 300)
+        make_repo('small', 50)
+
+        estimates = estimate_durations(['known', 'big', 'small', 'not-cloned'], ['hw1'], {'known': {'hw1': 2.0}})
+
+    assert estimates == {'known': 2.0, 'big': 6.0, 'small': 1.0, 'not-cloned': 0.0}
+
+
+def test_order_longest_first(tmpdir):
+    with tmpdir.as_cwd():
+        make_repo('big', 300)
+        make_repo('small', 50)
+        make_repo('medium', 100)
+
+        assert order_longest_first(['medium', 'big', 'small'], ['hw1'], {}) == ['big', 'medium', 'small']
+        # At 1 second for every 100 bytes, 'big' takes 3 seconds and 'small' takes half a second
+        timings = {'medium': {'hw1': 1.0}}
+        assert order_longest_first(['medium', 'big', 'small'], ['hw1'], timings) == ['big', 'medium', 'small']
+        timings = {'medium': {'hw1': 1.0}, 'small': {'hw1': 5.0}, 'big': {'hw1': 2.0}}
+        assert order_longest_first(['medium', 'big', 'small'], ['hw1'], timings) == ['small', 'big', 'medium']
+
+
+def test_order_tasks_longest_first(tmpdir):
+    hw1 = Spec('hw1', 'hw1', None)
+    hw2 = Spec('hw2', 'hw2', None)
+    tasks = [AssignmentTask('a', hw1), AssignmentTask('a', hw2), AssignmentTask('b', hw1), AssignmentTask('b', hw2)]
+    timings = {'a': {'hw1': 1.0, 'hw2': 8.0}, 'b': {'hw1': 4.0, 'hw2': 2.0}}
+
+    with tmpdir.as_cwd():
+        ordered = order_tasks_longest_first(tasks, timings)
+
+    assert [str(task) for task in ordered] == ['a/hw2', 'b/hw1', 'b/hw2', 'a/hw1']
@@ -0,0 +1,73 @@
+import functools
+import os
+from unittest import mock
+
+from stograde.toolkit import worker_pool
+from stograde.toolkit.engine import Engine
+from stograde.toolkit.worker_pool import install_operation, run_installed, run_operation, SpooledResult, WorkerPool
+
+
+def greet(name: str, *, greeting: str) -> str:
+    return '{}, {}'.format(greeting, name)
+
+
+def repeat(name: str) -> str:
+    return name * (worker_pool.SPOOL_THRESHOLD + 1)
+
+
+def test_worker_pool_processes():
+    with WorkerPool(functools.partial(greet, greeting='hi'), engine=Engine.PROCESS, workers=2) as pool:
+        futures = [pool.submit(name) for name in ['student1', 'student2']]
+        assert [pool.result(future) for future in futures] == ['hi, student1', 'hi, student2']
+
+
+def test_worker_pool_processes_without_fork():
+    # Where workers aren't forked, they don't inherit the operation, so each task carries it
+    with mock.patch('multiprocessing.get_start_method', return_value='spawn'), \
+            mock.patch('stograde.toolkit.worker_pool.run_installed') as run_installed_mock:
+        with WorkerPool(functools.partial(greet, greeting='hi'), engine=Engine.PROCESS, workers=2) as pool:
+            assert not pool.inherited
+            assert pool.result(pool.submit('student1')) == 'hi, student1'
+
+    run_installed_mock.assert_not_called()
+
+
+def test_worker_pool_installs_operation_while_open():
+    operation = functools.partial(greet, greeting='hi')
+    with WorkerPool(operation, engine=Engine.PROCESS, workers=1):
+        assert worker_pool._operation is operation
+
+    assert worker_pool._operation is None
+
+
+def test_worker_pool_threads():
+    seen = []
+    with WorkerPool(seen.append, engine=Engine.THREAD, workers=2) as pool:
+        for future in [pool.submit(name) for name in ['student1', 'student2']]:
+            pool.result(future)
+
+    # The operation is shared with the threads, not copied to them
+    assert sorted(seen) == ['student1', 'student2']
+
+
+def test_worker_pool_spools_large_results():
+    with WorkerPool(repeat, engine=Engine.PROCESS, workers=1) as pool:
+        spool_dir = pool.spool_dir
+        assert pool.result(pool.submit('a')) == 'a' * (worker_pool.SPOOL_THRESHOLD + 1)
+        assert os.listdir(spool_dir) == []
+
+    assert not os.path.exists(spool_dir)
+
+
+def test_run_installed(tmpdir):
+    try:
+        install_operation(repeat, str(tmpdir))
+        spooled = run_installed('a')
+        assert isinstance(spooled, SpooledResult)
+        assert os.path.dirname(spooled.path) == str(tmpdir)
+
+        install_operation(functools.partial(greet, greeting='hi'), str(tmpdir))
+        assert run_installed('student1') == 'hi, student1'
+        assert run_operation(functools.partial(greet, greeting='hello'), None, 'student1') == 'hello, student1'
+    finally:
+        install_operation(None, None)
@@ -1,4 +1,5 @@
 import re
+import time
 
 from stograde.common import run
 from stograde.toolkit.progress_bar import CHAR
@@ -12,6 +13,21 @@ def touch(file):
     return run(['touch', file])
 
 
+def process_alive(pid: int, grace: float = 1) -> bool:
+    """Check whether a process is still running, giving it `grace` seconds to finish dying"""
+    deadline = time.monotonic() + grace
+    while True:
+        try:
+            with open('/proc/{}/stat'.format(pid)) as stat:
+                # A killed process that nobody has waited for yet is a zombie, which is as good as gone
+                running = stat.read().split(')')[-1].split()[0] != 'Z'
+        except FileNotFoundError:
+            running = False
+        if not running or time.monotonic() > deadline:
+            return running
+        time.sleep(0.01)
+
+
 def check_e2e_err_output(err: str):
     return re.compile(r"Could not get URL from data directory: "
                       r"Command '\['.*\]' returned non-zero exit status 1\.\r?\n"